@@ -0,0 +1,106 @@
+"""Benchmark: concurrent HeadObject through threads vs the asyncio client.
+
+Sends a batch of S3 HeadObject calls to a local stub that answers every
+request after a fixed latency, once from a thread pool sharing one
+regular client and once from a single event loop through
+botocore.aio.AsyncClient, with the same number of connections. Reports
+wall time per batch and calls per second.
+
+Usage:
+    python benchmarks/bench_async_client.py [--calls 500] [--connections 50] [--latency-ms 20] [--repeat 3]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+import botocore.session  # noqa: E402
+from botocore.aio import AsyncClient  # noqa: E402
+from botocore.config import Config  # noqa: E402
+
+
+class LatencyStub(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.send_header('ETag', '"object"')
+        self.end_headers()
+
+
+def make_client(endpoint, connections):
+    session = botocore.session.get_session()
+    return session.create_client(
+        's3', endpoint_url=endpoint, region_name='us-east-1',
+        aws_access_key_id='bench', aws_secret_access_key='bench',
+        config=Config(s3={'addressing_style': 'path'}, max_pool_connections=connections),
+    )
+
+
+def run_threads(client, calls, connections):
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        list(executor.map(lambda i: client.head_object(Bucket='bench', Key=f'k{i}'), range(calls)))
+
+
+async def run_async(client, calls):
+    await asyncio.gather(*(client.head_object(Bucket='bench', Key=f'k{i}') for i in range(calls)))
+
+
+def _timed(function):
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=500, help='HeadObject calls per batch')
+    parser.add_argument('--connections', type=int, default=50, help='Threads / pooled connections')
+    parser.add_argument('--latency-ms', type=float, default=20, help='Stub latency per request')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs, best is reported')
+    args = parser.parse_args()
+
+    LatencyStub.latency = args.latency_ms / 1000
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LatencyStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = make_client(f"http://127.0.0.1:{server.server_port}", args.connections)
+
+    best = {}
+    run_threads(client, args.connections, args.connections)
+    best['threads'] = min(
+        _timed(lambda: run_threads(client, args.calls, args.connections)) for _ in range(args.repeat)
+    )
+
+    async def timed_async():
+        async_client = AsyncClient(client)
+        await run_async(async_client, args.connections)
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            await run_async(async_client, args.calls)
+            timings.append(time.perf_counter() - started)
+        await async_client.close()
+        return min(timings)
+
+    best['asyncio'] = asyncio.run(timed_async())
+    for label, seconds in best.items():
+        print(f"{label:<8} {seconds * 1e3:8.1f} ms/batch   {args.calls / seconds:8.0f} calls/s")
+    print(f"asyncio / threads: {best['threads'] / best['asyncio']:.2f}x")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
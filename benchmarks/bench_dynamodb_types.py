@@ -0,0 +1,118 @@
+"""Microbenchmark: TypeSerializer/TypeDeserializer vs the compiled variants.
+
+Serializes and deserializes realistic processing-log items (the shape
+lambda_function writes for every record) and reports microseconds per item.
+Outputs are checked for equality before anything is timed.
+
+Usage:
+    python benchmarks/bench_dynamodb_types.py [--items 2000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+from boto3.dynamodb.types import (  # noqa: E402
+    Binary,
+    CompiledTypeDeserializer,
+    CompiledTypeSerializer,
+    TypeDeserializer,
+    TypeSerializer,
+)
+
+
+def processing_log_item(index):
+    """An item shaped like lambda_function.build_log_item output"""
+    key = f"uploads/2026/10/photo-{index:05d}.jpg"
+    return {
+        'processing_id': f"{index:064x}",
+        'timestamp': '2026-10-16T12:00:00.000000',
+        'bucket': 'p3-lambda-file-processor-uploads',
+        'file_key': key,
+        'file_info': {
+            'file_name': f"photo-{index:05d}.jpg",
+            'file_path': key,
+            'file_size': 2048 * 1024 + index,
+            'file_extension': '.jpg',
+            'mime_type': 'image/jpeg',
+            'last_modified': '2026-10-16T11:59:58+00:00',
+            'etag': 'd41d8cd98f00b204e9800998ecf8427e',
+        },
+        'processing_result': {
+            'file_name': f"photo-{index:05d}.jpg",
+            'processing_id': f"{index:064x}",
+            'processing_type': 'image',
+            'status': 'success',
+            'details': {
+                'message': 'Image file processed - 3 thumbnails created',
+                'file_size_mb': 2,
+                'format': 'JPEG',
+                'source_dimensions': [4032, 3024],
+                'thumbnails': [
+                    {'size': size, 'key': f"thumbnails/{size}/{key}", 'dimensions': [size, size * 3 // 4], 'bytes': size * 20}
+                    for size in (512, 256, 128)
+                ],
+                'timings': {'download_ms': 41, 'decode_ms': 18, 'resize_ms': 4, 'upload_ms': 37},
+                'memory': {'source_kb': 2048, 'decoded_kb': 576},
+                'detected_by': 'content',
+                'detected_format': 'JPEG',
+                'extension_mismatch': False,
+            },
+            'log_status': None,
+        },
+        'tags': {'thumbnail', 'image'},
+        'score': Decimal('0.75'),
+        'checksum': Binary(b'\x00\x01\x02\x03'),
+        'ttl': 1800000000 + index,
+    }
+
+
+def bench(label, func, items, repeat):
+    def run():
+        for item in items:
+            func(item)
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    per_item = best / len(items) * 1e6
+    print(f"{label:<48} {per_item:8.2f} us/item")
+    return per_item
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    items = [processing_log_item(i) for i in range(args.items)]
+    serializer, compiled = TypeSerializer(), CompiledTypeSerializer()
+    deserializer, compiled_deserializer = TypeDeserializer(), CompiledTypeDeserializer()
+
+    def baseline_item(item):
+        return {k: serializer.serialize(v) for k, v in item.items()}
+
+    def compiled_item(item):
+        return {k: compiled.serialize(v) for k, v in item.items()}
+
+    wire_items = [baseline_item(item) for item in items]
+    for item, wire in zip(items, wire_items):
+        assert compiled_item(item) == wire
+        assert compiled.serialize_item(item) == wire
+        assert compiled_deserializer.deserialize({'M': wire}) == deserializer.deserialize({'M': wire})
+
+    print(f"{args.items} processing-log items, best of {args.repeat}")
+    base = bench("TypeSerializer.serialize", baseline_item, items, args.repeat)
+    fast = bench("CompiledTypeSerializer.serialize", compiled_item, items, args.repeat)
+    shaped = bench("CompiledTypeSerializer.serialize_item", compiled.serialize_item, items, args.repeat)
+    print(f"  speedup: {base / fast:.2f}x (serialize), {base / shaped:.2f}x (serialize_item)")
+
+    base = bench("TypeDeserializer.deserialize", lambda w: deserializer.deserialize({'M': w}), wire_items, args.repeat)
+    fast = bench("CompiledTypeDeserializer.deserialize",
+                 lambda w: compiled_deserializer.deserialize({'M': w}), wire_items, args.repeat)
+    print(f"  speedup: {base / fast:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+"""Benchmark: lazily resolved shapes vs a frozen slot-based shape graph.
+
+Compares botocore's regular service models, which resolve a shape into a
+new Shape object on every reference and compute its attributes on first
+touch, with ServiceModel.freeze(), which resolves the shape graph of a set
+of operations ahead of time into shared, read-only __slots__ objects.
+For the operations the Lambda calls (S3 HeadObject, GetObject, PutObject
+and DynamoDB PutItem, DeleteItem, BatchWriteItem), it reports:
+
+* the shapes and memory of their model graph, resolved to the depth the
+  requests below reach (regular) vs frozen;
+* the lazy resolutions (shape objects created, cached properties
+  computed) during the first and later validate + serialize + parse of
+  each call;
+* the time of a single shape attribute read, and per call for both.
+
+Before any of that, every operation of the services is walked in both
+models, and their shapes must agree. The requests must also serialize and
+parse to identical results with both models.
+
+Usage:
+    python benchmarks/bench_frozen_model.py [--repeat 5] [--depth 8]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+import botocore.loaders  # noqa: E402
+import botocore.model  # noqa: E402
+import botocore.parsers  # noqa: E402
+import botocore.serialize  # noqa: E402
+import botocore.utils  # noqa: E402
+from boto3.dynamodb.types import TypeSerializer  # noqa: E402
+from botocore.model import ServiceModel  # noqa: E402
+
+OPERATIONS = {
+    's3': ['HeadObject', 'GetObject', 'PutObject'],
+    'dynamodb': ['PutItem', 'DeleteItem', 'BatchWriteItem'],
+}
+ATTRIBUTES = (
+    'name', 'type_name', 'documentation', 'serialization', 'metadata', 'required_members', 'event_stream_name',
+    'error_code', 'is_document_type', 'is_tagged_union', 'enum',
+)
+
+
+def lambda_calls():
+    serialize = TypeSerializer().serialize
+    item = {k: serialize(v) for k, v in {
+        'processing_id': 'uploads/2026/10/file-000042.jpg#3858f622', 'timestamp': '2026-10-16T09:41:27.123456',
+        'bucket': 'uploads', 'file_key': 'uploads/2026/10/file-000042.jpg', 'status': 'processed',
+        'file_info': {'size': 183842, 'content_type': 'image/jpeg', 'tags': ['a', 'b']}, 'ttl': 1794735687,
+    }.items()}
+    s3_headers = {
+        'x-amz-request-id': 'BENCH', 'etag': '"3858f62230ac3c915f300c664312c11f"', 'content-length': '183842',
+        'content-type': 'image/jpeg', 'last-modified': 'Fri, 16 Oct 2026 09:41:27 GMT',
+        'x-amz-meta-source-key': 'uploads/2026/10/file-000042.jpg', 'x-amz-server-side-encryption': 'AES256',
+    }
+    json_response = {'x-amzn-requestid': 'BENCH'}
+    return [
+        ('s3', 'HeadObject', {'Bucket': 'uploads', 'Key': 'uploads/2026/10/file-000042.jpg'}, s3_headers, b''),
+        ('s3', 'GetObject', {'Bucket': 'uploads', 'Key': 'uploads/2026/10/file-000042.jpg', 'Range': 'bytes=0-1023'},
+         s3_headers, b''),
+        ('s3', 'PutObject', {
+            'Bucket': 'thumbnails', 'Key': 'thumbnails/file-000042.jpg', 'Body': b'\xff\xd8' * 512,
+            'ContentType': 'image/jpeg', 'Metadata': {'source-key': 'uploads/2026/10/file-000042.jpg'},
+        }, s3_headers, b''),
+        ('dynamodb', 'PutItem', {'TableName': 'processing-log', 'Item': item}, json_response, b'{}'),
+        ('dynamodb', 'DeleteItem', {
+            'TableName': 'processing-log', 'Key': {'processing_id': item['processing_id']},
+            'ConditionExpression': '#s = :s', 'ExpressionAttributeNames': {'#s': 'status'},
+            'ExpressionAttributeValues': {':s': serialize('in_progress')},
+        }, json_response, b'{}'),
+        ('dynamodb', 'BatchWriteItem', {
+            'RequestItems': {'processing-log': [{'PutRequest': {'Item': item}}] * 25},
+        }, json_response, json.dumps({'UnprocessedItems': {}}).encode()),
+    ]
+
+
+def load_models():
+    loader = botocore.loaders.create_loader()
+    descriptions = {name: loader.load_service_model(name, 'service-2') for name in OPERATIONS}
+    return descriptions
+
+
+def describe(shape, depth):
+    # The attributes of a shape and of the shapes it refers to, down to
+    # ``depth`` levels.
+    described = {name: getattr(shape, name, None) for name in ATTRIBUTES}
+    if depth == 0:
+        return described
+    if hasattr(shape, 'members'):
+        described['members'] = {k: describe(v, depth - 1) for k, v in shape.members.items()}
+    for name in ('member', 'key', 'value'):
+        if hasattr(shape, name):
+            described[name] = describe(getattr(shape, name), depth - 1)
+    return described
+
+
+def check_models(descriptions, depth):
+    checked = 0
+    for service_name, description in descriptions.items():
+        regular, frozen = ServiceModel(description, service_name), ServiceModel(description, service_name)
+        frozen.freeze()
+        for operation_name in regular.operation_names:
+            for attribute in ('input_shape', 'output_shape'):
+                shapes = [getattr(m.operation_model(operation_name), attribute) for m in (regular, frozen)]
+                if shapes[0] is None:
+                    assert shapes[1] is None
+                    continue
+                assert type(shapes[1]).__mro__[2] is type(shapes[0]) or type(shapes[0]) is botocore.model.Shape
+                assert describe(shapes[0], depth) == describe(shapes[1], depth), (service_name, operation_name)
+                checked += 1
+        assert [s.name for s in regular.error_shapes] == [s.name for s in frozen.error_shapes]
+    return checked
+
+
+def regular_graph(service_model, operation_names, max_depth):
+    # Touches what a request walks: every reachable shape, recursive ones
+    # until they repeat on the path.
+    count = 0
+
+    def walk(shape, path):
+        nonlocal count
+        count += 1
+        shape.serialization, shape.metadata, shape.required_members
+        if shape.name in path or len(path) >= max_depth:
+            return
+        path = path | {shape.name}
+        if shape.type_name == 'structure':
+            shape.is_tagged_union, shape.is_document_type, shape.error_code, shape.event_stream_name
+            for member in shape.members.values():
+                walk(member, path)
+        elif shape.type_name == 'list':
+            walk(shape.member, path)
+        elif shape.type_name == 'map':
+            walk(shape.key, path)
+            walk(shape.value, path)
+        elif shape.type_name == 'string':
+            shape.enum
+
+    for operation_name in operation_names:
+        operation_model = service_model.operation_model(operation_name)
+        for shape in [operation_model.input_shape, operation_model.output_shape, *operation_model.error_shapes]:
+            if shape is not None:
+                walk(shape, frozenset())
+    return count
+
+
+def measure_graphs(descriptions, depth):
+    results = {}
+    for mode in ('regular', 'frozen'):
+        models = {}
+        tracemalloc.start()
+        for service_name, description in descriptions.items():
+            model = ServiceModel(description, service_name)
+            if mode == 'frozen':
+                model.freeze(OPERATIONS[service_name])
+                shapes = len({id(s) for _, s in model._shape_resolver._frozen_shapes.values()})
+            else:
+                shapes = regular_graph(model, OPERATIONS[service_name], depth)
+            models[service_name] = (model, shapes)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[mode] = (size, sum(shapes for _, shapes in models.values()))
+    return results
+
+
+class Counter:
+    """Counts shape resolutions and cached property computations"""
+
+    def __init__(self):
+        self.count = 0
+        get_shape_by_name = botocore.model.ShapeResolver.get_shape_by_name
+        cached_get = botocore.utils.CachedProperty.__get__
+
+        def counted_get_shape_by_name(resolver, *args, **kwargs):
+            self.count += 1
+            return get_shape_by_name(resolver, *args, **kwargs)
+
+        def counted_cached_get(prop, obj, cls):
+            if obj is not None and isinstance(obj, botocore.model.Shape):
+                self.count += 1
+            return cached_get(prop, obj, cls)
+
+        botocore.model.ShapeResolver.get_shape_by_name = counted_get_shape_by_name
+        botocore.utils.CachedProperty.__get__ = counted_cached_get
+        self._restore = (get_shape_by_name, cached_get)
+
+    def close(self):
+        botocore.model.ShapeResolver.get_shape_by_name, botocore.utils.CachedProperty.__get__ = self._restore
+
+
+def make_call(models, service_name, operation_name, params, headers, body):
+    model = models[service_name]
+    protocol = model.metadata['protocol']
+    serializer = botocore.serialize.create_serializer(protocol, True)
+    parser = botocore.parsers.create_parser(protocol)
+
+    def call():
+        operation_model = model.operation_model(operation_name)
+        request = serializer.serialize_to_request(params, operation_model)
+        response = {'status_code': 200, 'headers': headers, 'body': body}
+        return request, parser.parse(response, operation_model.output_shape)
+
+    return call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs, best is reported')
+    parser.add_argument('--depth', type=int, default=8, help='Shape levels compared and walked')
+    args = parser.parse_args()
+
+    descriptions = load_models()
+    print(f"model check: {check_models(descriptions, 4)} operation shapes agree")
+
+    graphs = measure_graphs(descriptions, args.depth)
+    for mode, (size, shapes) in graphs.items():
+        print(f"{mode:<8} graph of the Lambda operations: {shapes:6d} shape objects {size / 1024:8.0f} KiB")
+
+    modes = {}
+    for mode in ('regular', 'frozen'):
+        models = {name: ServiceModel(description, name) for name, description in descriptions.items()}
+        if mode == 'frozen':
+            for name, model in models.items():
+                model.freeze(OPERATIONS[name])
+        modes[mode] = models
+
+    shapes = {mode: models['dynamodb'].operation_model('PutItem').input_shape for mode, models in modes.items()}
+    for name in ('members', 'serialization', 'type_name'):
+        for shape in shapes.values():
+            getattr(shape, name)
+        best = {mode: min(timeit.repeat(f'shape.{name}', globals={'shape': shape}, repeat=args.repeat)) / 1e6
+                for mode, shape in shapes.items()}
+        print(f"shape.{name:<15} regular {best['regular'] * 1e9:5.1f} ns   frozen {best['frozen'] * 1e9:5.1f} ns")
+
+    for service_name, operation_name, params, headers, body in lambda_calls():
+        calls = {mode: make_call(models, service_name, operation_name, params, headers, body)
+                 for mode, models in modes.items()}
+        resolutions = {}
+        for mode, call in calls.items():
+            counter = Counter()
+            try:
+                first = call()
+                resolutions[mode] = [counter.count]
+                call()
+                resolutions[mode].append(counter.count - resolutions[mode][0])
+            finally:
+                counter.close()
+            calls[mode] = (call, first)
+        (regular_call, regular_result), (frozen_call, frozen_result) = calls.values()
+        assert regular_result[0]['body'] == frozen_result[0]['body'], operation_name
+        assert regular_result[0]['headers'] == frozen_result[0]['headers'], operation_name
+        assert regular_result[1] == frozen_result[1], operation_name
+        number = timeit.Timer(regular_call).autorange()[0]
+        best = {mode: min(timeit.repeat(call, repeat=args.repeat, number=number)) / number
+                for mode, (call, _) in calls.items()}
+        print(f"{operation_name:<15} lazy resolutions first/next call: regular {resolutions['regular'][0]:4d}/"
+              f"{resolutions['regular'][1]}  frozen {resolutions['frozen'][0]:2d}/{resolutions['frozen'][1]}   "
+              f"per call: regular {best['regular'] * 1e6:7.1f} us  frozen {best['frozen'] * 1e6:7.1f} us")
+
+
+if __name__ == '__main__':
+    main()
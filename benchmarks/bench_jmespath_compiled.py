@@ -0,0 +1,91 @@
+"""Microbenchmark: TreeInterpreter vs the ClosureCompiler on large inputs.
+
+Runs reporting-style expressions over a synthetic list_objects_v2 result
+and a DynamoDB scan of the processing log, once through the tree
+interpreter and once through compiled closures (Options(compiled=True)).
+Results are checked for equality before anything is timed.
+
+Usage:
+    python benchmarks/bench_jmespath_compiled.py [--objects 5000] [--items 5000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+import jmespath  # noqa: E402
+from jmespath.visitor import Options  # noqa: E402
+
+LIST_OBJECTS_EXPRESSIONS = [
+    'Contents[].Key',
+    'Contents[?Size > `1048576`].Key',
+    "Contents[?StorageClass == 'STANDARD' && Size < `4096`].[Key, Size]",
+    'sum(Contents[].Size)',
+    'sort_by(Contents, &Size)[-5:].Key',
+]
+SCAN_EXPRESSIONS = [
+    'Items[].processing_id.S',
+    "Items[?status.S == 'failed'].file_key.S",
+    "length(Items[?processing_type.S == 'image'])",
+    'Items[*].{id: processing_id.S, size: file_info.M.file_size.N}',
+    'max_by(Items, &timestamp.S).file_key.S',
+]
+
+
+def list_objects_page(count):
+    return {
+        'KeyCount': count,
+        'Contents': [
+            {
+                'Key': f"uploads/2026/10/file-{i:06d}.jpg",
+                'Size': (i * 7919) % (4 * 1024 * 1024),
+                'ETag': f'"{i:032x}"',
+                'StorageClass': 'STANDARD' if i % 5 else 'STANDARD_IA',
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def scan_page(count):
+    types = ['image', 'document', 'data', 'other']
+    return {
+        'Count': count,
+        'Items': [
+            {
+                'processing_id': {'S': f"{i:064x}"},
+                'timestamp': {'S': f"2026-10-16T12:{i // 60 % 60:02d}:{i % 60:02d}"},
+                'file_key': {'S': f"uploads/file-{i:06d}"},
+                'status': {'S': 'failed' if i % 17 == 0 else 'success'},
+                'processing_type': {'S': types[i % 4]},
+                'file_info': {'M': {'file_size': {'N': str(i * 31)}}},
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--objects', type=int, default=5000, help='Objects in the list_objects_v2 result')
+    parser.add_argument('--items', type=int, default=5000, help='Items in the scan result')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs, best is reported')
+    args = parser.parse_args()
+
+    compiled = Options(compiled=True)
+    cases = [(expression, list_objects_page(args.objects)) for expression in LIST_OBJECTS_EXPRESSIONS]
+    cases += [(expression, scan_page(args.items)) for expression in SCAN_EXPRESSIONS]
+    for expression, data in cases:
+        parsed = jmespath.compile(expression)
+        assert parsed.search(data) == parsed.search(data, compiled), expression
+
+        interpreted = min(timeit.repeat(lambda: parsed.search(data), repeat=args.repeat, number=3)) / 3
+        closures = min(timeit.repeat(lambda: parsed.search(data, compiled), repeat=args.repeat, number=3)) / 3
+        print(f"{expression:<70} tree {interpreted * 1e3:8.2f} ms   compiled {closures * 1e3:8.2f} ms   "
+              f"({interpreted / closures:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark: parsing a full ListObjectsV2 response, dateutil vs fast timestamps.
+
+Builds a ListObjectsV2 XML page (1000 objects by default, each with a
+LastModified timestamp) and parses it with botocore's rest-xml response
+parser, once with timestamps going straight to dateutil (what
+parse_timestamp did for every string before) and once with the default
+parse_timestamp, which matches the formats AWS sends before falling back
+to dateutil. Parsed pages are checked for equality before anything is
+timed. Also times parse_timestamp alone on both timestamp formats.
+
+Usage:
+    python benchmarks/bench_list_objects_parsing.py [--objects 1000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+import botocore.session  # noqa: E402
+from botocore.parsers import RestXMLParser  # noqa: E402
+from botocore.utils import _parse_timestamp_with_tzinfo, get_tzinfo_options, parse_timestamp  # noqa: E402
+
+TIMESTAMPS = {
+    'iso8601': '2026-10-16T09:41:27.000Z',
+    'rfc822': 'Fri, 16 Oct 2026 09:41:27 GMT',
+}
+
+
+def list_objects_v2_body(count):
+    contents = ''.join(
+        '<Contents>'
+        f'<Key>uploads/2026/10/file-{i:06d}.jpg</Key>'
+        f'<LastModified>2026-10-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:{i * 7 % 60:02d}.000Z</LastModified>'
+        f'<ETag>&quot;{i:032x}&quot;</ETag>'
+        '<ChecksumAlgorithm>CRC64NVME</ChecksumAlgorithm>'
+        f'<Size>{(i * 7919) % (4 * 1024 * 1024)}</Size>'
+        f"<StorageClass>{'STANDARD' if i % 5 else 'STANDARD_IA'}</StorageClass>"
+        '</Contents>'
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        '<Name>uploads</Name><Prefix>uploads/</Prefix>'
+        f'<KeyCount>{count}</KeyCount><MaxKeys>{count}</MaxKeys><IsTruncated>true</IsTruncated>'
+        f'{contents}'
+        '<NextContinuationToken>1ueGcxLPRx1Tr/XYExHnhbYLgveDs2J/wm36Hy4vbOwM=</NextContinuationToken>'
+        '<EncodingType>url</EncodingType>'
+        '</ListBucketResult>'
+    ).encode('utf-8')
+
+
+def dateutil_timestamp(value):
+    return _parse_timestamp_with_tzinfo(value, get_tzinfo_options()[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--objects', type=int, default=1000, help='Objects in the ListObjectsV2 page')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs, best is reported')
+    args = parser.parse_args()
+
+    service_model = botocore.session.get_session().get_service_model('s3')
+    operation_model = service_model.operation_model('ListObjectsV2')
+    response = {
+        'status_code': 200,
+        'headers': {'x-amz-request-id': 'BENCH', 'content-type': 'application/xml'},
+        'body': list_objects_v2_body(args.objects),
+    }
+    parsers = {
+        'dateutil': RestXMLParser(timestamp_parser=dateutil_timestamp),
+        'fast': RestXMLParser(),
+    }
+    parsed = {name: p.parse(response, operation_model.output_shape) for name, p in parsers.items()}
+    assert parsed['dateutil'] == parsed['fast']
+    assert len(parsed['fast']['Contents']) == args.objects
+
+    best = {}
+    for name, p in parsers.items():
+        best[name] = min(timeit.repeat(
+            lambda: p.parse(response, operation_model.output_shape), repeat=args.repeat, number=5
+        )) / 5
+    print(f"ListObjectsV2 page of {args.objects} objects")
+    for name, seconds in best.items():
+        print(f"  {name:<9} {seconds * 1e3:8.2f} ms/page")
+    print(f"  speedup   {best['dateutil'] / best['fast']:8.2f}x")
+
+    print("parse_timestamp")
+    for label, value in TIMESTAMPS.items():
+        assert dateutil_timestamp(value) == parse_timestamp(value)
+        slow = min(timeit.repeat(lambda: dateutil_timestamp(value), repeat=args.repeat, number=10000)) / 10000
+        fast = min(timeit.repeat(lambda: parse_timestamp(value), repeat=args.repeat, number=10000)) / 10000
+        print(f"  {label:<9} dateutil {slow * 1e6:6.2f} us   fast {fast * 1e6:6.2f} us   ({slow / fast:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark: peak memory of parsing list pages whole vs streaming their entries.
+
+Parses generated ListObjectsV2 and ListObjectVersions pages with
+RestXMLParser, once the regular way (the whole document tree, then the
+whole result) and once with the entries streamed (the
+PaginationConfig={'StreamEntries': True} mode: iterparse, one entry at a
+time, elements cleared as they are consumed). The consumer reads each
+entry's key and size and drops it, like an inventory job. Reports the
+peak traced allocation (tracemalloc, body bytes excluded) and the time per
+page; the consumed entries are checked to be identical. Before that,
+paginates a stubbed client to check that streamed keys get the URL
+decoding of the EncodingType=url that botocore sets for S3 list calls,
+whether the response has EncodingType before or after the entries.
+
+Usage:
+    python benchmarks/bench_list_objects_streaming.py [--objects 1000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+import botocore.session  # noqa: E402
+from botocore.awsrequest import AWSResponse  # noqa: E402
+from botocore.parsers import RestXMLParser  # noqa: E402
+
+from bench_list_objects_parsing import list_objects_v2_body  # noqa: E402
+from bench_rest_xml_parser import list_object_versions_body  # noqa: E402
+
+CASES = {
+    'ListObjectsV2': (list_objects_v2_body, ('Contents', 'CommonPrefixes')),
+    'ListObjectVersions': (list_object_versions_body, ('Versions', 'DeleteMarkers', 'CommonPrefixes')),
+}
+
+
+def consume(page, result_keys):
+    seen = []
+    for key in result_keys:
+        for entry in page.get(key, []):
+            seen.append((entry.get('Key'), entry.get('Size'), entry.get('Prefix')))
+    # Members after the entries are only complete once they are consumed.
+    return seen, page.get('IsTruncated'), page.get('Name')
+
+
+def encoded_list_objects_v2_body(encoding_type_first):
+    encoding_type = '<EncodingType>url</EncodingType>'
+    contents = ''.join(
+        f'<Contents><Key>photos/summer%20{i}.jpg</Key><Size>{i}</Size></Contents>'
+        for i in range(3)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        '<Name>uploads</Name><KeyCount>3</KeyCount><MaxKeys>1000</MaxKeys>'
+        f"{encoding_type if encoding_type_first else ''}"
+        '<IsTruncated>false</IsTruncated>'
+        f'{contents}'
+        '<Prefix>photos/summer%20</Prefix>'
+        f"{'' if encoding_type_first else encoding_type}"
+        '</ListBucketResult>'
+    ).encode('utf-8')
+
+
+def check_url_decoding():
+    """Paginate ListObjectsV2 through a client, where EncodingType=url is set by default"""
+    client = botocore.session.get_session().create_client(
+        's3', region_name='us-east-1',
+        aws_access_key_id='bench', aws_secret_access_key='bench',
+    )
+    expected = [f'photos/summer {i}.jpg' for i in range(3)]
+    for encoding_type_first in (True, False):
+        body = encoded_list_objects_v2_body(encoding_type_first)
+
+        def respond(body=body, **kwargs):
+            response = AWSResponse('https://uploads.s3.amazonaws.com/', 200, {}, None)
+            response._content = body
+            return response
+
+        handler_id = f'bench-list-{encoding_type_first}'
+        client.meta.events.register('before-send.s3.ListObjectsV2', respond, unique_id=handler_id)
+        for stream_entries in (False, True):
+            paginator = client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(Bucket='uploads', PaginationConfig={'StreamEntries': stream_entries})
+            for page in pages:
+                keys = [entry['Key'] for entry in page['Contents']]
+                assert keys == expected, (encoding_type_first, stream_entries, keys)
+                assert page['Prefix'] == 'photos/summer ', (encoding_type_first, stream_entries, page['Prefix'])
+        client.meta.events.unregister('before-send.s3.ListObjectsV2', unique_id=handler_id)
+
+
+def run(parser, response, output_shape, result_keys, repeat):
+    tracemalloc.start()
+    result = consume(parser.parse(response, output_shape), result_keys)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        consume(parser.parse(response, output_shape), result_keys)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return result, peak, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--objects', type=int, default=1000, help='Entries per page')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs, best is reported')
+    args = parser.parse_args()
+
+    check_url_decoding()
+    service_model = botocore.session.get_session().get_service_model('s3')
+    rest_xml = RestXMLParser()
+    for operation_name, (make_body, result_keys) in CASES.items():
+        output_shape = service_model.operation_model(operation_name).output_shape
+        body = make_body(args.objects)
+        results = {}
+        for mode in ('whole', 'streamed'):
+            context = {'operation_name': operation_name}
+            if mode == 'streamed':
+                context['streamed_members'] = result_keys
+            response = {
+                'status_code': 200, 'headers': {'x-amz-request-id': 'BENCH'}, 'body': body, 'context': context,
+            }
+            rest_xml.parse(response, output_shape)  # compile the shapes outside the measurement
+            results[mode] = run(rest_xml, response, output_shape, result_keys, args.repeat)
+        assert results['whole'][0] == results['streamed'][0], operation_name
+        print(f"{operation_name} page of {args.objects} entries ({len(body) / 1024:.0f} KiB body)")
+        for mode, (_, peak, seconds) in results.items():
+            print(f"  {mode:<9} peak {peak / 1024:8.0f} KiB   {seconds * 1e3:7.2f} ms/page")
+        print(f"  peak memory reduced {results['whole'][1] / results['streamed'][1]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark: fixed vs autotuned multipart part size and concurrency.
+
+Uploads and downloads a generated object through s3transfer against a
+local S3 stub that adds a fixed latency to every request and caps the
+bandwidth of each connection, so small parts pay for round trips and more
+parts in flight pay off. Reports the throughput of the fixed TransferConfig
+and of the autotuned one, with the part size and concurrency it chose
+(future.meta.tuning). Transferred data is checked against the source.
+
+Usage:
+    python benchmarks/bench_s3transfer_autotune.py [--size-mb 128] [--latency-ms 40] [--connection-mbps 200]
+"""
+import argparse
+import io
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+import boto3  # noqa: E402
+from s3transfer.manager import TransferConfig, TransferManager  # noqa: E402
+
+MB = 1024 * 1024
+
+
+class ThrottledStub(BaseHTTPRequestHandler):
+    data = b''
+    parts = {}
+    completed = []
+    lock = threading.Lock()
+    latency = 0.0
+    bytes_per_second = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _throttle(self, size):
+        time.sleep(self.latency + size / self.bytes_per_second)
+
+    def _reply(self, body=b'', status=200, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self._throttle(0)
+        if 'uploads' in self.path:
+            self._reply(b'<InitiateMultipartUploadResult><Bucket>bench</Bucket><Key>archive.bin</Key>'
+                        b'<UploadId>u1</UploadId></InitiateMultipartUploadResult>')
+        else:
+            with self.lock:
+                self.completed.append(b''.join(part for _, part in sorted(self.parts.items())))
+                self.parts.clear()
+            self._reply(b'<CompleteMultipartUploadResult><Bucket>bench</Bucket><Key>archive.bin</Key>'
+                        b'<ETag>"done"</ETag></CompleteMultipartUploadResult>')
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self._throttle(len(body))
+        part_number = int(re.search(r'partNumber=(\d+)', self.path).group(1))
+        with self.lock:
+            self.parts[part_number] = body
+        self._reply(headers={'ETag': '"part"'})
+
+    def do_HEAD(self):
+        self._throttle(0)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.data)))
+        self.send_header('ETag', '"object"')
+        self.end_headers()
+
+    def do_GET(self):
+        start, end = re.match(r'bytes=(\d+)-(\d*)', self.headers['Range']).groups()
+        end = int(end) if end else len(self.data) - 1
+        body = self.data[int(start):end + 1]
+        self._throttle(len(body))
+        self._reply(body, status=206, headers={'ETag': '"object"'})
+
+
+def run(client, config, direction, data):
+    with TransferManager(client, config) as manager:
+        started = time.perf_counter()
+        if direction == 'upload':
+            future = manager.upload(io.BytesIO(data), 'bench', 'archive.bin')
+            future.result()
+            elapsed = time.perf_counter() - started
+            assert ThrottledStub.completed.pop() == data
+        else:
+            output = io.BytesIO()
+            future = manager.download('bench', 'archive.bin', output)
+            future.result()
+            elapsed = time.perf_counter() - started
+            assert output.getvalue() == data
+    return len(data) / MB / elapsed, future.meta.tuning
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=128, help='Size of the transferred object')
+    parser.add_argument('--latency-ms', type=float, default=40, help='Added latency per request')
+    parser.add_argument('--connection-mbps', type=float, default=200, help='Bandwidth cap per connection, MB/s')
+    parser.add_argument('--chunk-mb', type=int, default=8, help='multipart_chunksize to start from')
+    parser.add_argument('--concurrency', type=int, default=10, help='max_request_concurrency')
+    args = parser.parse_args()
+
+    ThrottledStub.data = os.urandom(args.size_mb * MB)
+    ThrottledStub.latency = args.latency_ms / 1000
+    ThrottledStub.bytes_per_second = args.connection_mbps * MB
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ThrottledStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = boto3.client(
+        's3', endpoint_url=f"http://127.0.0.1:{server.server_port}", region_name='us-east-1',
+        aws_access_key_id='bench', aws_secret_access_key='bench',
+    )
+
+    for direction in ('upload', 'download'):
+        for autotune in (False, True):
+            config = TransferConfig(
+                multipart_threshold=1, multipart_chunksize=args.chunk_mb * MB,
+                max_request_concurrency=args.concurrency, autotune=autotune,
+            )
+            rate, tuning = run(client, config, direction, ThrottledStub.data)
+            line = f"{direction:<9} {'autotuned' if autotune else 'fixed':<10} {rate:8.1f} MB/s"
+            if tuning is not None:
+                line += (f"   chose {tuning['chunksize'] // MB} MB x {tuning['concurrency']} "
+                         f"after {len(tuning['adjustments'])} windows, converged={tuning['converged']}")
+            print(line)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
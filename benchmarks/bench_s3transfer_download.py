@@ -0,0 +1,109 @@
+"""Benchmark: in-memory download into BytesIO vs a preallocated DownloadBuffer.
+
+Downloads a generated object from a local S3 stub with boto3's
+download_fileobj, once into an io.BytesIO (chunks queued to the IO
+executor and written at their offsets) and once into a DownloadBuffer
+(ranged GETs readinto() their slice of one bytearray), then hands the
+contents to a consumer the way the thumbnail path does. Each run happens in
+a fresh interpreter so the peak RSS (VmHWM, Linux only) is that of the
+download alone; contents are checked against the source.
+
+Usage:
+    python benchmarks/bench_s3transfer_download.py [--size-mb 128] [--chunk-mb 8] [--concurrency 10] [--repeat 3]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LAMBDA_CODE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code')
+
+DOWNLOAD_SCRIPT = """
+import hashlib, io, json, sys, time
+import boto3
+from boto3.s3.transfer import TransferConfig
+from s3transfer.utils import DownloadBuffer
+
+endpoint, target, chunk_mb, concurrency, repeat = sys.argv[1:]
+client = boto3.client(
+    's3', endpoint_url=endpoint, region_name='us-east-1',
+    aws_access_key_id='bench', aws_secret_access_key='bench',
+)
+config = TransferConfig(
+    multipart_chunksize=int(chunk_mb) * 1024 * 1024, max_concurrency=int(concurrency),
+)
+best = None
+for _ in range(int(repeat)):
+    buffer = DownloadBuffer() if target == 'buffer' else io.BytesIO()
+    started = time.perf_counter()
+    client.download_fileobj('bench', 'archive.bin', buffer, Config=config)
+    elapsed = time.perf_counter() - started
+    best = elapsed if best is None else min(best, elapsed)
+    digest = hashlib.sha256(buffer.getbuffer()).hexdigest()
+    buffer.close()
+with open('/proc/self/status') as status:
+    peak_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM:'))
+print(json.dumps({'seconds': best, 'max_rss_mb': peak_kb / 1024, 'sha256': digest}))
+"""
+
+
+class ObjectStub(BaseHTTPRequestHandler):
+    data = b''
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.data)))
+        self.send_header('ETag', '"object"')
+        self.end_headers()
+
+    def do_GET(self):
+        start, end = re.match(r'bytes=(\d+)-(\d*)', self.headers['Range']).groups()
+        end = int(end) if end else len(self.data) - 1
+        body = memoryview(self.data)[int(start):end + 1]
+        self.send_response(206)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', '"object"')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=128, help='Size of the downloaded object')
+    parser.add_argument('--chunk-mb', type=int, default=8, help='multipart_chunksize')
+    parser.add_argument('--concurrency', type=int, default=10, help='max_concurrency')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs, best is reported')
+    args = parser.parse_args()
+
+    ObjectStub.data = os.urandom(args.size_mb * 1024 * 1024)
+    expected = hashlib.sha256(ObjectStub.data).hexdigest()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ObjectStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_port}"
+
+    env = dict(os.environ, PYTHONPATH=LAMBDA_CODE)
+    for target in ('bytesio', 'buffer'):
+        result = subprocess.run(
+            [sys.executable, '-c', DOWNLOAD_SCRIPT, endpoint, target,
+             str(args.chunk_mb), str(args.concurrency), str(args.repeat)],
+            env=env, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            sys.exit(result.stderr)
+        stats = json.loads(result.stdout)
+        assert stats['sha256'] == expected, target
+        print(f"{target:<8} peak RSS {stats['max_rss_mb']:7.1f} MB   "
+              f"{args.size_mb / stats['seconds']:7.1f} MB/s")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
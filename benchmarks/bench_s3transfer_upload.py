@@ -0,0 +1,146 @@
+"""Benchmark: multipart upload peak RSS with memory mapped part readers.
+
+Uploads a generated file through boto3's upload_file and upload_fileobj to
+a local S3 multipart stub, once with parts read through file handles (and
+copied into memory for upload_fileobj) and once with MappedFilePart
+memoryview slices. Each run happens in a fresh interpreter so the peak RSS
+(VmHWM, Linux only) is that of the upload alone; the stub checks the
+reassembled object.
+
+Usage:
+    python benchmarks/bench_s3transfer_upload.py [--size-mb 256] [--chunk-mb 8] [--concurrency 10]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LAMBDA_CODE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code')
+
+UPLOAD_SCRIPT = """
+import json, sys, time
+import boto3
+from boto3.s3.transfer import TransferConfig
+from s3transfer.utils import OSUtils
+
+endpoint, path, source, mapped, chunk_mb, concurrency = sys.argv[1:]
+
+
+class ReadOnlyOSUtils(OSUtils):
+    def can_map_file(self, source):
+        return False
+
+
+client = boto3.client(
+    's3', endpoint_url=endpoint, region_name='us-east-1',
+    aws_access_key_id='bench', aws_secret_access_key='bench',
+)
+config = TransferConfig(
+    multipart_threshold=1, multipart_chunksize=int(chunk_mb) * 1024 * 1024,
+    max_concurrency=int(concurrency),
+)
+if mapped != 'mapped':
+    import s3transfer.manager
+    s3transfer.manager.OSUtils = ReadOnlyOSUtils
+started = time.perf_counter()
+if source == 'upload_file':
+    client.upload_file(path, 'bench', 'archive.bin', Config=config)
+else:
+    with open(path, 'rb') as f:
+        client.upload_fileobj(f, 'bench', 'archive.bin', Config=config)
+elapsed = time.perf_counter() - started
+# Not ru_maxrss, on Linux that also covers the forked copy of the parent
+# from before exec().
+with open('/proc/self/status') as status:
+    peak_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM:'))
+print(json.dumps({'seconds': elapsed, 'max_rss_mb': peak_kb / 1024}))
+"""
+
+
+class MultipartStub(BaseHTTPRequestHandler):
+    parts = {}
+    lock = threading.Lock()
+    completed = []
+
+    def log_message(self, *args):
+        pass
+
+    def _body(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked' or 'aws-chunked' in self.headers.get('Content-Encoding', ''):
+            raise AssertionError('chunked uploads are not expected over http')
+        return self.rfile.read(int(self.headers['Content-Length']))
+
+    def _reply(self, body=b'', headers=None):
+        self.send_response(200)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self._body()
+        if 'uploads' in self.path:
+            self._reply(b'<InitiateMultipartUploadResult><Bucket>bench</Bucket><Key>archive.bin</Key>'
+                        b'<UploadId>u1</UploadId></InitiateMultipartUploadResult>')
+        else:
+            with self.lock:
+                self.completed.append(b''.join(part for _, part in sorted(self.parts.items())))
+                self.parts.clear()
+            self._reply(b'<CompleteMultipartUploadResult><Bucket>bench</Bucket><Key>archive.bin</Key>'
+                        b'<ETag>"done"</ETag></CompleteMultipartUploadResult>')
+
+    def do_PUT(self):
+        body = self._body()
+        part_number = int(re.search(r'partNumber=(\d+)', self.path).group(1))
+        digest = hashlib.md5(body).hexdigest()
+        with self.lock:
+            self.parts[part_number] = hashlib.sha256(body).digest()
+        self._reply(headers={'ETag': f'"{digest}"'})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=256, help='Size of the uploaded file')
+    parser.add_argument('--chunk-mb', type=int, default=8, help='multipart_chunksize')
+    parser.add_argument('--concurrency', type=int, default=10, help='max_concurrency')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MultipartStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_port}"
+
+    chunk = args.chunk_mb * 1024 * 1024
+    with tempfile.NamedTemporaryFile(suffix='.bin') as source:
+        expected = []
+        for offset in range(0, args.size_mb * 1024 * 1024, chunk):
+            data = os.urandom(min(chunk, args.size_mb * 1024 * 1024 - offset))
+            source.write(data)
+            expected.append(hashlib.sha256(data).digest())
+        source.flush()
+
+        env = dict(os.environ, PYTHONPATH=LAMBDA_CODE)
+        for upload in ('upload_file', 'upload_fileobj'):
+            for mode in ('read', 'mapped'):
+                result = subprocess.run(
+                    [sys.executable, '-c', UPLOAD_SCRIPT, endpoint, source.name, upload, mode,
+                     str(args.chunk_mb), str(args.concurrency)],
+                    env=env, capture_output=True, text=True,
+                )
+                if result.returncode != 0:
+                    sys.exit(result.stderr)
+                stats = json.loads(result.stdout)
+                assert MultipartStub.completed.pop() == b''.join(expected), (upload, mode)
+                print(f"{upload:<15} {mode:<7} peak RSS {stats['max_rss_mb']:7.1f} MB   "
+                      f"{args.size_mb / stats['seconds']:7.1f} MB/s")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
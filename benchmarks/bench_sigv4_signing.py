@@ -0,0 +1,90 @@
+"""Microbenchmark: SigV4 signing throughput with and without the key cache.
+
+Signs requests shaped like the ones the processor sends (S3 HeadObject and
+PutObject, DynamoDB PutItem) with S3SigV4Auth/SigV4Auth, once deriving the
+signing key per request and once through the shared SigningKeyCache.
+Signing keys from both paths are checked for equality before timing.
+
+Usage:
+    python benchmarks/bench_sigv4_signing.py [--requests 5000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code'))
+
+from botocore.auth import S3SigV4Auth, SigV4Auth  # noqa: E402
+from botocore.awsrequest import AWSRequest  # noqa: E402
+from botocore.credentials import Credentials  # noqa: E402
+
+CREDENTIALS = Credentials('ASIABENCHMARKACCESSKEY', 'bench/secret/key/0123456789abcdefghijklmn', 'bench-session-token')
+BUCKET_URL = 'https://p3-lambda-file-processor-uploads.s3.us-east-1.amazonaws.com'
+
+
+def head_object_request():
+    request = AWSRequest('HEAD', f"{BUCKET_URL}/uploads/2026/10/photo-00001.jpg")
+    # S3 over https with no checksum skips payload hashing
+    request.context['payload_signing_enabled'] = False
+    return request
+
+
+def put_object_request():
+    body = os.urandom(64 * 1024)
+    request = AWSRequest(
+        'PUT', f"{BUCKET_URL}/thumbnails/256/uploads/photo-00001.jpg", data=body,
+        headers={'Content-Type': 'image/jpeg', 'Content-Length': str(len(body))},
+    )
+    request.context['payload_signing_enabled'] = False
+    return request
+
+
+def put_item_request():
+    item = {'processing_id': {'S': '0' * 64}, 'status': {'S': 'success'}, 'file_size': {'N': '2097152'}}
+    return AWSRequest(
+        'POST', 'https://dynamodb.us-east-1.amazonaws.com/',
+        data=json.dumps({'TableName': 'file-processing-log', 'Item': item}).encode('utf-8'),
+        headers={'X-Amz-Target': 'DynamoDB_20120810.PutItem', 'Content-Type': 'application/x-amz-json-1.0'},
+    )
+
+
+REQUEST_TYPES = [
+    ('s3 HeadObject', S3SigV4Auth, 's3', head_object_request),
+    ('s3 PutObject 64KB', S3SigV4Auth, 's3', put_object_request),
+    ('dynamodb PutItem', SigV4Auth, 'dynamodb', put_item_request),
+]
+
+
+def make_signer(signer_class, service_name, cached):
+    signer = signer_class(CREDENTIALS, service_name, 'us-east-1')
+    if not cached:
+        signer.signing_key_cache = None
+    return signer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=5000, help='Requests signed per run')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs, best is reported')
+    args = parser.parse_args()
+
+    for label, signer_class, service_name, build_request in REQUEST_TYPES:
+        request = build_request()
+        derived = make_signer(signer_class, service_name, cached=False)
+        cached = make_signer(signer_class, service_name, cached=True)
+        cached.add_auth(request)
+        assert derived.signing_key(request) == cached.signing_key(request), label
+
+        rates = {}
+        for name, signer in (('derive', derived), ('cached', cached)):
+            best = min(timeit.repeat(lambda: signer.add_auth(request), repeat=args.repeat, number=args.requests))
+            rates[name] = args.requests / best
+        print(f"{label:<20} derive {rates['derive']:9.0f} req/s   cached {rates['cached']:9.0f} req/s   "
+              f"({rates['cached'] / rates['derive']:.2f}x)")
+    print(f"cache: {SigV4Auth.signing_key_cache.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -308,3 +308,174 @@ class TypeDeserializer:
 
     def _deserialize_m(self, value):
         return {k: self.deserialize(v) for k, v in value.items()}
+
+
+class CompiledTypeSerializer(TypeSerializer):
+    """A TypeSerializer that dispatches on the exact type of each value.
+
+    ``TypeSerializer`` runs a chain of ``isinstance`` predicates for every
+    value and scans sets once per candidate set type.  This class looks the
+    handler up in a table keyed on ``type(value)`` instead, and classifies
+    set members in a single pass.  Values whose type is not in the table
+    (subclasses, other ``Mapping``/``Set`` implementations) fall back to the
+    ``TypeSerializer`` predicates, so the output is identical.
+
+    ``serialize_item`` additionally caches the per-attribute handlers for
+    each top level item shape (its attribute names), which suits workloads
+    that write many items with the same layout.  A value whose type differs
+    from the cached one is dispatched normally.
+    """
+
+    # Integers in this range are exactly representable in DYNAMODB_CONTEXT,
+    # so str() matches what create_decimal() would produce.
+    _EXACT_INT_LIMIT = 10**38
+
+    def __init__(self, shape_cache_size=128):
+        self._shape_cache = {}
+        self._shape_cache_size = shape_cache_size
+        self._dispatch = {
+            type(None): self._fast_null,
+            bool: self._fast_bool,
+            int: self._fast_int,
+            Decimal: self._fast_decimal,
+            float: self._fast_float,
+            str: self._fast_str,
+            bytes: self._fast_binary,
+            bytearray: self._fast_binary,
+            Binary: self._fast_wrapped_binary,
+            dict: self._fast_map,
+            list: self._fast_list,
+            tuple: self._fast_list,
+            set: self._fast_set,
+            frozenset: self._fast_set,
+        }
+        self._set_member_types = {
+            int: NUMBER_SET,
+            Decimal: NUMBER_SET,
+            str: STRING_SET,
+            bytes: BINARY_SET,
+            bytearray: BINARY_SET,
+            Binary: BINARY_SET,
+        }
+
+    def serialize(self, value):
+        handler = self._dispatch.get(type(value))
+        if handler is None:
+            return super().serialize(value)
+        return handler(value)
+
+    def serialize_item(self, item):
+        """Serialize the attributes of a top level item.
+
+        :type item: dict
+        :param item: A mapping of attribute names to python values.
+
+        :rtype: dict
+        :returns: A mapping of attribute names to DynamoDB values, the same
+            as ``{k: serializer.serialize(v) for k, v in item.items()}``.
+        """
+        shape = tuple(item)
+        handlers = self._shape_cache.get(shape)
+        if handlers is None:
+            handlers = [
+                (type(value), self._dispatch.get(type(value), self.serialize))
+                for value in item.values()
+            ]
+            if len(self._shape_cache) >= self._shape_cache_size:
+                self._shape_cache.clear()
+            self._shape_cache[shape] = handlers
+        serialize = self.serialize
+        return {
+            name: handler(value) if type(value) is value_type
+            # The value's type differs from the cached shape, dispatch normally.
+            else serialize(value)
+            for (value_type, handler), (name, value) in zip(
+                handlers, item.items()
+            )
+        }
+
+    def _fast_null(self, value):
+        return {NULL: True}
+
+    def _fast_bool(self, value):
+        return {BOOLEAN: value}
+
+    def _fast_int(self, value):
+        if -self._EXACT_INT_LIMIT < value < self._EXACT_INT_LIMIT:
+            return {NUMBER: str(value)}
+        return {NUMBER: self._serialize_n(value)}
+
+    def _fast_decimal(self, value):
+        return {NUMBER: self._serialize_n(value)}
+
+    def _fast_float(self, value):
+        # Raises the same TypeError as TypeSerializer.
+        return super().serialize(value)
+
+    def _fast_str(self, value):
+        return {STRING: value}
+
+    def _fast_binary(self, value):
+        return {BINARY: value}
+
+    def _fast_wrapped_binary(self, value):
+        return {BINARY: value.value}
+
+    def _fast_map(self, value):
+        serialize = self.serialize
+        return {MAP: {k: serialize(v) for k, v in value.items()}}
+
+    def _fast_list(self, value):
+        serialize = self.serialize
+        return {LIST: [serialize(v) for v in value]}
+
+    def _fast_set(self, value):
+        set_types = set()
+        member_types = self._set_member_types
+        for member in value:
+            set_type = member_types.get(type(member))
+            if set_type is None:
+                # Subclasses, floats, booleans (not a number here) and mixed
+                # members all take the exact TypeSerializer path.
+                return super().serialize(value)
+            set_types.add(set_type)
+        if len(set_types) > 1:
+            return super().serialize(value)
+        # An empty set serializes as a number set, as in TypeSerializer.
+        set_type = set_types.pop() if set_types else NUMBER_SET
+        if set_type == NUMBER_SET:
+            return {NUMBER_SET: self._serialize_ns(value)}
+        elif set_type == STRING_SET:
+            return {STRING_SET: list(value)}
+        return {BINARY_SET: self._serialize_bs(value)}
+
+
+class CompiledTypeDeserializer(TypeDeserializer):
+    """A TypeDeserializer that uses a lookup table instead of ``getattr``.
+
+    Type keys that are not in the table (e.g. lowercase ones, which
+    ``TypeDeserializer`` also accepts) fall back to the base class.
+    """
+
+    def __init__(self):
+        self._dispatch = {
+            NULL: self._deserialize_null,
+            BOOLEAN: self._deserialize_bool,
+            NUMBER: self._deserialize_n,
+            STRING: self._deserialize_s,
+            BINARY: self._deserialize_b,
+            NUMBER_SET: self._deserialize_ns,
+            STRING_SET: self._deserialize_ss,
+            BINARY_SET: self._deserialize_bs,
+            LIST: self._deserialize_l,
+            MAP: self._deserialize_m,
+        }
+
+    def deserialize(self, value):
+        if not value:
+            return super().deserialize(value)
+        dynamodb_type = next(iter(value))
+        deserializer = self._dispatch.get(dynamodb_type)
+        if deserializer is None:
+            return super().deserialize(value)
+        return deserializer(value[dynamodb_type])
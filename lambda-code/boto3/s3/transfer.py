@@ -247,6 +247,8 @@ class TransferConfig(S3TransferConfig):
         use_threads=True,
         max_bandwidth=None,
         preferred_transfer_client=constants.AUTO_RESOLVE_TRANSFER_CLIENT,
+        autotune=False,
+        autotune_max_memory=None,
     ):
         """Configuration object for managed S3 transfers
 
@@ -296,6 +298,15 @@ class TransferConfig(S3TransferConfig):
                   are made with supported environment and settings.
               * classic - Only use the origin S3TransferManager with
                   requests. Disables possible CRT upgrade on requests.
+
+        :param autotune: If True, multipart transfers adjust their part size
+            and number of parts in flight while they run, based on the
+            measured throughput. ``multipart_chunksize`` and
+            ``max_concurrency`` are the starting point, the latter is also the
+            maximum. Only the classic transfer manager supports autotuning.
+
+        :param autotune_max_memory: The maximum of part size times parts in
+            flight, in bytes, that autotuning may use. Defaults to 256 MiB.
         """
         super().__init__(
             multipart_threshold=multipart_threshold,
@@ -305,6 +316,8 @@ class TransferConfig(S3TransferConfig):
             max_io_queue_size=max_io_queue,
             io_chunksize=io_chunksize,
             max_bandwidth=max_bandwidth,
+            autotune=autotune,
+            autotune_max_memory=autotune_max_memory,
         )
         # Some of the argument names are not the same as the inherited
         # S3TransferConfig so we add aliases so you can still access the
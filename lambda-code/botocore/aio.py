@@ -0,0 +1,720 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Awaitable clients on asyncio.
+
+Serialization, endpoint resolution, signing, event handlers, retries and
+parsing are the ones of a regular client. Only sending is replaced, by an
+HTTP/1.1 transport on asyncio streams, so many calls can be in flight on a
+single thread::
+
+    s3 = AsyncClient(session.create_client('s3'))
+    responses = await asyncio.gather(
+        *(s3.head_object(Bucket=bucket, Key=key) for key in keys)
+    )
+"""
+
+import asyncio
+import collections
+import io
+import logging
+import os
+import ssl
+from urllib.parse import urlsplit
+
+from urllib3 import HTTPHeaderDict
+
+from botocore.awsrequest import AWSResponse
+from botocore.context import start_as_current_context
+from botocore.endpoint import DEFAULT_TIMEOUT, MAX_POOL_CONNECTIONS, Endpoint
+from botocore.exceptions import (
+    BotoCoreError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    HTTPClientError,
+    ReadTimeoutError,
+    SSLError,
+)
+from botocore.httpsession import (
+    URLLib3Session,
+    create_urllib3_context,
+    get_cert_path,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class _ProtocolError(Exception):
+    """The server's response is not valid HTTP/1.1"""
+
+
+class _StaleConnectionError(Exception):
+    """A kept-alive connection was closed before the request was answered"""
+
+
+class _ResponseBody(io.BytesIO):
+    """A response body read in full
+
+    Provides the parts of the urllib3 response interface that botocore
+    uses on ``AWSResponse.raw``.
+    """
+
+    def stream(self, amt=2**16, decode_content=None):
+        while True:
+            data = self.read(amt)
+            if not data:
+                break
+            yield data
+
+    def release_conn(self):
+        pass
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def is_dropped(self):
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def close(self):
+        try:
+            self.writer.close()
+        except RuntimeError:
+            # The event loop the connection was opened on is closed.
+            pass
+
+
+class _ConnectionPool:
+    def __init__(self, maxsize):
+        self.semaphore = asyncio.Semaphore(maxsize)
+        self.idle = collections.deque()
+
+
+class AsyncHTTPSession:
+    """An HTTP/1.1 client for botocore requests on asyncio
+
+    ``send()`` is the awaitable counterpart of ``URLLib3Session.send()``.
+    Connections are kept alive per host and at most
+    ``max_pool_connections`` of them are open to a host at once, further
+    requests wait for one to be free. A request that finds its kept-alive
+    connection closed by the server is sent again on a new connection.
+
+    Response bodies are read completely before ``send()`` returns, so
+    streaming outputs are served from memory. Proxies are not supported.
+    """
+
+    _BODY_CHUNK_SIZE = 1024 * 1024
+    # The time to wait for "100 Continue" before sending the body anyway,
+    # like AWSConnection does.
+    _EXPECT_CONTINUE_TIMEOUT = 1
+
+    def __init__(
+        self,
+        verify=True,
+        timeout=None,
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        client_cert=None,
+    ):
+        self._verify = verify
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        if isinstance(timeout, (int, float)):
+            timeout = (timeout, timeout)
+        self._connect_timeout, self._read_timeout = timeout
+        self._max_pool_connections = max_pool_connections
+        self._client_cert = client_cert
+        self._ssl_context = None
+        self._loop = None
+        self._pools = {}
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            context = create_urllib3_context()
+            if self._verify:
+                context.verify_mode = ssl.CERT_REQUIRED
+                context.check_hostname = True
+                cert_path = get_cert_path(self._verify)
+                if os.path.isdir(cert_path):
+                    context.load_verify_locations(capath=cert_path)
+                else:
+                    context.load_verify_locations(cafile=cert_path)
+            else:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            if isinstance(self._client_cert, str):
+                context.load_cert_chain(self._client_cert)
+            elif isinstance(self._client_cert, tuple):
+                context.load_cert_chain(*self._client_cert)
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _get_pool(self, key):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Connections belong to the event loop they were opened on,
+            # a new loop (another asyncio.run()) starts over.
+            self.close()
+            self._loop = loop
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = _ConnectionPool(self._max_pool_connections)
+            self._pools[key] = pool
+        return pool
+
+    def close(self):
+        for pool in self._pools.values():
+            while pool.idle:
+                pool.idle.popleft().close()
+        self._pools = {}
+
+    async def send(self, request):
+        try:
+            return await self._send(request)
+        except BotoCoreError:
+            raise
+        except asyncio.TimeoutError as e:
+            raise ReadTimeoutError(endpoint_url=request.url, error=e)
+        except (
+            ConnectionError,
+            asyncio.IncompleteReadError,
+            _ProtocolError,
+        ) as e:
+            raise ConnectionClosedError(
+                error=e, request=request, endpoint_url=request.url
+            )
+        except Exception as e:
+            message = 'Exception received when sending asyncio HTTP request'
+            logger.debug(message, exc_info=True)
+            raise HTTPClientError(error=e)
+
+    async def _send(self, request):
+        url = urlsplit(request.url)
+        scheme = url.scheme.lower()
+        key = (scheme, url.hostname, url.port or DEFAULT_PORTS[scheme])
+        pool = self._get_pool(key)
+        async with pool.semaphore:
+            connection = self._get_idle_connection(pool)
+            if connection is not None:
+                try:
+                    return await self._send_on_connection(
+                        pool, connection, request, url, reused=True
+                    )
+                except _StaleConnectionError:
+                    logger.debug(
+                        "Kept-alive connection to %s:%s was closed, "
+                        "retrying on a new connection",
+                        *key[1:],
+                    )
+                    request.reset_stream()
+            connection = await self._open_connection(request, key)
+            return await self._send_on_connection(
+                pool, connection, request, url, reused=False
+            )
+
+    def _get_idle_connection(self, pool):
+        while pool.idle:
+            connection = pool.idle.pop()
+            if not connection.is_dropped():
+                return connection
+            connection.close()
+        return None
+
+    async def _open_connection(self, request, key):
+        scheme, host, port = key
+        ssl_context = None
+        if scheme == 'https':
+            ssl_context = self._get_ssl_context()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host,
+                    port,
+                    ssl=ssl_context,
+                    server_hostname=host if ssl_context else None,
+                ),
+                self._connect_timeout,
+            )
+        except ssl.SSLError as e:
+            raise SSLError(endpoint_url=request.url, error=e)
+        except asyncio.TimeoutError as e:
+            raise ConnectTimeoutError(endpoint_url=request.url, error=e)
+        except OSError as e:
+            raise EndpointConnectionError(endpoint_url=request.url, error=e)
+        return _Connection(reader, writer)
+
+    async def _send_on_connection(
+        self, pool, connection, request, url, reused
+    ):
+        received = False
+        body_skipped = False
+        try:
+            head, body, chunked = self._encode_request(request, url)
+            connection.writer.write(head)
+            status_line = None
+            if body is not None and self._expects_continue(request):
+                await self._drain(connection.writer)
+                status_line = await self._wait_for_continue(connection.reader)
+                received = True
+            if status_line is None:
+                await self._write_body(connection.writer, body, chunked)
+            else:
+                # Answered before the body was sent, so the connection is
+                # in an unknown state.
+                body_skipped = True
+            version, status, headers = await asyncio.wait_for(
+                self._read_response_head(connection.reader, status_line),
+                self._read_timeout,
+            )
+            received = True
+            content, keep_alive = await self._read_body(
+                connection.reader, request.method, status, headers
+            )
+        except BaseException as e:
+            connection.close()
+            if (
+                reused
+                and not received
+                and isinstance(
+                    e, (ConnectionError, asyncio.IncompleteReadError)
+                )
+            ):
+                raise _StaleConnectionError() from e
+            raise
+        if (
+            keep_alive
+            and not body_skipped
+            and self._keeps_alive(version, headers)
+        ):
+            pool.idle.append(connection)
+        else:
+            connection.close()
+        return AWSResponse(
+            request.url, status, headers, _ResponseBody(content)
+        )
+
+    def _expects_continue(self, request):
+        expect = request.headers.get('Expect', b'')
+        if isinstance(expect, str):
+            expect = expect.encode('latin-1')
+        return expect.lower() == b'100-continue'
+
+    async def _wait_for_continue(self, reader):
+        # Returns the status line of a response that came instead of
+        # "100 Continue", or None once the body should be sent.
+        try:
+            status_line = await asyncio.wait_for(
+                reader.readline(), self._EXPECT_CONTINUE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return None
+        if not status_line:
+            raise asyncio.IncompleteReadError(b'', None)
+        if status_line.split(b' ', 2)[1:2] == [b'100']:
+            await self._read_headers(reader)
+            return None
+        return status_line
+
+    def _encode_request(self, request, url):
+        target = url.path or '/'
+        if url.query:
+            target = f'{target}?{url.query}'
+        lines = [f'{request.method} {target} HTTP/1.1'.encode('utf-8')]
+        headers = request.headers
+        if 'Host' not in headers:
+            # Like http.client, IDNA only applies to non ASCII hosts and per
+            # label, not to the whole line.
+            try:
+                host = url.netloc.encode('ascii')
+            except UnicodeEncodeError:
+                host = url.netloc.encode('idna')
+            lines.append(b'Host: ' + host)
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        chunked = False
+        transfer_encoding = headers.get('Transfer-Encoding', b'')
+        if isinstance(transfer_encoding, str):
+            transfer_encoding = transfer_encoding.encode('latin-1')
+        if transfer_encoding.lower() == b'chunked':
+            chunked = True
+        elif body is not None and 'Content-Length' not in headers:
+            if isinstance(body, (bytes, bytearray, memoryview)):
+                lines.append(b'Content-Length: %d' % len(body))
+            else:
+                lines.append(b'Transfer-Encoding: chunked')
+                chunked = True
+        for name, value in headers.items():
+            if isinstance(value, str):
+                value = value.encode('latin-1')
+            lines.append(name.encode('latin-1') + b': ' + value)
+        lines.append(b'\r\n')
+        return b'\r\n'.join(lines), body, chunked
+
+    async def _drain(self, writer):
+        # Sends are bounded by the read timeout, as they are by the socket
+        # timeout urllib3 sets, so a peer that stops reading can't stall
+        # the request forever.
+        await asyncio.wait_for(writer.drain(), self._read_timeout)
+
+    async def _write_body(self, writer, body, chunked):
+        if body is None:
+            await self._drain(writer)
+            return
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            chunks = (body,)
+        elif hasattr(body, 'read'):
+            chunks = iter(lambda: body.read(self._BODY_CHUNK_SIZE), b'')
+        else:
+            chunks = body
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if not chunk:
+                continue
+            if chunked:
+                writer.write(b'%x\r\n' % len(chunk))
+                writer.write(chunk)
+                writer.write(b'\r\n')
+            else:
+                writer.write(chunk)
+            await self._drain(writer)
+        if chunked:
+            writer.write(b'0\r\n\r\n')
+        await self._drain(writer)
+
+    async def _read_response_head(self, reader, status_line=None):
+        while True:
+            if status_line is None:
+                status_line = await reader.readline()
+            if not status_line:
+                raise asyncio.IncompleteReadError(b'', None)
+            try:
+                version, status = status_line.decode('latin-1').split()[:2]
+                status = int(status)
+            except ValueError:
+                raise _ProtocolError(f'Invalid status line: {status_line!r}')
+            headers = await self._read_headers(reader)
+            if 100 <= status < 200 and status != 101:
+                # Interim responses precede the real one.
+                status_line = None
+                continue
+            return version, status, headers
+
+    async def _read_headers(self, reader):
+        headers = HTTPHeaderDict()
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n'):
+                return headers
+            if not line:
+                raise asyncio.IncompleteReadError(b'', None)
+            name, _, value = line.decode('latin-1').partition(':')
+            headers.add(name.strip(), value.strip())
+
+    async def _read_body(self, reader, method, status, headers):
+        # Returns the body and whether the connection can be reused.
+        if method == 'HEAD' or status in (204, 304):
+            return b'', True
+        if headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            return await self._read_chunked_body(reader), True
+        content_length = headers.get('Content-Length')
+        if content_length is None:
+            content = await asyncio.wait_for(
+                reader.read(), self._read_timeout
+            )
+            return content, False
+        remaining = int(content_length)
+        if remaining <= self._BODY_CHUNK_SIZE:
+            content = await asyncio.wait_for(
+                reader.readexactly(remaining), self._read_timeout
+            )
+            return content, True
+        chunks = []
+        while remaining:
+            chunk = await asyncio.wait_for(
+                reader.readexactly(min(remaining, self._BODY_CHUNK_SIZE)),
+                self._read_timeout,
+            )
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks), True
+
+    async def _read_chunked_body(self, reader):
+        chunks = []
+        while True:
+            size_line = await asyncio.wait_for(
+                reader.readline(), self._read_timeout
+            )
+            if not size_line:
+                raise asyncio.IncompleteReadError(b'', None)
+            try:
+                size = int(size_line.split(b';', 1)[0], 16)
+            except ValueError:
+                raise _ProtocolError(f'Invalid chunk size: {size_line!r}')
+            if size == 0:
+                break
+            chunk = await asyncio.wait_for(
+                reader.readexactly(size + 2), self._read_timeout
+            )
+            chunks.append(chunk[:-2])
+        # Trailers, if any, end with an empty line.
+        await asyncio.wait_for(self._read_headers(reader), self._read_timeout)
+        return b''.join(chunks)
+
+    def _keeps_alive(self, version, headers):
+        connection = headers.get('Connection', '').lower()
+        if version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+
+class AsyncEndpoint(Endpoint):
+    """An Endpoint whose ``make_request()`` is a coroutine
+
+    The request lifecycle and events are those of ``Endpoint``. Requests
+    are sent with an ``AsyncHTTPSession`` and retry delays are awaited
+    instead of slept.
+    """
+
+    def __init__(
+        self,
+        host,
+        endpoint_prefix,
+        event_emitter,
+        response_parser_factory=None,
+        http_session=None,
+    ):
+        if http_session is None:
+            http_session = AsyncHTTPSession()
+        super().__init__(
+            host,
+            endpoint_prefix,
+            event_emitter,
+            response_parser_factory=response_parser_factory,
+            http_session=http_session,
+        )
+
+    async def make_request(self, operation_model, request_dict):
+        logger.debug(
+            "Making request for %s with params: %s",
+            operation_model,
+            request_dict,
+        )
+        return await self._send_request(request_dict, operation_model)
+
+    async def _send_request(self, request_dict, operation_model):
+        attempts = 1
+        context = request_dict['context']
+        self._update_retries_context(context, attempts)
+        request = self.create_request(request_dict, operation_model)
+        success_response, exception = await self._get_response(
+            request, operation_model, context
+        )
+        while await self._needs_retry(
+            attempts,
+            operation_model,
+            request_dict,
+            success_response,
+            exception,
+        ):
+            attempts += 1
+            self._update_retries_context(context, attempts, success_response)
+            request.reset_stream()
+            request = self.create_request(request_dict, operation_model)
+            success_response, exception = await self._get_response(
+                request, operation_model, context
+            )
+        if (
+            success_response is not None
+            and 'ResponseMetadata' in success_response[1]
+        ):
+            total_retries = attempts - 1
+            success_response[1]['ResponseMetadata']['RetryAttempts'] = (
+                total_retries
+            )
+        if exception is not None:
+            raise exception
+        else:
+            return success_response
+
+    async def _get_response(self, request, operation_model, context):
+        success_response, exception = await self._do_get_response(
+            request, operation_model, context
+        )
+        self._emit_response_received(
+            operation_model, context, success_response, exception
+        )
+        return success_response, exception
+
+    async def _do_get_response(self, request, operation_model, context):
+        try:
+            http_response = self._emit_before_send(request, operation_model)
+            if http_response is None:
+                http_response = await self._send(request)
+        except HTTPClientError as e:
+            return (None, e)
+        except Exception as e:
+            logger.debug(
+                "Exception received when sending HTTP request.", exc_info=True
+            )
+            return (None, e)
+        return self._parse_http_response(
+            http_response, operation_model, context
+        )
+
+    async def _needs_retry(
+        self,
+        attempts,
+        operation_model,
+        request_dict,
+        response=None,
+        caught_exception=None,
+    ):
+        retry_delay = self._get_retry_delay(
+            attempts, operation_model, request_dict, response, caught_exception
+        )
+        if retry_delay is None:
+            return False
+        await asyncio.sleep(retry_delay)
+        return True
+
+    async def _send(self, request):
+        return await self.http_session.send(request)
+
+
+class AsyncClient:
+    """Awaitable operations of a botocore client
+
+    Wraps a client created the usual way, ``session.create_client('s3')``
+    or ``boto3.client('s3')``, and has a coroutine for each of its
+    operations, with the same name and parameters. Everything but sending
+    the request is done by the wrapped client and its event handlers, and
+    runs on the event loop. Paginators, waiters and presigning stay on the
+    wrapped client.
+
+    The client config's timeouts and ``max_pool_connections`` apply per
+    host; the latter bounds the requests in flight and can be raised with
+    ``max_pool_connections``.
+    """
+
+    def __init__(self, client, max_pool_connections=None):
+        endpoint = client._endpoint
+        config = client.meta.config
+        verify = True
+        if isinstance(endpoint.http_session, URLLib3Session):
+            proxy_config = endpoint.http_session._proxy_config
+            if proxy_config.proxy_url_for(endpoint.host):
+                raise ValueError(
+                    f'A proxy is configured for {endpoint.host}, '
+                    f'proxies are not supported by AsyncClient.'
+                )
+            verify = endpoint.http_session._verify
+        if max_pool_connections is None:
+            max_pool_connections = config.max_pool_connections
+        http_session = AsyncHTTPSession(
+            verify=verify,
+            timeout=(config.connect_timeout, config.read_timeout),
+            max_pool_connections=max_pool_connections,
+            client_cert=config.client_cert,
+        )
+        self._client = client
+        self._endpoint = AsyncEndpoint(
+            endpoint.host,
+            endpoint._endpoint_prefix,
+            endpoint._event_emitter,
+            response_parser_factory=endpoint._response_parser_factory,
+            http_session=http_session,
+        )
+
+    @property
+    def meta(self):
+        return self._client.meta
+
+    @property
+    def exceptions(self):
+        return self._client.exceptions
+
+    def __getattr__(self, name):
+        operation_name = self._client.meta.method_to_api_mapping.get(name)
+        if operation_name is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'{name}'"
+            )
+        method = self._create_api_method(name, operation_name)
+        # Cache on the instance, later lookups do not reach __getattr__.
+        setattr(self, name, method)
+        return method
+
+    def _create_api_method(self, py_operation_name, operation_name):
+        async def _api_call(*args, **kwargs):
+            # We're accepting *args so that we can give a more helpful
+            # error message than TypeError: _api_call takes exactly
+            # 1 argument.
+            if args:
+                raise TypeError(
+                    f"{py_operation_name}() only accepts keyword arguments."
+                )
+            return await self._make_api_call(operation_name, kwargs)
+
+        _api_call.__name__ = str(py_operation_name)
+        return _api_call
+
+    async def _make_api_call(self, operation_name, api_params):
+        client = self._client
+        with start_as_current_context():
+            (
+                operation_model,
+                request_dict,
+                request_context,
+                event_response,
+            ) = client._prepare_api_call(operation_name, api_params)
+            if event_response is not None:
+                http, parsed_response = event_response
+            else:
+                http, parsed_response = await self._make_request(
+                    operation_model, request_dict, request_context
+                )
+            return client._handle_api_response(
+                operation_model, http, parsed_response, request_context
+            )
+
+    async def _make_request(
+        self, operation_model, request_dict, request_context
+    ):
+        try:
+            return await self._endpoint.make_request(
+                operation_model, request_dict
+            )
+        except Exception as e:
+            service_id = self.meta.service_model.service_id.hyphenize()
+            self.meta.events.emit(
+                f'after-call-error.{service_id}.{operation_model.name}',
+                exception=e,
+                context=request_context,
+            )
+            raise
+
+    async def close(self):
+        """Close the connections of this client's HTTP session"""
+        self._endpoint.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -165,10 +165,13 @@ class ClientArgsCreator:
             socket_options=socket_options,
             client_cert=new_config.client_cert,
             proxies_config=new_config.proxies_config,
+            max_idle_time=new_config.connection_max_idle_time,
         )
 
         serializer = botocore.serialize.create_serializer(
-            protocol, parameter_validation
+            protocol,
+            parameter_validation,
+            cache_signatures=bool(new_config.parameter_validation_cache),
         )
         response_parser = botocore.parsers.create_parser(protocol)
 
@@ -281,6 +284,12 @@ class ClientArgsCreator:
                 client_cert=client_config.client_cert,
                 inject_host_prefix=client_config.inject_host_prefix,
                 tcp_keepalive=client_config.tcp_keepalive,
+                connection_max_idle_time=(
+                    client_config.connection_max_idle_time
+                ),
+                parameter_validation_cache=(
+                    client_config.parameter_validation_cache
+                ),
                 user_agent_extra=client_config.user_agent_extra,
                 user_agent_appid=client_config.user_agent_appid,
                 request_min_compression_size_bytes=(
@@ -42,6 +42,7 @@ from botocore.exceptions import (
     UnsupportedSignatureVersionError,
 )
 from botocore.utils import (
+    LRUCache,
     is_valid_ipv6_endpoint_url,
     normalize_url_path,
     percent_encode_sequence,
@@ -71,6 +72,8 @@ SIGNED_HEADERS_BLACKLIST = [
 ]
 UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
 STREAMING_UNSIGNED_PAYLOAD_TRAILER = 'STREAMING-UNSIGNED-PAYLOAD-TRAILER'
+# The number of access keys the SigV4 signing key cache remembers.
+SIGNING_KEY_CACHE_SIZE = 32
 
 
 def _host_from_url(url):
@@ -105,6 +108,70 @@ def _get_body_as_dict(request):
     return data
 
 
+def _derive_signing_key(secret_key, datestamp, region_name, service_name):
+    k_date = hmac.new(
+        f"AWS4{secret_key}".encode(), datestamp.encode('utf-8'), sha256
+    ).digest()
+    k_region = hmac.new(k_date, region_name.encode('utf-8'), sha256).digest()
+    k_service = hmac.new(
+        k_region, service_name.encode('utf-8'), sha256
+    ).digest()
+    return hmac.new(k_service, b'aws4_request', sha256).digest()
+
+
+class SigningKeyCache:
+    """Thread-safe cache of derived SigV4 signing keys.
+
+    A signing key only depends on the secret key, the UTC date, the region
+    and the service, so it can be reused for every request signed with the
+    same credentials on the same day.  Entries are kept per access key and
+    remember the secret and date they were derived for.  Seeing a different
+    secret (the credentials were rotated) or a new date replaces the whole
+    entry for that access key, and the least recently used access keys are
+    evicted once ``maxsize`` is reached.
+
+    :type maxsize: int
+    :param maxsize: The maximum number of access keys to keep keys for.
+    """
+
+    def __init__(self, maxsize=SIGNING_KEY_CACHE_SIZE):
+        self._entries = LRUCache(maxsize=maxsize)
+
+    def get_signing_key(
+        self, access_key, secret_key, datestamp, region_name, service_name
+    ):
+        entry = self._entries.get(access_key)
+        if (
+            entry is None
+            or entry[1] != datestamp
+            or entry[0] != secret_key
+        ):
+            # First use, rotated credentials or a new day.  Whatever was
+            # cached for this access key can never be used again.
+            entry = (secret_key, datestamp, {})
+            self._entries.put(access_key, entry)
+        keys = entry[2]
+        scope = (region_name, service_name)
+        signing_key = keys.get(scope)
+        if signing_key is None:
+            signing_key = _derive_signing_key(
+                secret_key, datestamp, region_name, service_name
+            )
+            keys[scope] = signing_key
+        return signing_key
+
+    def evict(self, access_key):
+        """Drop every cached key derived for ``access_key``."""
+        self._entries.pop(access_key)
+
+    def clear(self):
+        self._entries.clear()
+
+    def cache_info(self):
+        """Return the ``CacheInfo`` of the per access key entries."""
+        return self._entries.cache_info()
+
+
 class BaseSigner:
     REQUIRES_REGION = False
     REQUIRES_TOKEN = False
@@ -218,6 +285,9 @@ class SigV4Auth(BaseSigner):
     """
 
     REQUIRES_REGION = True
+    # Shared by every SigV4 signer in the process.  Set to None on a class
+    # or instance to derive the signing key on every request.
+    signing_key_cache = SigningKeyCache()
 
     def __init__(self, credentials, service_name, region_name):
         self.credentials = credentials
@@ -409,14 +479,25 @@ class SigV4Auth(BaseSigner):
         sts.append(sha256(canonical_request.encode('utf-8')).hexdigest())
         return '\n'.join(sts)
 
-    def signature(self, string_to_sign, request):
-        key = self.credentials.secret_key
-        k_date = self._sign(
-            (f"AWS4{key}").encode(), request.context["timestamp"][0:8]
+    def signing_key(self, request):
+        datestamp = request.context["timestamp"][0:8]
+        if self.signing_key_cache is None:
+            return _derive_signing_key(
+                self.credentials.secret_key,
+                datestamp,
+                self._region_name,
+                self._service_name,
+            )
+        return self.signing_key_cache.get_signing_key(
+            self.credentials.access_key,
+            self.credentials.secret_key,
+            datestamp,
+            self._region_name,
+            self._service_name,
         )
-        k_region = self._sign(k_date, self._region_name)
-        k_service = self._sign(k_region, self._service_name)
-        k_signing = self._sign(k_service, 'aws4_request')
+
+    def signature(self, string_to_sign, request):
+        k_signing = self.signing_key(request)
         return self._sign(k_signing, string_to_sign, hex=True)
 
     def add_auth(self, request):
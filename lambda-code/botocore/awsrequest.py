@@ -13,11 +13,16 @@
 # language governing permissions and limitations under the License.
 import functools
 import logging
+import queue
+import threading
+import time
 from collections.abc import Mapping
 
 import urllib3.util
 from urllib3.connection import HTTPConnection, VerifiedHTTPSConnection
 from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ClosedPoolError, EmptyPoolError
+from urllib3.util.connection import is_connection_dropped
 
 import botocore.utils
 from botocore.compat import (
@@ -240,11 +245,138 @@ class AWSHTTPSConnection(AWSConnection, VerifiedHTTPSConnection):
     """An HTTPSConnection that supports 100 Continue behavior."""
 
 
-class AWSHTTPConnectionPool(HTTPConnectionPool):
+class ConnectionStats:
+    """Thread safe counters of what a connection pool did with its sockets
+
+    * ``created`` -- requests that had to open a new connection.
+    * ``reused`` -- requests sent on an already open pooled connection.
+    * ``expired`` -- pooled connections discarded because they were idle
+      for longer than the pool's ``max_idle_time``.
+    * ``dropped`` -- pooled connections discarded because the peer had
+      closed them.
+    * ``warmed`` -- connections opened ahead of time by ``warm_up()``.
+    """
+
+    FIELDS = ('created', 'reused', 'expired', 'dropped', 'warmed')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def increment(self, field, amount=1):
+        with self._lock:
+            self._counts[field] += amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+
+class AWSConnectionPoolMixin:
+    """Idle expiry, warm-up and counters for urllib3 connection pools
+
+    Connections are stamped when they are returned to the pool. One that
+    sat idle for longer than ``max_idle_time`` seconds is closed before it
+    is handed out, so a request never goes out on a socket the remote end
+    (or a NAT in between) has most likely forgotten about, for example
+    after the process was frozen for a while. Both attributes are set by
+    the owner of the pool after it is created.
+    """
+
+    max_idle_time = None
+    connection_stats = None
+
+    def _get_conn(self, timeout=None):
+        # Mirrors HTTPConnectionPool._get_conn, with the idle check and
+        # the counters added.
+        conn = None
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        try:
+            conn = self.pool.get(block=self.block, timeout=timeout)
+        except AttributeError:
+            raise ClosedPoolError(self, "Pool is closed.") from None
+        except queue.Empty:
+            if self.block:
+                raise EmptyPoolError(
+                    self,
+                    "Pool is empty and a new connection can't be opened "
+                    "due to blocking mode.",
+                ) from None
+
+        if conn is not None and conn.sock is not None:
+            if self._is_expired(conn):
+                logger.debug("Closing idle connection: %s", self.host)
+                conn.close()
+                self._count('expired')
+            elif is_connection_dropped(conn):
+                logger.debug("Resetting dropped connection: %s", self.host)
+                conn.close()
+                self._count('dropped')
+
+        if conn is None or conn.sock is None:
+            self._count('created')
+        else:
+            self._count('reused')
+        return conn or self._new_conn()
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.idle_since = time.monotonic()
+        super()._put_conn(conn)
+
+    def _is_expired(self, conn):
+        if self.max_idle_time is None:
+            return False
+        idle_since = getattr(conn, 'idle_since', None)
+        if idle_since is None:
+            return False
+        return time.monotonic() - idle_since > self.max_idle_time
+
+    def _count(self, field, amount=1):
+        if self.connection_stats is not None:
+            self.connection_stats.increment(field, amount)
+
+    def warm_up(self, connections=1):
+        """Open up to ``connections`` pooled connections ahead of time
+
+        Only free pool slots are used and this never blocks on the pool.
+        Connections that are already open count towards ``connections``.
+
+        :type connections: int
+        :param connections: The number of open connections wanted.
+
+        :rtype: int
+        :returns: The number of connections that were opened.
+        """
+        taken = []
+        opened = 0
+        try:
+            while len(taken) < connections:
+                try:
+                    conn = self.pool.get(block=False)
+                except (AttributeError, queue.Empty):
+                    break
+                if conn is None:
+                    conn = self._new_conn()
+                taken.append(conn)
+                if conn.sock is None or self._is_expired(conn):
+                    conn.close()
+                    conn.connect()
+                    opened += 1
+        finally:
+            for conn in taken:
+                self._put_conn(conn)
+            self._count('warmed', opened)
+        return opened
+
+
+class AWSHTTPConnectionPool(AWSConnectionPoolMixin, HTTPConnectionPool):
     ConnectionCls = AWSHTTPConnection
 
 
-class AWSHTTPSConnectionPool(HTTPSConnectionPool):
+class AWSHTTPSConnectionPool(AWSConnectionPoolMixin, HTTPSConnectionPool):
     ConnectionCls = AWSHTTPSConnection
 
 
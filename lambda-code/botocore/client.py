@@ -977,6 +977,26 @@ class BaseClient:
 
     @with_current_context()
     def _make_api_call(self, operation_name, api_params):
+        (
+            operation_model,
+            request_dict,
+            request_context,
+            event_response,
+        ) = self._prepare_api_call(operation_name, api_params)
+        if event_response is not None:
+            http, parsed_response = event_response
+        else:
+            http, parsed_response = self._make_request(
+                operation_model, request_dict, request_context
+            )
+        return self._handle_api_response(
+            operation_model, http, parsed_response, request_context
+        )
+
+    def _prepare_api_call(self, operation_name, api_params):
+        # Everything up to sending the request: returns the operation model,
+        # request dict and context, and the (http, parsed) response of a
+        # before-call handler if one answered the call instead.
         operation_model = self._service_model.operation_model(operation_name)
         service_name = self._service_model.service_name
         history_recorder.record(
@@ -1033,17 +1053,18 @@ class BaseClient:
             context=request_context,
         )
 
-        if event_response is not None:
-            http, parsed_response = event_response
-        else:
+        if event_response is None:
             maybe_compress_request(
                 self.meta.config, request_dict, operation_model
             )
             apply_request_checksum(request_dict)
-            http, parsed_response = self._make_request(
-                operation_model, request_dict, request_context
-            )
+        return operation_model, request_dict, request_context, event_response
 
+    def _handle_api_response(
+        self, operation_model, http, parsed_response, request_context
+    ):
+        operation_name = operation_model.name
+        service_id = self._service_model.service_id.hyphenize()
         self.meta.events.emit(
             f'after-call.{service_id}.{operation_name}',
             http_response=http,
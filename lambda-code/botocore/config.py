@@ -60,6 +60,16 @@ class Config:
         parameter validation for performance reasons.  Otherwise, it's
         recommended to leave parameter validation enabled.
 
+    :type parameter_validation_cache: bool
+    :param parameter_validation_cache: Whether the parameter validator
+        remembers the signatures (member names and value types) of
+        operation inputs that passed validation. Inputs with a known
+        signature only have their value constraints and nested members
+        checked again. Useful for clients that send the same kinds of
+        requests many times.
+
+        Defaults to None, every input is validated in full.
+
     :type max_pool_connections: int
     :param max_pool_connections: The maximum number of connections to
         keep in a connection pool.  If this value is not set, the default
@@ -210,6 +220,15 @@ class Config:
 
         Defaults to False.
 
+    :type connection_max_idle_time: float
+    :param connection_max_idle_time: The number of seconds a pooled
+        connection may sit idle before it is closed instead of being reused
+        for the next request. Useful where idle connections are dropped
+        without notice, for example by NAT gateways or while a Lambda
+        execution environment is frozen.
+
+        Defaults to None, pooled connections do not expire.
+
     :type request_min_compression_size_bytes: int
     :param request_min_compression_size_bytes: The minimum size in bytes that a
         request body should be to trigger compression. All requests with
@@ -294,6 +313,7 @@ class Config:
             ('connect_timeout', DEFAULT_TIMEOUT),
             ('read_timeout', DEFAULT_TIMEOUT),
             ('parameter_validation', True),
+            ('parameter_validation_cache', None),
             ('max_pool_connections', MAX_POOL_CONNECTIONS),
             ('proxies', None),
             ('proxies_config', None),
@@ -307,6 +327,7 @@ class Config:
             ('ignore_configured_endpoint_urls', None),
             ('defaults_mode', None),
             ('tcp_keepalive', None),
+            ('connection_max_idle_time', None),
             ('request_min_compression_size_bytes', None),
             ('disable_request_compression', None),
             ('client_context_params', None),
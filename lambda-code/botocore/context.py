@@ -30,9 +30,14 @@ class ClientContext:
     ``features`` is a set responsible for storing features used during
     preparation of an AWS request. ``botocore.useragent.register_feature_id``
     is used to add to this set.
+
+    ``streamed_members`` names the top level list members whose entries
+    the response parser should hand out incrementally instead of as lists.
+    Paginators set it when asked to stream their result keys.
     """
 
     features: set[str] = field(default_factory=set)
+    streamed_members: tuple[str, ...] = ()
 
 
 _context = ContextVar("_context")
@@ -21,6 +21,7 @@ import uuid
 
 from botocore import parsers
 from botocore.awsrequest import create_request_object
+from botocore.context import get_context
 from botocore.exceptions import HTTPClientError
 from botocore.history import get_global_history_recorder
 from botocore.hooks import first_non_none_response
@@ -239,6 +240,14 @@ class Endpoint:
         success_response, exception = self._do_get_response(
             request, operation_model, context
         )
+        self._emit_response_received(
+            operation_model, context, success_response, exception
+        )
+        return success_response, exception
+
+    def _emit_response_received(
+        self, operation_model, context, success_response, exception
+    ):
         kwargs_to_emit = {
             'response_dict': None,
             'parsed_response': None,
@@ -256,25 +265,10 @@ class Endpoint:
             f"response-received.{service_id}.{operation_model.name}",
             **kwargs_to_emit,
         )
-        return success_response, exception
 
     def _do_get_response(self, request, operation_model, context):
         try:
-            logger.debug("Sending http request: %s", request)
-            history_recorder.record(
-                'HTTP_REQUEST',
-                {
-                    'method': request.method,
-                    'headers': request.headers,
-                    'streaming': operation_model.has_streaming_input,
-                    'url': request.url,
-                    'body': request.body,
-                },
-            )
-            service_id = operation_model.service_model.service_id.hyphenize()
-            event_name = f"before-send.{service_id}.{operation_model.name}"
-            responses = self._event_emitter.emit(event_name, request=request)
-            http_response = first_non_none_response(responses)
+            http_response = self._emit_before_send(request, operation_model)
             if http_response is None:
                 http_response = self._send(request)
         except HTTPClientError as e:
@@ -284,10 +278,39 @@ class Endpoint:
                 "Exception received when sending HTTP request.", exc_info=True
             )
             return (None, e)
+        return self._parse_http_response(
+            http_response, operation_model, context
+        )
+
+    def _emit_before_send(self, request, operation_model):
+        # Returns the response of a before-send handler, if any, in which
+        # case the request is not sent.
+        logger.debug("Sending http request: %s", request)
+        history_recorder.record(
+            'HTTP_REQUEST',
+            {
+                'method': request.method,
+                'headers': request.headers,
+                'streaming': operation_model.has_streaming_input,
+                'url': request.url,
+                'body': request.body,
+            },
+        )
+        service_id = operation_model.service_model.service_id.hyphenize()
+        event_name = f"before-send.{service_id}.{operation_model.name}"
+        responses = self._event_emitter.emit(event_name, request=request)
+        return first_non_none_response(responses)
+
+    def _parse_http_response(self, http_response, operation_model, context):
         # This returns the http_response and the parsed_data.
         response_dict = convert_to_response_dict(
             http_response, operation_model
         )
+        client_context = get_context()
+        if client_context is not None and client_context.streamed_members:
+            response_dict['context']['streamed_members'] = (
+                client_context.streamed_members
+            )
         handle_checksum_body(
             http_response,
             response_dict,
@@ -301,6 +324,7 @@ class Endpoint:
         )
         history_recorder.record('HTTP_RESPONSE', http_response_record_dict)
 
+        service_id = operation_model.service_model.service_id.hyphenize()
         protocol = operation_model.service_model.resolved_protocol
         customized_response_dict = {}
         self._event_emitter.emit(
@@ -355,6 +379,27 @@ class Endpoint:
         response=None,
         caught_exception=None,
     ):
+        retry_delay = self._get_retry_delay(
+            attempts, operation_model, request_dict, response, caught_exception
+        )
+        if retry_delay is None:
+            return False
+        else:
+            # Request needs to be retried, and we need to sleep
+            # for the specified number of times.
+            time.sleep(retry_delay)
+            return True
+
+    def _get_retry_delay(
+        self,
+        attempts,
+        operation_model,
+        request_dict,
+        response=None,
+        caught_exception=None,
+    ):
+        # Returns the seconds to wait before retrying the request, or None
+        # if it should not be retried.
         service_id = operation_model.service_model.service_id.hyphenize()
         event_name = f"needs-retry.{service_id}.{operation_model.name}"
         responses = self._event_emitter.emit(
@@ -367,17 +412,12 @@ class Endpoint:
             request_dict=request_dict,
         )
         handler_response = first_non_none_response(responses)
-        if handler_response is None:
-            return False
-        else:
-            # Request needs to be retried, and we need to sleep
-            # for the specified number of times.
+        if handler_response is not None:
             logger.debug(
                 "Response received to retry, sleeping for %s seconds",
                 handler_response,
             )
-            time.sleep(handler_response)
-            return True
+        return handler_response
 
     def _send(self, request):
         return self.http_session.send(request)
@@ -401,6 +441,7 @@ class EndpointCreator:
         socket_options=None,
         client_cert=None,
         proxies_config=None,
+        max_idle_time=None,
     ):
         if not is_valid_endpoint_url(
             endpoint_url
@@ -412,6 +453,11 @@ class EndpointCreator:
         endpoint_prefix = service_model.endpoint_prefix
 
         logger.debug('Setting %s timeout as %s', endpoint_prefix, timeout)
+        http_session_kwargs = {}
+        if max_idle_time is not None:
+            # Only passed when set, so custom session classes without
+            # support for it keep working.
+            http_session_kwargs['max_idle_time'] = max_idle_time
         http_session = http_session_cls(
             timeout=timeout,
             proxies=proxies,
@@ -420,6 +466,7 @@ class EndpointCreator:
             socket_options=socket_options,
             client_cert=client_cert,
             proxies_config=proxies_config,
+            **http_session_kwargs,
         )
 
         return Endpoint(
@@ -32,9 +32,9 @@ from botocore.exceptions import EndpointResolutionError
 from botocore.utils import (
     ArnParser,
     InvalidArnException,
+    LRUCache,
     is_valid_ipv4_endpoint_url,
     is_valid_ipv6_endpoint_url,
-    lru_cache_weakref,
     normalize_url_path,
     percent_encode,
 )
@@ -659,6 +659,7 @@ class RuleSet:
         self.rules = [RuleCreator.create(**rule) for rule in rules]
         self.rule_lib = RuleSetStandardLibrary(partitions)
         self.documentation = documentation
+        self._compiled_rules = None
 
     def _ingest_parameter_spec(self, parameters):
         return {
@@ -685,12 +686,25 @@ class RuleSet:
                 input_params[name] = value
         return None
 
+    def compile(self):
+        """Compile the rule tree into closures used by ``evaluate``."""
+        if self._compiled_rules is None:
+            compiler = RuleSetCompiler(self.rule_lib)
+            self._compiled_rules = compiler.compile_rules(self.rules)
+        return None
+
+    @property
+    def is_compiled(self):
+        return self._compiled_rules is not None
+
     def evaluate(self, input_parameters):
         """Evaluate input parameters against rules returning first match.
 
         :type input_parameters: dict
         """
         self.process_input_parameters(input_parameters)
+        if self._compiled_rules is not None:
+            return self._compiled_rules(input_parameters)
         for rule in self.rules:
             evaluation = rule.evaluate(input_parameters.copy(), self.rule_lib)
             if evaluation is not None:
@@ -698,19 +712,252 @@ class RuleSet:
         return None
 
 
+class RuleSetCompiler:
+    """Compiles a tree of rules into nested closures.
+
+    Evaluating the rule objects re-inspects every argument (function,
+    reference or template?), re-parses template strings and looks up
+    library functions by name on each call.  The compiler does all of that
+    once, so evaluating a compiled rule only calls the resolved library
+    functions.  Compiled rules behave exactly like ``BaseRule.evaluate``.
+    """
+
+    def __init__(self, rule_lib):
+        self._rule_lib = rule_lib
+
+    def compile_rules(self, rules):
+        """Compile a list of top level rules.
+
+        :type rules: list
+        :rtype: callable(input_parameters) -> RuleSetEndpoint or None
+        """
+        compiled_rules = [self.compile_rule(rule) for rule in rules]
+
+        def evaluate(input_parameters):
+            for rule in compiled_rules:
+                evaluation = rule(input_parameters.copy())
+                if evaluation is not None:
+                    return evaluation
+            return None
+
+        return evaluate
+
+    def compile_rule(self, rule):
+        """Compile a single rule into a callable taking ``scope_vars``."""
+        if isinstance(rule, TreeRule):
+            return self._compile_tree_rule(rule)
+        elif isinstance(rule, EndpointRule):
+            return self._compile_endpoint_rule(rule)
+        elif isinstance(rule, ErrorRule):
+            return self._compile_error_rule(rule)
+
+        rule_lib = self._rule_lib
+        return lambda scope_vars: rule.evaluate(scope_vars, rule_lib)
+
+    def compile_value(self, value):
+        """Compile an argument the way ``resolve_value`` would resolve it."""
+        rule_lib = self._rule_lib
+        if rule_lib.is_func(value):
+            return self.compile_function(value)
+        elif rule_lib.is_ref(value):
+            name = value["ref"]
+            return lambda scope_vars: scope_vars.get(name)
+        elif rule_lib.is_template(value):
+            return self.compile_template(value)
+        return lambda scope_vars: value
+
+    def compile_template(self, value):
+        """Pre-parse a template string into literal and reference parts."""
+        parts = [
+            (literal, None if reference is None else reference.split("#"))
+            for literal, reference, _, _ in STRING_FORMATTER.parse(value)
+        ]
+
+        def resolve(scope_vars):
+            result = ""
+            for literal, params in parts:
+                if params is None:
+                    result += literal
+                else:
+                    template_value = scope_vars
+                    for param in params:
+                        template_value = template_value[param]
+                    result += f"{literal}{template_value}"
+            return result
+
+        return resolve
+
+    def compile_function(self, func_signature):
+        """Bind a function call to its library method and compiled args."""
+        rule_lib = self._rule_lib
+        args = [self.compile_value(arg) for arg in func_signature["argv"]]
+        func_name = rule_lib.convert_func_name(func_signature["fn"])
+        # Unknown functions keep failing lazily, only if they're reached.
+        func = getattr(rule_lib, func_name, None)
+        assign = func_signature.get("assign")
+
+        def call(scope_vars):
+            func_args = [arg(scope_vars) for arg in args]
+            if func is None:
+                result = getattr(rule_lib, func_name)(*func_args)
+            else:
+                result = func(*func_args)
+            if assign is not None:
+                if assign in scope_vars:
+                    raise EndpointResolutionError(
+                        msg=f"Assignment {assign} already exists in "
+                        "scoped variables and cannot be overwritten"
+                    )
+                scope_vars[assign] = result
+            return result
+
+        return call
+
+    def compile_conditions(self, conditions):
+        compiled = [self.compile_function(cond) for cond in conditions]
+
+        def evaluate_conditions(scope_vars):
+            for condition in compiled:
+                result = condition(scope_vars)
+                if result is False or result is None:
+                    return False
+            return True
+
+        return evaluate_conditions
+
+    def compile_properties(self, properties):
+        """Compile ``properties`` the way ``resolve_properties`` walks them."""
+        if isinstance(properties, list):
+            items = [self.compile_properties(prop) for prop in properties]
+            return lambda scope_vars: [item(scope_vars) for item in items]
+        elif isinstance(properties, dict):
+            items = [
+                (key, self.compile_properties(value))
+                for key, value in properties.items()
+            ]
+            return lambda scope_vars: {
+                key: item(scope_vars) for key, item in items
+            }
+        elif self._rule_lib.is_template(properties):
+            return self.compile_template(properties)
+        return lambda scope_vars: properties
+
+    def _compile_endpoint_rule(self, rule):
+        conditions = self.compile_conditions(rule.conditions)
+        url = self.compile_value(rule.endpoint["url"])
+        properties = self.compile_properties(
+            rule.endpoint.get("properties", {})
+        )
+        headers = [
+            (header, [self.compile_value(item) for item in values])
+            for header, values in rule.endpoint.get("headers", {}).items()
+        ]
+
+        def evaluate(scope_vars):
+            if not conditions(scope_vars):
+                return None
+            return RuleSetEndpoint(
+                url=url(scope_vars),
+                properties=properties(scope_vars),
+                headers={
+                    header: [item(scope_vars) for item in values]
+                    for header, values in headers
+                },
+            )
+
+        return evaluate
+
+    def _compile_error_rule(self, rule):
+        conditions = self.compile_conditions(rule.conditions)
+        error = self.compile_value(rule.error)
+
+        def evaluate(scope_vars):
+            if conditions(scope_vars):
+                raise EndpointResolutionError(msg=error(scope_vars))
+            return None
+
+        return evaluate
+
+    def _compile_tree_rule(self, rule):
+        conditions = self.compile_conditions(rule.conditions)
+        sub_rules = [self.compile_rule(sub_rule) for sub_rule in rule.rules]
+
+        def evaluate(scope_vars):
+            if conditions(scope_vars):
+                for sub_rule in sub_rules:
+                    # don't share scope_vars between rules
+                    rule_result = sub_rule(scope_vars.copy())
+                    if rule_result:
+                        return rule_result
+            return None
+
+        return evaluate
+
+
 class EndpointProvider:
-    """Derives endpoints from a RuleSet for given input parameters."""
+    """Derives endpoints from a RuleSet for given input parameters.
+
+    Resolved endpoints are kept in a per-provider LRU cache keyed on the
+    normalized input parameters (``None`` values dropped, parameter
+    defaults applied, lists converted to tuples), so repeated calls
+    against the same bucket or table skip rule evaluation entirely.
+    Hit and miss counts are available through ``cache_info``.
+    """
 
-    def __init__(self, ruleset_data, partition_data):
+    # Compile rulesets into closures when providers are created.  This
+    # makes cache misses cheaper at the cost of extra work up front.
+    COMPILE_RULES = False
+
+    def __init__(
+        self,
+        ruleset_data,
+        partition_data,
+        cache_size=CACHE_SIZE,
+        compile_rules=None,
+    ):
         self.ruleset = RuleSet(**ruleset_data, partitions=partition_data)
+        self._cache = LRUCache(maxsize=cache_size)
+        if compile_rules is None:
+            compile_rules = self.COMPILE_RULES
+        if compile_rules:
+            self.ruleset.compile()
+
+    def cache_info(self):
+        """Return the endpoint cache's ``CacheInfo`` statistics."""
+        return self._cache.cache_info()
+
+    def _cache_key(self, input_parameters):
+        normalized = {
+            name: value
+            for name, value in input_parameters.items()
+            if value is not None
+        }
+        for name, spec in self.ruleset.parameters.items():
+            if name not in normalized and spec.default is not None:
+                normalized[name] = spec.default
+        key = tuple(sorted(normalized.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
-    @lru_cache_weakref(maxsize=CACHE_SIZE)
     def resolve_endpoint(self, **input_parameters):
         """Match input parameters to a rule.
 
         :type input_parameters: dict
         :rtype: RuleSetEndpoint
         """
+        for name, value in input_parameters.items():
+            if isinstance(value, list):
+                input_parameters[name] = tuple(value)
+
+        cache_key = self._cache_key(input_parameters)
+        if cache_key is not None:
+            endpoint = self._cache.get(cache_key)
+            if endpoint is not None:
+                return endpoint
+
         params_for_error = input_parameters.copy()
         endpoint = self.ruleset.evaluate(input_parameters)
         if endpoint is None:
@@ -720,4 +967,6 @@ class EndpointProvider:
             raise EndpointResolutionError(
                 msg=f"No endpoint found for parameters:\n{param_string}"
             )
+        if cache_key is not None:
+            self._cache.put(cache_key, endpoint)
         return endpoint
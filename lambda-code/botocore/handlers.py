@@ -18,6 +18,7 @@ This module contains builtin handlers for events emitted by botocore.
 
 import base64
 import copy
+import functools
 import logging
 import os
 import re
@@ -52,6 +53,7 @@ from botocore.exceptions import (
     ParamValidationError,
     UnsupportedTLSVersionWarning,
 )
+from botocore.parsers import StreamedEntries
 from botocore.regions import EndpointResolverBuiltins
 from botocore.signers import (
     add_dsql_generate_db_auth_token_methods,
@@ -853,18 +855,43 @@ def decode_list_object_versions(parsed, context, **kwargs):
 
 
 def _decode_list_object(top_level_keys, nested_keys, parsed, context):
-    if parsed.get('EncodingType') == 'url' and context.get(
-        'encoding_type_auto_set'
-    ):
+    if not context.get('encoding_type_auto_set'):
+        return
+    # Paginators streaming the entries hand out pages that are only parsed
+    # up to their first entry, see botocore.parsers.StreamedEntries.
+    streams = [
+        parsed[top_key]
+        for top_key, _ in nested_keys
+        if isinstance(parsed.get(top_key), StreamedEntries)
+    ]
+    if streams and 'EncodingType' not in parsed:
+        # The encoding type comes after the entries, the page has to be
+        # parsed to know whether they need decoding.
+        streams[0].finish()
+    if parsed.get('EncodingType') == 'url':
         # URL decode top-level keys in the response if present.
         for key in top_level_keys:
             if key in parsed:
                 parsed[key] = unquote_str(parsed[key])
+            if streams:
+                streams[0].add_member_transform(key, unquote_str)
         # URL decode nested keys from the response if present.
         for top_key, child_key in nested_keys:
-            if top_key in parsed:
-                for member in parsed[top_key]:
-                    member[child_key] = unquote_str(member[child_key])
+            if top_key not in parsed:
+                continue
+            members = parsed[top_key]
+            if isinstance(members, StreamedEntries):
+                members.add_entry_transform(
+                    functools.partial(_decode_list_entry, child_key)
+                )
+                continue
+            for member in members:
+                _decode_list_entry(child_key, member)
+
+
+def _decode_list_entry(child_key, member):
+    member[child_key] = unquote_str(member[child_key])
+    return member
 
 
 def convert_body_to_file_like_object(params, **kwargs):
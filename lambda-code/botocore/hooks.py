@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 
 _NodeList = namedtuple('NodeList', ['first', 'middle', 'last'])
+EmitStats = namedtuple(
+    'EmitStats', ['emits', 'cache_hits', 'cache_misses', 'cached_events']
+)
 _FIRST = 0
 _MIDDLE = 1
 _LAST = 2
@@ -195,12 +198,19 @@ class HierarchicalEmitter(BaseEventHooks):
     def __init__(self):
         # We keep a reference to the handlers for quick
         # read only access (we never modify self._handlers).
-        # A cache of event name to handler list.
+        # A cache of event name to the frozen tuple of handlers to call,
+        # compiled from the prefix trie on first emit.  Registrations stop
+        # once a client is created, so after warm up every emit is a single
+        # dict lookup.  Any register/unregister drops the whole cache.
         self._lookup_cache = {}
         self._handlers = _PrefixTrie()
         # This is used to ensure that unique_id's are only
         # registered once.
         self._unique_id_handlers = {}
+        # Counters for emit_stats().  These are best effort and are not
+        # synchronized across threads.
+        self._emit_count = 0
+        self._cache_hits = 0
 
     def _emit(self, event_name, kwargs, stop_on_response=False):
         """
@@ -220,28 +230,49 @@ class HierarchicalEmitter(BaseEventHooks):
         :return: List of (handler, response) tuples from all processed
                  handlers.
         """
-        responses = []
+        self._emit_count += 1
         # Invoke the event handlers from most specific
         # to least specific, each time stripping off a dot.
         handlers_to_call = self._lookup_cache.get(event_name)
         if handlers_to_call is None:
-            handlers_to_call = self._handlers.prefix_search(event_name)
+            handlers_to_call = tuple(self._handlers.prefix_search(event_name))
             self._lookup_cache[event_name] = handlers_to_call
-        elif not handlers_to_call:
+        else:
+            self._cache_hits += 1
+        if not handlers_to_call:
             # Short circuit and return an empty response is we have
             # no handlers to call.  This is the common case where
             # for the majority of signals, nothing is listening.
             return []
         kwargs['event_name'] = event_name
         responses = []
+        debug = logger.isEnabledFor(logging.DEBUG)
         for handler in handlers_to_call:
-            logger.debug('Event %s: calling handler %s', event_name, handler)
+            if debug:
+                logger.debug(
+                    'Event %s: calling handler %s', event_name, handler
+                )
             response = handler(**kwargs)
             responses.append((handler, response))
             if stop_on_response and response is not None:
                 return responses
         return responses
 
+    def emit_stats(self):
+        """Return emit counters for this emitter.
+
+        :rtype: EmitStats
+        :return: A ``(emits, cache_hits, cache_misses, cached_events)``
+            named tuple.  ``cached_events`` is the number of event names
+            with a compiled handler tuple.
+        """
+        return EmitStats(
+            self._emit_count,
+            self._cache_hits,
+            self._emit_count - self._cache_hits,
+            len(self._lookup_cache),
+        )
+
     def emit(self, event_name, **kwargs):
         """
         Emit an event by name with arguments passed as keyword args.
@@ -395,6 +426,11 @@ class HierarchicalEmitter(BaseEventHooks):
         new_state = self.__dict__.copy()
         new_state['_handlers'] = copy.copy(self._handlers)
         new_state['_unique_id_handlers'] = copy.copy(self._unique_id_handlers)
+        # The copy diverges as soon as either side registers a handler, so
+        # it compiles its own lookup cache and counts its own emits.
+        new_state['_lookup_cache'] = {}
+        new_state['_emit_count'] = 0
+        new_state['_cache_hits'] = 0
         new_instance.__dict__ = new_state
         return new_instance
 
@@ -3,6 +3,7 @@ import os
 import os.path
 import socket
 import sys
+import threading
 import warnings
 from base64 import b64encode
 
@@ -293,6 +294,7 @@ class URLLib3Session:
         socket_options=None,
         client_cert=None,
         proxies_config=None,
+        max_idle_time=None,
     ):
         self._verify = verify
         self._proxy_config = ProxyConfiguration(
@@ -319,6 +321,9 @@ class URLLib3Session:
         self._socket_options = socket_options
         if socket_options is None:
             self._socket_options = []
+        self._max_idle_time = max_idle_time
+        self._connection_stats = {}
+        self._connection_stats_lock = threading.Lock()
         self._proxy_managers = {}
         self._manager = PoolManager(**self._get_pool_manager_kwargs())
         self._manager.pool_classes_by_scheme = self._pool_classes_by_scheme
@@ -414,6 +419,65 @@ class URLLib3Session:
             manager = self._manager
         return manager
 
+    def _get_connection_pool(self, url, proxy_url=None):
+        manager = self._get_connection_manager(url, proxy_url)
+        conn = manager.connection_from_url(url)
+        if getattr(conn, 'connection_stats', False) is None:
+            # Pools are created lazily by the pool manager (and recreated
+            # when it evicts them), the counters are kept per host here.
+            conn.connection_stats = self._get_connection_stats(conn)
+            conn.max_idle_time = self._max_idle_time
+        return conn
+
+    def _get_connection_stats(self, conn):
+        host = f'{conn.scheme}://{conn.host}:{conn.port}'
+        with self._connection_stats_lock:
+            if host not in self._connection_stats:
+                self._connection_stats[host] = (
+                    botocore.awsrequest.ConnectionStats()
+                )
+            return self._connection_stats[host]
+
+    def connection_stats(self):
+        """Connection counters of every host this session talked to
+
+        :rtype: dict
+        :returns: A dict mapping ``scheme://host:port`` to a dict with the
+            ``created``, ``reused``, ``expired``, ``dropped`` and ``warmed``
+            counts of its connection pool.
+        """
+        with self._connection_stats_lock:
+            stats = list(self._connection_stats.items())
+        return {host: counters.snapshot() for host, counters in stats}
+
+    def warm_up(self, url, connections=1):
+        """Open connections to the host of ``url`` ahead of the first request
+
+        This moves the TCP (and TLS) handshakes out of the latency of the
+        first requests. Failures are logged and otherwise ignored, the
+        request that needs the connection will simply open it again.
+
+        :type url: str
+        :param url: Any URL on the host to connect to.
+
+        :type connections: int
+        :param connections: The number of connections to open, capped by
+            the size of the connection pool.
+
+        :rtype: int
+        :returns: The number of connections that were opened.
+        """
+        try:
+            proxy_url = self._proxy_config.proxy_url_for(url)
+            conn = self._get_connection_pool(url, proxy_url)
+            self._setup_ssl_cert(conn, url, self._verify)
+            return conn.warm_up(connections)
+        except Exception:
+            logger.debug(
+                'Unable to warm up connections to %s', url, exc_info=True
+            )
+            return 0
+
     def _get_request_target(self, url, proxy_url):
         has_proxy = proxy_url is not None
 
@@ -447,8 +511,7 @@ class URLLib3Session:
     def send(self, request):
         try:
             proxy_url = self._proxy_config.proxy_url_for(request.url)
-            manager = self._get_connection_manager(request.url, proxy_url)
-            conn = manager.connection_from_url(request.url)
+            conn = self._get_connection_pool(request.url, proxy_url)
             self._setup_ssl_cert(conn, request.url, self._verify)
             if ensure_boolean(
                 os.environ.get('BOTO_EXPERIMENTAL__ADD_PROXY_HOST_HEADER', '')
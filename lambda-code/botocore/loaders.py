@@ -100,12 +100,40 @@ applied to the model after it is loaded. Data in these files might represent
 information that doesn't quite fit in the original models, but is still needed
 for the sdk. For instance, additional operation parameters might be added here
 which don't represent the actual service api.
+
+
+Precompiled Model Cache
+=======================
+
+Decompressing and parsing the JSON models is a noticeable part of client
+creation.  ``Loader.load_service_model`` can instead read a precompiled
+snapshot of the fully merged model (service model plus extras) from a
+``ModelCache`` directory.  Each snapshot records the botocore version and a
+fingerprint (name, size and CRC32) of every source file it was built from;
+if any of these no longer match, the snapshot is ignored and the model is
+loaded from the JSON files as usual.  Content checksums are used rather than
+mtimes because zip based deployment packages do not reliably preserve them.
+
+Snapshots are produced ahead of time with ``build_model_cache``, typically
+as part of building a deployment package.  If the ``model-cache`` directory
+next to the ``data`` directory exists, it is used automatically.
+
+``build_model_cache`` also stores the parsed ASTs of the JMESPath
+expressions used by the precompiled paginators and waiters.  They are
+loaded into the JMESPath expression cache the first time a paginator or
+waiter model is read from the cache, so creating a paginator or waiter
+does not lex and parse its expressions again.
 """
 
 import logging
+import marshal
 import os
+import zlib
+
+import jmespath
+from jmespath.parser import Parser as JMESPathParser
 
-from botocore import BOTOCORE_ROOT
+from botocore import BOTOCORE_ROOT, __version__ as botocore_version
 from botocore.compat import HAS_GZIP, OrderedDict, json
 from botocore.exceptions import DataNotFoundError, UnknownServiceError
 from botocore.utils import deep_merge
@@ -197,6 +225,196 @@ class JSONFileLoader:
                 return data
         return None
 
+    def find_file(self, file_path):
+        """Find the file that ``load_file`` would load.
+
+        :type file_path: str
+        :param file_path: The full path to the file without
+            the '.json' extension.
+
+        :return: The full path including the extension, or None.
+
+        """
+        for ext in _JSON_OPEN_METHODS:
+            if os.path.isfile(file_path + ext):
+                return file_path + ext
+        return None
+
+
+def _to_plain_types(value):
+    # marshal only handles the exact builtin containers.  Plain dicts keep
+    # insertion order, so nothing is lost by dropping OrderedDict.
+    if isinstance(value, dict):
+        return {k: _to_plain_types(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_plain_types(v) for v in value]
+    return value
+
+
+class ModelCache:
+    """On-disk cache of precompiled (marshalled) service models.
+
+    Snapshots are stored as ``<root>/<service>/<api_version>/<type>.marshal``
+    and are only returned if they were built by the running botocore
+    version from source files with an identical fingerprint.
+
+    """
+
+    FORMAT_VERSION = 1
+    EXTENSION = '.marshal'
+    JMESPATH_SNAPSHOT = 'jmespath'
+    # Model types whose JMESPath expressions are included in the snapshot.
+    JMESPATH_TYPES = ('paginators-1', 'waiters-2')
+
+    def __init__(self, root):
+        self._root = root
+        self._jmespath_loaded = False
+
+    @property
+    def root(self):
+        return self._root
+
+    def fingerprint(self, source_paths):
+        """Compute the fingerprint of a list of source files.
+
+        :type source_paths: list
+        :param source_paths: Full paths of the files a model is built from.
+
+        :return: A tuple of ``(basename, size, crc32)`` tuples.
+
+        """
+        parts = []
+        for path in source_paths:
+            with open(path, 'rb') as fp:
+                raw = fp.read()
+            parts.append((os.path.basename(path), len(raw), zlib.crc32(raw)))
+        return tuple(parts)
+
+    def _cache_path(self, name):
+        return os.path.join(self._root, name + self.EXTENSION)
+
+    def load(self, name, source_paths):
+        """Load a cached model.
+
+        :type name: str
+        :param name: The data path, i.e ``s3/2006-03-01/service-2``.
+
+        :type source_paths: list
+        :param source_paths: Full paths of the files the model is built from.
+
+        :return: The cached model, or None if there is no valid snapshot.
+
+        """
+        cache_path = self._cache_path(name)
+        if not os.path.isfile(cache_path):
+            return None
+        try:
+            # marshal.loads() on the whole buffer is several times faster
+            # than marshal.load() reading through the file object.
+            with open(cache_path, 'rb') as fp:
+                entry = marshal.loads(fp.read())
+            format_version, version, fingerprint, model = entry
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug("Ignoring unreadable model cache %s: %s", cache_path, e)
+            return None
+        if (
+            format_version != self.FORMAT_VERSION
+            or version != botocore_version
+            or fingerprint != self.fingerprint(source_paths)
+        ):
+            logger.debug("Ignoring stale model cache: %s", cache_path)
+            return None
+        logger.debug("Loading precompiled model: %s", cache_path)
+        return model
+
+    def store(self, name, source_paths, model):
+        """Write a model snapshot.
+
+        :type name: str
+        :param name: The data path, i.e ``s3/2006-03-01/service-2``.
+
+        :type source_paths: list
+        :param source_paths: Full paths of the files the model is built from.
+
+        :type model: dict
+        :param model: The fully merged model to snapshot.
+
+        :return: The path of the written snapshot.
+
+        """
+        cache_path = self._cache_path(name)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        entry = (
+            self.FORMAT_VERSION,
+            botocore_version,
+            self.fingerprint(source_paths),
+            _to_plain_types(model),
+        )
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as fp:
+            marshal.dump(entry, fp)
+        os.replace(tmp_path, cache_path)
+        return cache_path
+
+    def store_jmespath_snapshot(self, expressions):
+        """Parse and store a snapshot of JMESPath expressions.
+
+        :type expressions: iterable of str
+        :param expressions: The expressions to parse.
+
+        :return: The path of the written snapshot.
+
+        """
+        cache_path = self._cache_path(self.JMESPATH_SNAPSHOT)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        entry = (
+            self.FORMAT_VERSION,
+            botocore_version,
+            jmespath.__version__,
+            JMESPathParser.snapshot(sorted(set(expressions))),
+        )
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as fp:
+            marshal.dump(entry, fp)
+        os.replace(tmp_path, cache_path)
+        return cache_path
+
+    def load_jmespath_snapshot(self):
+        """Load the JMESPath snapshot into the expression cache.
+
+        Only the first call reads the snapshot, later calls are no-ops.
+
+        :return: The number of expressions loaded.
+
+        """
+        if self._jmespath_loaded:
+            return 0
+        self._jmespath_loaded = True
+        cache_path = self._cache_path(self.JMESPATH_SNAPSHOT)
+        if not os.path.isfile(cache_path):
+            return 0
+        try:
+            with open(cache_path, 'rb') as fp:
+                entry = marshal.loads(fp.read())
+            format_version, version, jmespath_version, snapshot = entry
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug("Ignoring unreadable JMESPath snapshot: %s", e)
+            return 0
+        if (
+            format_version != self.FORMAT_VERSION
+            or version != botocore_version
+            or jmespath_version != jmespath.__version__
+        ):
+            logger.debug("Ignoring stale JMESPath snapshot: %s", cache_path)
+            return 0
+        JMESPathParser.load_snapshot(snapshot)
+        logger.debug(
+            "Loaded %s parsed JMESPath expressions from %s",
+            len(snapshot),
+            cache_path,
+        )
+        return len(snapshot)
+
 
 def create_loader(search_path_string=None):
     """Create a Loader class.
@@ -240,6 +458,8 @@ class Loader:
         os.path.expanduser('~'), '.aws', 'models'
     )
     BUILTIN_EXTRAS_TYPES = ['sdk']
+    # Precompiled model snapshots produced by ``build_model_cache``.
+    BUILTIN_MODEL_CACHE_PATH = os.path.join(BOTOCORE_ROOT, 'model-cache')
 
     def __init__(
         self,
@@ -248,11 +468,18 @@ class Loader:
         cache=None,
         include_default_search_paths=True,
         include_default_extras=True,
+        model_cache=None,
     ):
         self._cache = {}
         if file_loader is None:
             file_loader = self.FILE_LOADER_CLASS()
         self.file_loader = file_loader
+        if model_cache is None and os.path.isdir(
+            self.BUILTIN_MODEL_CACHE_PATH
+        ):
+            model_cache = ModelCache(self.BUILTIN_MODEL_CACHE_PATH)
+        # ``model_cache=False`` explicitly disables the builtin cache.
+        self._model_cache = model_cache or None
         if extra_search_paths is not None:
             self._search_paths = extra_search_paths
         else:
@@ -276,6 +503,10 @@ class Loader:
     def extras_types(self):
         return self._extras_types
 
+    @property
+    def model_cache(self):
+        return self._model_cache
+
     @instance_cache
     def list_available_services(self, type_name):
         """List all known services.
@@ -415,6 +646,18 @@ class Loader:
                 service_name, type_name
             )
         full_path = os.path.join(service_name, api_version, type_name)
+
+        if self._model_cache is not None:
+            source_paths = self._find_model_sources(
+                service_name, type_name, api_version
+            )
+            if source_paths:
+                model = self._model_cache.load(full_path, source_paths)
+                if model is not None:
+                    if type_name in self._model_cache.JMESPATH_TYPES:
+                        self._model_cache.load_jmespath_snapshot()
+                    return model
+
         model = self.load_data(full_path)
 
         # Load in all the extras
@@ -423,6 +666,28 @@ class Loader:
 
         return model
 
+    def _find_model_sources(self, service_name, type_name, api_version):
+        """Find the files ``load_service_model`` would build a model from.
+
+        Returns an empty list if the files can't be determined, i.e. when
+        a custom file loader is used.
+        """
+        if not hasattr(self.file_loader, 'find_file'):
+            return []
+        names = [os.path.join(service_name, api_version, type_name)]
+        for extras_type in self.extras_types:
+            extras_name = f'{type_name}.{extras_type}-extras'
+            names.append(os.path.join(service_name, api_version, extras_name))
+
+        source_paths = []
+        for name in names:
+            for possible_path in self._potential_locations(name):
+                found = self.file_loader.find_file(possible_path)
+                if found is not None:
+                    source_paths.append(found)
+                    break
+        return source_paths
+
     def _find_extras(self, service_name, type_name, api_version):
         """Creates an iterator over all the extras data."""
         for extras_type in self.extras_types:
@@ -504,6 +769,88 @@ class Loader:
         return path.startswith(self.BUILTIN_DATA_PATH)
 
 
+def build_model_cache(
+    service_names,
+    cache_path=None,
+    loader=None,
+    type_names=(
+        'service-2',
+        'endpoint-rule-set-1',
+        'paginators-1',
+        'waiters-2',
+    ),
+):
+    """Precompile service models into a ``ModelCache``.
+
+    :type service_names: list
+    :param service_names: The services to precompile, i.e ``['s3']``.
+
+    :type cache_path: str
+    :param cache_path: The cache directory.  Defaults to
+        ``Loader.BUILTIN_MODEL_CACHE_PATH``.
+
+    :type loader: Loader
+    :param loader: The loader used to read the source models.
+
+    :type type_names: iterable of str
+    :param type_names: The model types to precompile.  Types a service
+        does not have are skipped.
+
+    :return: A list of the written snapshot paths.
+
+    """
+    if cache_path is None:
+        cache_path = Loader.BUILTIN_MODEL_CACHE_PATH
+    if loader is None:
+        # Build from the JSON sources, never from an existing snapshot.
+        loader = Loader(model_cache=False)
+    model_cache = ModelCache(cache_path)
+
+    written = []
+    expressions = set()
+    for service_name in service_names:
+        for type_name in type_names:
+            try:
+                api_version = loader.determine_latest_version(
+                    service_name, type_name
+                )
+            except DataNotFoundError:
+                continue
+            source_paths = loader._find_model_sources(
+                service_name, type_name, api_version
+            )
+            model = loader.load_service_model(
+                service_name, type_name, api_version
+            )
+            name = os.path.join(service_name, api_version, type_name)
+            written.append(model_cache.store(name, source_paths, model))
+            if type_name in model_cache.JMESPATH_TYPES:
+                expressions.update(_jmespath_expressions(model))
+    if expressions:
+        written.append(model_cache.store_jmespath_snapshot(expressions))
+    return written
+
+
+def _jmespath_expressions(model):
+    """Yield the JMESPath expressions of a paginators or waiters model.
+
+    These are the keys ``botocore.paginate`` and ``botocore.waiter`` pass
+    to ``jmespath.compile``.
+    """
+    for config in model.get('pagination', {}).values():
+        for key in ('output_token', 'result_key', 'non_aggregate_keys'):
+            value = config.get(key, [])
+            if isinstance(value, str):
+                value = [value]
+            yield from value
+        if 'more_results' in config:
+            yield config['more_results']
+    for config in model.get('waiters', {}).values():
+        for acceptor in config.get('acceptors', []):
+            if acceptor.get('matcher', '').startswith('path'):
+                yield acceptor['argument']
+
+
 class ExtrasProcessor:
     """Processes data from extras files into service models."""
 
@@ -282,6 +282,117 @@ class StringShape(Shape):
         return self.metadata.get('enum', [])
 
 
+class FrozenShape(Shape):
+    """A read-only shape with every attribute resolved up front.
+
+    Frozen shapes are created by a ``FrozenShapeResolver`` (see
+    ``ServiceModel.freeze``), which resolves the shapes a frozen shape
+    refers to ahead of time, so a shape graph is built once and shared by
+    every lookup. Their attributes are plain values computed once instead
+    of cached properties. They are stored in the slots the frozen classes
+    declare, but ``Shape`` itself has no ``__slots__``, so instances still
+    have a ``__dict__``.
+
+    """
+
+    __slots__ = (
+        'name',
+        'type_name',
+        'documentation',
+        'serialization',
+        'metadata',
+        'required_members',
+    )
+
+    def __init__(self, shape):
+        """
+
+        :type shape: botocore.model.Shape
+        :param shape: The shape to freeze.
+
+        """
+        set_attr = object.__setattr__
+        set_attr(self, 'name', shape.name)
+        set_attr(self, 'type_name', shape.type_name)
+        set_attr(self, 'documentation', shape.documentation)
+        set_attr(self, 'serialization', shape.serialization)
+        set_attr(self, 'metadata', shape.metadata)
+        set_attr(self, 'required_members', shape.required_members)
+
+    def _resolve_references(self, shape, resolver):
+        # Called once the shape can be found by the resolver, so shapes
+        # that refer back to it get this object.
+        pass
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self!r} is frozen, can't set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self!r} is frozen, can't delete {name!r}")
+
+
+class FrozenStructureShape(FrozenShape, StructureShape):
+    __slots__ = (
+        'members',
+        'event_stream_name',
+        'error_code',
+        'is_document_type',
+        'is_tagged_union',
+    )
+
+    def __init__(self, shape):
+        super().__init__(shape)
+        set_attr = object.__setattr__
+        set_attr(self, 'error_code', shape.error_code)
+        set_attr(self, 'is_document_type', shape.is_document_type)
+        set_attr(self, 'is_tagged_union', shape.is_tagged_union)
+
+    def _resolve_references(self, shape, resolver):
+        members = self.MAP_TYPE()
+        event_stream_name = None
+        for name, shape_ref in shape._shape_model.get('members', {}).items():
+            member = resolver.resolve_shape_ref(shape_ref)
+            members[name] = member
+            if (
+                event_stream_name is None
+                and member.serialization.get('eventstream')
+            ):
+                event_stream_name = name
+        object.__setattr__(self, 'members', members)
+        object.__setattr__(self, 'event_stream_name', event_stream_name)
+
+
+class FrozenListShape(FrozenShape, ListShape):
+    __slots__ = ('member',)
+
+    def _resolve_references(self, shape, resolver):
+        object.__setattr__(
+            self,
+            'member',
+            resolver.resolve_shape_ref(shape._shape_model['member']),
+        )
+
+
+class FrozenMapShape(FrozenShape, MapShape):
+    __slots__ = ('key', 'value')
+
+    def _resolve_references(self, shape, resolver):
+        set_attr = object.__setattr__
+        shape_model = shape._shape_model
+        set_attr(self, 'key', resolver.resolve_shape_ref(shape_model['key']))
+        set_attr(
+            self, 'value', resolver.resolve_shape_ref(shape_model['value'])
+        )
+
+
+class FrozenStringShape(FrozenShape, StringShape):
+    __slots__ = ('enum',)
+
+    def __init__(self, shape):
+        super().__init__(shape)
+        object.__setattr__(self, 'enum', shape.enum)
+
+
 class StaticContextParameter(NamedTuple):
     name: str
     value: Union[bool, str]
@@ -376,6 +487,41 @@ class ServiceModel:
             raise OperationNotFoundError(operation_name)
         return OperationModel(model, self, operation_name)
 
+    def freeze(self, operation_names=None):
+        """Resolve the shapes of operations into frozen shapes up front.
+
+        Shapes are normally resolved on first access, into new ``Shape``
+        objects for every reference, and compute their attributes lazily.
+        Once a service model is frozen, its shapes are ``FrozenShape``
+        objects: read-only, with ``__slots__`` attributes, and shared by
+        every reference to the same shape. The input, output and error
+        shapes of ``operation_names`` are resolved right away, together
+        with every shape they refer to, other shapes are frozen when they
+        are first resolved.
+
+        Operation models created before the service model was frozen keep
+        their shapes, ``operation_model`` returns new ones afterwards.
+
+        :type operation_names: list
+        :param operation_names: The operations to resolve now, defaults to
+            every operation of the service.
+
+        """
+        if not isinstance(self._shape_resolver, FrozenShapeResolver):
+            self._shape_resolver = FrozenShapeResolver(
+                self._service_description.get('shapes', {})
+            )
+            self._instance_cache = {}
+            for name in ('error_shapes', '_error_code_cache'):
+                self.__dict__.pop(name, None)
+        if operation_names is None:
+            operation_names = self.operation_names
+        for operation_name in operation_names:
+            operation_model = self.operation_model(operation_name)
+            operation_model.input_shape
+            operation_model.output_shape
+            operation_model.error_shapes
+
     @CachedProperty
     def documentation(self):
         return self._service_description.get('documentation', '')
@@ -801,6 +947,68 @@ class ShapeResolver:
             return self.get_shape_by_name(shape_name, member_traits)
 
 
+class FrozenShapeResolver:
+    """Resolves shape references into a graph of frozen shapes.
+
+    A shape is frozen together with every shape it refers to the first
+    time it is resolved. After that the same ``FrozenShape`` objects are
+    returned for the same shape name or shape reference.
+
+    """
+
+    FROZEN_SHAPE_CLASSES = {
+        'structure': FrozenStructureShape,
+        'list': FrozenListShape,
+        'map': FrozenMapShape,
+        'string': FrozenStringShape,
+    }
+
+    def __init__(self, shape_map):
+        self._shape_resolver = ShapeResolver(shape_map)
+        # Shape names and the ids of shape references with member traits
+        # to their frozen shape. References are kept alive with their
+        # shape so their ids are not reused.
+        self._frozen_shapes = {}
+
+    def get_shape_by_name(self, shape_name, member_traits=None):
+        if member_traits:
+            return self._freeze(
+                self._shape_resolver.get_shape_by_name(
+                    shape_name, member_traits
+                )
+            )
+        try:
+            return self._frozen_shapes[shape_name][1]
+        except KeyError:
+            return self._freeze(
+                self._shape_resolver.get_shape_by_name(shape_name),
+                shape_name,
+                shape_name,
+            )
+
+    def resolve_shape_ref(self, shape_ref):
+        if len(shape_ref) == 1 and 'shape' in shape_ref:
+            return self.get_shape_by_name(shape_ref['shape'])
+        try:
+            return self._frozen_shapes[id(shape_ref)][1]
+        except KeyError:
+            return self._freeze(
+                self._shape_resolver.resolve_shape_ref(shape_ref),
+                id(shape_ref),
+                shape_ref,
+            )
+
+    def _freeze(self, shape, key=None, source=None):
+        frozen_cls = self.FROZEN_SHAPE_CLASSES.get(
+            shape.type_name, FrozenShape
+        )
+        frozen = frozen_cls(shape)
+        if key is not None:
+            self._frozen_shapes[key] = (source, frozen)
+        frozen._resolve_references(shape, self)
+        return frozen
+
+
 class UnresolvableShapeMap:
     """A ShapeResolver that will throw ValueErrors when shapes are resolved."""
 
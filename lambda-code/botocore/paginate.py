@@ -15,12 +15,13 @@ import base64
 import json
 import logging
 from functools import partial
-from itertools import tee
+from itertools import islice, tee
 
 import jmespath
 
-from botocore.context import with_current_context
+from botocore.context import get_context, with_current_context
 from botocore.exceptions import PaginationError
+from botocore.parsers import StreamedEntries
 from botocore.useragent import register_feature_id
 from botocore.utils import merge_dicts, set_value_from_jmespath
 
@@ -206,6 +207,7 @@ class PageIterator:
         starting_token,
         page_size,
         op_kwargs,
+        stream_entries=False,
     ):
         self._method = method
         self._input_token = input_token
@@ -222,6 +224,13 @@ class PageIterator:
         self._non_aggregate_part = {}
         self._token_encoder = TokenEncoder()
         self._token_decoder = TokenDecoder()
+        self._stream_entries = stream_entries
+        # Only result keys that are top level members can be streamed.
+        self._streamed_members = tuple(
+            result_key.expression
+            for result_key in result_keys or []
+            if result_key.expression.isidentifier()
+        )
 
     @property
     def result_keys(self):
@@ -265,12 +274,14 @@ class PageIterator:
         # The number of items from result_key we've seen so far.
         total_items = 0
         first_request = True
+        record_non_aggregate = False
         primary_result_key = self.result_keys[0]
         starting_truncation = 0
         self._inject_starting_params(current_kwargs)
         while True:
             response = self._make_request(current_kwargs)
             parsed = self._extract_parsed_response(response)
+            streams = self._get_streamed_entries(parsed)
             if first_request:
                 # The first request is handled differently.  We could
                 # possibly have a resume/starting token that tells us where
@@ -280,16 +291,22 @@ class PageIterator:
                         parsed, primary_result_key, starting_truncation
                     )
                 first_request = False
-                self._record_non_aggregate_key_values(parsed)
+                if streams:
+                    # Recorded once the whole page has been parsed.
+                    record_non_aggregate = True
+                else:
+                    self._record_non_aggregate_key_values(parsed)
             else:
                 # If this isn't the first request, we have already sliced into
                 # the first request and had to make additional requests after.
                 # We no longer need to add this to truncation.
                 starting_truncation = 0
-            current_response = primary_result_key.search(parsed)
-            if current_response is None:
-                current_response = []
-            num_current_response = len(current_response)
+            num_current_response = 0
+            if not streams:
+                current_response = primary_result_key.search(parsed)
+                if current_response is None:
+                    current_response = []
+                num_current_response = len(current_response)
             truncate_amount = 0
             if self._max_items is not None:
                 truncate_amount = (
@@ -308,6 +325,12 @@ class PageIterator:
             else:
                 yield response
                 total_items += num_current_response
+                if streams:
+                    # The pagination tokens may come after the entries.
+                    streams[0].finish()
+                    if record_non_aggregate:
+                        self._record_non_aggregate_key_values(parsed)
+                        record_non_aggregate = False
                 next_token = self._get_next_token(parsed)
                 if all(t is None for t in next_token.values()):
                     break
@@ -349,6 +372,9 @@ class PageIterator:
         """
         compiled = jmespath.compile(expression)
         for page in self:
+            if self._stream_entries:
+                # JMESPath only sees lists.
+                page = self._materialize_streamed_entries(page)
             results = compiled.search(page)
             if isinstance(results, list):
                 yield from results
@@ -358,8 +384,32 @@ class PageIterator:
 
     @with_current_context(partial(register_feature_id, 'PAGINATOR'))
     def _make_request(self, current_kwargs):
+        if self._stream_entries:
+            get_context().streamed_members = self._streamed_members
         return self._method(**current_kwargs)
 
+    def _get_streamed_entries(self, parsed):
+        if not self._stream_entries or not isinstance(parsed, dict):
+            return []
+        return [
+            parsed[name]
+            for name in self._streamed_members
+            if isinstance(parsed.get(name), StreamedEntries)
+        ]
+
+    def _materialize_streamed_entries(self, page):
+        # Consuming the entries adds the remaining members to the page and
+        # removes the streamed members that turned out to be empty.
+        streamed = {
+            key: value
+            for key, value in page.items()
+            if isinstance(value, StreamedEntries)
+        }
+        entries = {key: list(value) for key, value in streamed.items()}
+        return {
+            key: entries.get(key, value) for key, value in page.items()
+        }
+
     def _extract_parsed_response(self, response):
         return response
 
@@ -401,6 +451,11 @@ class PageIterator:
         all_data = primary_result_key.search(parsed)
         if isinstance(all_data, (list, str)):
             data = all_data[starting_truncation:]
+        elif isinstance(all_data, StreamedEntries):
+            # Parse and drop the entries that were already returned.
+            for _ in islice(all_data, starting_truncation):
+                pass
+            data = all_data
         else:
             data = None
         set_value_from_jmespath(parsed, primary_result_key.expression, data)
@@ -411,7 +466,7 @@ class PageIterator:
             if token == primary_result_key:
                 continue
             sample = token.search(parsed)
-            if isinstance(sample, list):
+            if isinstance(sample, (list, StreamedEntries)):
                 empty_value = []
             elif isinstance(sample, str):
                 empty_value = ''
@@ -503,6 +558,8 @@ class PageIterator:
                 result_value = result_expression.search(page)
                 if result_value is None:
                     continue
+                if isinstance(result_value, StreamedEntries):
+                    result_value = list(result_value)
                 existing_value = result_expression.search(complete_result)
                 if existing_value is None:
                     # Set the initial result
@@ -656,8 +713,17 @@ class Paginator:
         this object will yield a single page of a response
         at a time.
 
+        With ``PaginationConfig={'StreamEntries': True}`` the result keys
+        of each page are ``botocore.parsers.StreamedEntries`` iterators
+        instead of lists, for protocols that support it (rest-xml). Their
+        entries are parsed from the response one at a time as they are
+        consumed. ``MaxItems`` cannot be combined with it.
+
         """
         page_params = self._extract_paging_params(kwargs)
+        iterator_kwargs = {}
+        if page_params['StreamEntries']:
+            iterator_kwargs['stream_entries'] = True
         return self.PAGE_ITERATOR_CLS(
             self._method,
             self._input_token,
@@ -670,6 +736,7 @@ class Paginator:
             page_params['StartingToken'],
             page_params['PageSize'],
             kwargs,
+            **iterator_kwargs,
         )
 
     def _extract_paging_params(self, kwargs):
@@ -691,10 +758,16 @@ class Paginator:
                     page_size = str(page_size)
             else:
                 page_size = int(page_size)
+        stream_entries = bool(pagination_config.get('StreamEntries', False))
+        if stream_entries and max_items is not None:
+            raise PaginationError(
+                message="MaxItems is not supported when streaming entries."
+            )
         return {
             'MaxItems': max_items,
             'StartingToken': pagination_config.get('StartingToken', None),
             'PageSize': page_size,
+            'StreamEntries': stream_entries,
         }
 
 
@@ -120,6 +120,7 @@ Each call to ``parse()`` returns a dict has this form::
 """
 
 import base64
+import collections
 import http.client
 import io
 import json
@@ -127,6 +128,7 @@ import logging
 import os
 import re
 import struct
+import weakref
 
 from botocore.compat import ETree, XMLParseError
 from botocore.eventstream import EventStream, NoInitialResponseError
@@ -1158,14 +1160,18 @@ class BaseRestParser(ResponseParser):
                 final_parsed[payload_member_name] = body
             else:
                 original_parsed = self._initial_body_parse(response['body'])
-                final_parsed[payload_member_name] = self._parse_shape(
+                final_parsed[payload_member_name] = self._parse_body_shape(
                     body_shape, original_parsed
                 )
         else:
             original_parsed = self._initial_body_parse(response['body'])
-            body_parsed = self._parse_shape(shape, original_parsed)
+            body_parsed = self._parse_body_shape(shape, original_parsed)
             final_parsed.update(body_parsed)
 
+    def _parse_body_shape(self, shape, node):
+        # Parses the result of _initial_body_parse.
+        return self._parse_shape(shape, node)
+
     def _parse_non_payload_attrs(
         self, response, shape, member_shapes, final_parsed
     ):
@@ -1394,11 +1400,277 @@ class RpcV2CBORParser(BaseRpcV2Parser, BaseCBORParser):
 class RestXMLParser(BaseRestParser, BaseXMLResponseParser):
     EVENT_STREAM_PARSER_CLS = EventStreamXMLParser
 
+    # Response bodies are parsed with functions compiled once per shape:
+    # tag names, member tables and type conversions are worked out from
+    # the model up front instead of for every node of every response.
+    # Anything the compiler does not cover is delegated to the regular
+    # _handle_* methods, so the output is the same either way.
+    _COMPILED_TEXT_TYPES = {
+        'string': None,
+        'character': None,
+        'boolean': lambda text: text == 'true',
+        'integer': int,
+        'long': int,
+        'float': float,
+        'double': float,
+    }
+    _MAX_TAG_NAMES = 1024
+
+    def __init__(self, timestamp_parser=None, blob_parser=None):
+        super().__init__(timestamp_parser, blob_parser)
+        self._compiled_shapes = weakref.WeakKeyDictionary()
+        self._streaming_plans = weakref.WeakKeyDictionary()
+        self._tag_names = {}
+
     def _initial_body_parse(self, xml_string):
         if not xml_string:
             return ETree.Element('')
         return self._parse_xml_string_to_dom(xml_string)
 
+    def _parse_body_shape(self, shape, node):
+        try:
+            compiled = self._compiled_shapes[shape]
+        except KeyError:
+            compiled = self._compile_shape(shape, {})
+            self._compiled_shapes[shape] = compiled
+        return compiled(node)
+
+    def _parse_payload(self, response, shape, member_shapes, final_parsed):
+        # Paginators can ask for the entries of list members to be parsed
+        # incrementally, see StreamedEntries.
+        streamed_members = response.get('context', {}).get('streamed_members')
+        if (
+            streamed_members
+            and response['body']
+            and 'payload' not in shape.serialization
+        ):
+            plan = self._get_streaming_plan(shape, tuple(streamed_members))
+            if plan is not None:
+                members, entry_parsers = plan
+                reader = _XMLPageReader(
+                    self._parse_xml_events(response['body']),
+                    members,
+                    entry_parsers,
+                    self._tag_name,
+                )
+                reader.start(final_parsed)
+                return
+        super()._parse_payload(response, shape, member_shapes, final_parsed)
+
+    def _get_streaming_plan(self, shape, streamed_members):
+        plans = self._streaming_plans.setdefault(shape, {})
+        if streamed_members not in plans:
+            plans[streamed_members] = self._compile_streaming_plan(
+                shape, streamed_members
+            )
+        return plans[streamed_members]
+
+    def _compile_streaming_plan(self, shape, streamed_members):
+        # Only top level flattened lists (like the Contents of
+        # ListObjectsV2) can be streamed, their entries are direct children
+        # of the root element.
+        if not self._is_compilable_structure(shape):
+            return None
+        compiled = {}
+        members = []
+        entry_parsers = {}
+        for member_name, xml_name, parse_member in self._compile_members(
+            shape, compiled
+        ):
+            member_shape = shape.members[member_name]
+            if member_name in streamed_members and (
+                member_shape.type_name == 'list'
+                and member_shape.serialization.get('flattened')
+            ):
+                entry_parsers[xml_name] = (
+                    member_name,
+                    self._compile_shape(member_shape.member, compiled),
+                )
+            else:
+                members.append((member_name, xml_name, parse_member))
+        if not entry_parsers:
+            return None
+        return members, entry_parsers
+
+    def _parse_xml_events(self, xml_string):
+        try:
+            yield from ETree.iterparse(
+                io.BytesIO(xml_string), events=('start', 'end')
+            )
+        except XMLParseError as e:
+            raise ResponseParserError(
+                f"Unable to parse response ({e}), "
+                f"invalid XML received. Further retries may succeed:\n{xml_string}"
+            )
+
+    def _tag_name(self, tag):
+        # Same as _node_tag, for the handful of distinct tags a service
+        # sends.
+        try:
+            return self._tag_names[tag]
+        except KeyError:
+            name = self._namespace_re.sub('', tag)
+            if len(self._tag_names) < self._MAX_TAG_NAMES:
+                self._tag_names[tag] = name
+            return name
+
+    def _compile_shape(self, shape, compiled):
+        # ``compiled`` maps the shapes compiled so far in this pass to their
+        # functions, so recursive shapes refer to themselves instead of
+        # recursing forever. Every member lookup resolves a new Shape
+        # object, so they are keyed by name and the member's serialization
+        # traits (locationName, flattened, ...) rather than by identity.
+        key = (shape.name, repr(sorted(shape.serialization.items())))
+        if key not in compiled:
+            compiler = getattr(
+                self, f'_compile_{shape.type_name}', self._compile_scalar
+            )
+            compiled[key] = None
+            compiled[key] = (compiler(shape, compiled), shape)
+        entry = compiled[key]
+        if entry is None:
+            return lambda node: compiled[key][0](node)
+        return entry[0]
+
+    def _compile_generic(self, shape):
+        handler = getattr(
+            self, f'_handle_{shape.type_name}', self._default_handle
+        )
+        return lambda node: handler(shape, node)
+
+    def _is_compilable_structure(self, shape):
+        return not (
+            shape.metadata.get('exception', False)
+            or shape.is_tagged_union
+            or any(
+                member.serialization.get('xmlAttribute')
+                for member in shape.members.values()
+            )
+        )
+
+    def _compile_members(self, shape, compiled):
+        members = []
+        for member_name, member_shape in shape.members.items():
+            if (
+                'location' in member_shape.serialization
+                or member_shape.serialization.get('eventheader')
+            ):
+                continue
+            members.append(
+                (
+                    member_name,
+                    self._member_key_name(member_shape, member_name),
+                    self._compile_shape(member_shape, compiled),
+                )
+            )
+        return members
+
+    def _compile_structure(self, shape, compiled):
+        if not self._is_compilable_structure(shape):
+            return self._compile_generic(shape)
+        handle_structure = self._compile_generic(shape)
+        tag_name = self._tag_name
+        members = self._compile_members(shape, compiled)
+
+        def parse_structure(node):
+            if type(node) is list:
+                return handle_structure(node)
+            xml_dict = {}
+            for item in node:
+                key = tag_name(item.tag)
+                existing = xml_dict.get(key)
+                if existing is None:
+                    xml_dict[key] = item
+                elif type(existing) is list:
+                    existing.append(item)
+                else:
+                    xml_dict[key] = [existing, item]
+            parsed = {}
+            for member_name, xml_name, parse_member in members:
+                member_node = xml_dict.get(xml_name)
+                if member_node is not None:
+                    parsed[member_name] = parse_member(member_node)
+            return parsed
+
+        return parse_structure
+
+    def _compile_list(self, shape, compiled):
+        if shape.serialization.get('location') == 'header':
+            return self._compile_generic(shape)
+        parse_member = self._compile_shape(shape.member, compiled)
+        if shape.serialization.get('flattened'):
+
+            def parse_flattened_list(node):
+                if type(node) is not list:
+                    node = [node]
+                return [parse_member(item) for item in node]
+
+            return parse_flattened_list
+
+        def parse_list(node):
+            return [parse_member(item) for item in node]
+
+        return parse_list
+
+    def _compile_map(self, shape, compiled):
+        parse_key = self._compile_shape(shape.key, compiled)
+        parse_value = self._compile_shape(shape.value, compiled)
+        key_location_name = shape.key.serialization.get('name') or 'key'
+        value_location_name = shape.value.serialization.get('name') or 'value'
+        flattened = shape.serialization.get('flattened')
+        tag_name = self._tag_name
+
+        def parse_map(node):
+            if flattened and type(node) is not list:
+                node = [node]
+            parsed = {}
+            for keyval_node in node:
+                for single_pair in keyval_node:
+                    name = tag_name(single_pair.tag)
+                    if name == key_location_name:
+                        key_name = parse_key(single_pair)
+                    elif name == value_location_name:
+                        val_name = parse_value(single_pair)
+                    else:
+                        raise ResponseParserError(f"Unknown tag: {name}")
+                parsed[key_name] = val_name
+            return parsed
+
+        return parse_map
+
+    def _compile_scalar(self, shape, compiled):
+        type_name = shape.type_name
+        if type_name == 'timestamp':
+            convert = self._timestamp_parser
+        elif type_name == 'blob':
+            convert = self._blob_parser
+        elif (
+            type_name in self._COMPILED_TEXT_TYPES
+            and not is_json_value_header(shape)
+        ):
+            convert = self._COMPILED_TEXT_TYPES[type_name]
+        else:
+            return self._compile_generic(shape)
+        handle_scalar = self._compile_generic(shape)
+
+        if convert is None:
+
+            def parse_text(node):
+                if type(node) is list:
+                    return handle_scalar(node)
+                text = node.text
+                return '' if text is None else text
+
+            return parse_text
+
+        def parse_scalar(node):
+            if type(node) is list:
+                return handle_scalar(node)
+            text = node.text
+            return convert('' if text is None else text)
+
+        return parse_scalar
+
     def _do_error_parse(self, response, shape):
         # We're trying to be service agnostic here, but S3 does have a slightly
         # different response structure for its errors compared to other
@@ -1469,6 +1741,156 @@ class RestXMLParser(BaseRestParser, BaseXMLResponseParser):
         return text
 
 
+class StreamedEntries:
+    """The entries of a list member, parsed as they are iterated over.
+
+    Paginators put these in pages in place of the lists of their result
+    keys when asked to stream them (``PaginationConfig={'StreamEntries':
+    True}``). Each entry is built from its XML element when it is reached,
+    and the elements are dropped right after, so neither the whole
+    document tree nor all entries of a page have to be held in memory at
+    once.
+
+    Members of the page that come before the first entry in the response
+    are in the page when it is returned, the rest are added as parsing
+    reaches them. The paginator finishes parsing a page before it requests
+    the next one; entries that were not consumed by then are kept and can
+    still be iterated over. As with regular parsing, a member without any
+    entries is removed from the page once the page is parsed.
+    """
+
+    def __init__(self, reader):
+        self._reader = reader
+        self._pending = collections.deque()
+        self._received = 0
+        self._transforms = []
+
+    def _add(self, entry):
+        self._pending.append(entry)
+        self._received += 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._pending:
+            if not self._reader.advance():
+                raise StopIteration
+        entry = self._pending.popleft()
+        for transform in self._transforms:
+            entry = transform(entry)
+        return entry
+
+    def finish(self):
+        """Parse the rest of the page, keeping the entries not consumed"""
+        self._reader.finish()
+
+    def add_entry_transform(self, func):
+        """Pass the entries not consumed yet through ``func``
+
+        This is how handlers that post-process the parsed response (like
+        the URL decoding of S3 keys) apply to entries that are only parsed
+        after the handlers have run.
+        """
+        self._transforms.append(func)
+
+    def add_member_transform(self, member_name, func):
+        """Pass the value of a page member through ``func`` when it is set
+
+        Applies to the member values the rest of the page sets, the values
+        already in the page are left as they are.
+        """
+        self._reader._member_transforms[member_name] = func
+
+
+class _XMLPageReader:
+    # Walks the children of the root element of a response from iterparse
+    # events, handing entries of streamed members to their StreamedEntries
+    # and collecting the elements of all other members.
+    def __init__(self, events, members, entry_parsers, tag_name):
+        self._events = events
+        self._members = members
+        self._entry_parsers = entry_parsers
+        self._tag_name = tag_name
+        self._streams = {}
+        self._xml_dict = {}
+        self._changed = set()
+        self._member_transforms = {}
+        self._final_parsed = None
+        self._root = None
+        self._depth = 0
+        self._done = False
+
+    def start(self, final_parsed):
+        self._final_parsed = final_parsed
+        for member_name, _ in self._entry_parsers.values():
+            stream = StreamedEntries(self)
+            self._streams[member_name] = stream
+            final_parsed[member_name] = stream
+        # Reads up to the first entry, which usually puts the pagination
+        # tokens and the other scalars in the page already.
+        self.advance()
+        self._fill_members()
+
+    def advance(self):
+        """Parse up to the next entry, returns False once the page is done"""
+        if self._done:
+            return False
+        tag_name = self._tag_name
+        for event, element in self._events:
+            if event == 'start':
+                self._depth += 1
+                if self._root is None:
+                    self._root = element
+                continue
+            self._depth -= 1
+            if self._depth != 1:
+                continue
+            key = tag_name(element.tag)
+            # The root only holds on to elements until they are handled.
+            self._root.clear()
+            entry = self._entry_parsers.get(key)
+            if entry is not None:
+                member_name, parse_entry = entry
+                self._streams[member_name]._add(parse_entry(element))
+                return True
+            existing = self._xml_dict.get(key)
+            if existing is None:
+                self._xml_dict[key] = element
+            elif type(existing) is list:
+                existing.append(element)
+            else:
+                self._xml_dict[key] = [existing, element]
+            self._changed.add(key)
+        self._done = True
+        self._fill_members()
+        for member_name, stream in self._streams.items():
+            if not stream._received and (
+                self._final_parsed.get(member_name) is stream
+            ):
+                del self._final_parsed[member_name]
+        return False
+
+    def finish(self):
+        while self.advance():
+            pass
+
+    def _fill_members(self):
+        # Only members with elements since the last fill are (re)parsed,
+        # so values handlers have already post-processed are kept.
+        changed = self._changed
+        if not changed:
+            return
+        for member_name, xml_name, parse_member in self._members:
+            if xml_name in changed:
+                value = parse_member(self._xml_dict[xml_name])
+                transform = self._member_transforms.get(member_name)
+                if transform is not None:
+                    value = transform(value)
+                self._final_parsed[member_name] = value
+        changed.clear()
+
+
 PROTOCOL_PARSERS = {
     'ec2': EC2QueryParser,
     'query': QueryParser,
@@ -66,11 +66,13 @@ ISO8601_MICRO = '%Y-%m-%dT%H:%M:%S.%fZ'
 HOST_PREFIX_RE = re.compile(r"^[A-Za-z0-9\.\-]+$")
 
 
-def create_serializer(protocol_name, include_validation=True):
+def create_serializer(
+    protocol_name, include_validation=True, cache_signatures=False
+):
     # TODO: Unknown protocols.
     serializer = SERIALIZERS[protocol_name]()
     if include_validation:
-        validator = validate.ParamValidator()
+        validator = validate.ParamValidator(cache_signatures=cache_signatures)
         serializer = validate.ParamValidationDecorator(validator, serializer)
     return serializer
 
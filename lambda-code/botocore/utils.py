@@ -22,16 +22,18 @@ import os
 import random
 import re
 import socket
+import threading
 import time
 import warnings
 import weakref
+from collections import namedtuple
 from datetime import datetime as _DatetimeClass
 from ipaddress import ip_address
 from pathlib import Path
 from urllib.request import getproxies, proxy_bypass
 
 import dateutil.parser
-from dateutil.tz import tzutc
+from dateutil.tz import tzlocal, tzutc
 from urllib3.exceptions import LocationParseError
 
 import botocore
@@ -938,6 +940,83 @@ def _epoch_seconds_to_datetime(value, tzinfo):
     return epoch_zero_localized + datetime.timedelta(seconds=value)
 
 
+# The exact timestamp formats AWS services send, "2024-01-02T03:04:05.000Z"
+# and "Tue, 02 Jan 2024 03:04:05 GMT". Anything else goes through dateutil.
+_ISO8601_UTC_RE = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})'
+    r'T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]+))?Z\Z'
+)
+_RFC822_GMT_RE = re.compile(
+    r'(?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), )?([0-9]{1,2}) '
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) ([0-9]{4}) '
+    r'([0-9]{2}):([0-9]{2}):([0-9]{2}) GMT\Z'
+)
+_RFC822_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            'Jan',
+            'Feb',
+            'Mar',
+            'Apr',
+            'May',
+            'Jun',
+            'Jul',
+            'Aug',
+            'Sep',
+            'Oct',
+            'Nov',
+            'Dec',
+        ),
+        1,
+    )
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _utc_designator_tzinfo(local_tznames):
+    # dateutil maps "Z" to the local zone when that is called UTC.
+    return tzlocal() if 'UTC' in local_tznames else tzutc()
+
+
+def _parse_aws_timestamp(value):
+    """Parse the timestamp formats AWS services send without dateutil.
+
+    Returns ``None`` when ``value`` is not in one of those formats (or is
+    not a valid date), in which case the caller falls back to dateutil.
+    The result is the same as ``dateutil.parser.parse`` would return:
+    fractional seconds beyond microseconds are truncated, and "Z" is
+    ``tzlocal()`` when the local time zone is named UTC, ``tzutc()``
+    otherwise.
+    """
+    match = _ISO8601_UTC_RE.match(value)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+        tzinfo = _utc_designator_tzinfo(time.tzname)
+    else:
+        match = _RFC822_GMT_RE.match(value)
+        if match is None:
+            return None
+        day, month, year, hour, minute, second = match.groups()
+        month = _RFC822_MONTHS[month]
+        microsecond = 0
+        tzinfo = tzutc()
+    try:
+        return datetime.datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            microsecond,
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        return None
+
+
 def _parse_timestamp_with_tzinfo(value, tzinfo):
     """Parse timestamp with pluggable tzinfo options."""
     if isinstance(value, (int, float)):
@@ -969,6 +1048,12 @@ def parse_timestamp(value):
     This will return a ``datetime.datetime`` object.
 
     """
+    if isinstance(value, str):
+        # The time zone options only matter for epoch values, the formats
+        # AWS sends are parsed directly.
+        parsed = _parse_aws_timestamp(value)
+        if parsed is not None:
+            return parsed
     tzinfo_options = get_tzinfo_options()
     for tzinfo in tzinfo_options:
         try:
@@ -1507,6 +1592,74 @@ def lru_cache_weakref(*cache_args, **cache_kwargs):
     return wrapper
 
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    """Thread-safe, bounded least-recently-used mapping with hit/miss stats.
+
+    Unlike :py:func:`functools.lru_cache` this is an explicit container, so
+    callers control the key (e.g. a normalized form of the arguments) and
+    can keep one cache per instance instead of one per function.
+
+    :type maxsize: int
+    :param maxsize: The maximum number of entries to keep.
+    """
+
+    def __init__(self, maxsize=128):
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key``, or ``default`` on a miss."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        """Insert or replace ``key``, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self):
+        """Return a ``CacheInfo(hits, misses, maxsize, currsize)`` tuple."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
 def switch_host_s3_accelerate(request, operation_name, **kwargs):
     """Switches the current s3 endpoint with an S3 Accelerate endpoint"""
 
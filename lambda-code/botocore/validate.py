@@ -21,6 +21,10 @@ from botocore.exceptions import ParamValidationError
 from botocore.utils import is_json_value_header, parse_to_aware_datetime
 
 
+# Marks value types a signature has not seen pass validation yet.
+_NEW_TYPE = object()
+
+
 def validate_parameters(params, shape):
     """Validates input parameters against a schema.
 
@@ -179,7 +183,28 @@ class ValidationErrors:
 
 
 class ParamValidator:
-    """Validates parameters against a shape model."""
+    """Validates parameters against a shape model.
+
+    The checks for a shape are compiled into a function the first time
+    the shape is validated and reused after that.
+
+    :type cache_signatures: bool
+    :param cache_signatures: Remember the signatures (member names and
+        value types) of the parameters that passed validation for a shape.
+        Parameters with a known signature skip the required, unknown member
+        and type checks of their top level members, only value constraints
+        (lengths, ranges, timestamp strings) and nested members are checked
+        again.
+
+    """
+
+    # The number of signatures remembered per shape.
+    _MAX_SIGNATURES = 64
+
+    def __init__(self, cache_signatures=False):
+        self._cache_signatures = cache_signatures
+        self._validators = {}
+        self._signatures = {}
 
     def validate(self, params, shape):
         """Validate parameters against a shape model.
@@ -196,9 +221,272 @@ class ParamValidator:
 
         """
         errors = ValidationErrors()
-        self._validate(params, shape, errors, name='')
+        if self._cache_signatures and type(params) is dict:
+            self._validate_signature(params, shape, errors)
+        else:
+            self._get_validator(shape)(params, errors, '')
         return errors
 
+    def _get_validator(self, shape):
+        try:
+            return self._validators[shape]
+        except KeyError:
+            validator = self._compile_shape(shape, {})
+            self._validators[shape] = validator
+            return validator
+
+    def _validate_signature(self, params, shape, errors):
+        try:
+            signatures = self._signatures[shape]
+        except KeyError:
+            signatures = self._signatures[shape] = {}
+        signature = tuple(params)
+        validator = signatures.get(signature)
+        if validator is not None:
+            validator(params, errors, '')
+            return
+        self._get_validator(shape)(params, errors, '')
+        if (
+            not errors.has_errors()
+            and len(signatures) < self._MAX_SIGNATURES
+            and shape.type_name == 'structure'
+            and self._check_special_validation_cases(shape) is None
+        ):
+            signatures[signature] = self._compile_signature(shape, params)
+
+    def _compile_signature(self, shape, params):
+        # Returns a validator for parameters with the same member names as
+        # ``params``, which passed the full validation. Each member keeps
+        # the checks still needed for the value types that passed before,
+        # values of other types get the full validation of their member.
+        compiled = {}
+        members = []
+        for param, value in params.items():
+            member_shape = shape.members[param]
+            value_checks = {
+                type(value): self._compile_value_check(
+                    member_shape, type(value), compiled
+                )
+            }
+            members.append(
+                (
+                    param,
+                    f'.{param}',
+                    value_checks,
+                    member_shape,
+                    self._compile_shape(member_shape, compiled),
+                )
+            )
+
+        def validate_signature(params, errors, name):
+            new_types = []
+            for param, suffix, value_checks, member_shape, validate in members:
+                value = params[param]
+                check = value_checks.get(type(value), _NEW_TYPE)
+                if check is None:
+                    continue
+                elif check is _NEW_TYPE:
+                    validate(value, errors, name + suffix)
+                    new_types.append((value_checks, member_shape, type(value)))
+                else:
+                    check(value, errors, name + suffix)
+            if new_types and not errors.has_errors():
+                for value_checks, member_shape, value_type in new_types:
+                    value_checks[value_type] = self._compile_value_check(
+                        member_shape, value_type, compiled
+                    )
+
+        return validate_signature
+
+    def _compile_value_check(self, shape, value_type, compiled):
+        # The checks a value of ``value_type`` still needs once it is known
+        # to pass the type check, or None if the type is all that matters.
+        if self._check_special_validation_cases(shape) is not None:
+            return self._compile_shape(shape, compiled)
+        type_name = shape.type_name
+        if type_name == 'string':
+            check_range = self._compile_range_check(shape, 'invalid length')
+            if check_range is None:
+                return None
+            return lambda param, errors, name: check_range(
+                len(param), errors, name
+            )
+        elif type_name in ('integer', 'long', 'float', 'double'):
+            return self._compile_range_check(shape, 'invalid range')
+        elif type_name == 'boolean':
+            return None
+        elif type_name == 'blob' and value_type in (bytes, bytearray, str):
+            return None
+        elif type_name == 'timestamp' and issubclass(value_type, datetime):
+            return None
+        return self._compile_shape(shape, compiled)
+
+    def _compile_shape(self, shape, compiled):
+        # ``compiled`` maps the names of the shapes compiled so far in this
+        # pass to their functions, so recursive shapes refer to themselves
+        # instead of recursing forever. Shapes are resolved into new objects
+        # on every lookup and member traits can change them, so they are
+        # told apart by their metadata and serialization.
+        entries = compiled.setdefault(shape.name, [])
+        for entry in entries:
+            if (
+                entry[0] == shape.metadata
+                and entry[1] == shape.serialization
+                and entry[2].type_name == shape.type_name
+            ):
+                break
+        else:
+            if self._check_special_validation_cases(shape) is not None:
+                compiler = self._compile_generic
+            else:
+                compiler = getattr(
+                    self, f'_compile_{shape.type_name}', self._compile_generic
+                )
+            entry = [shape.metadata, shape.serialization, shape, None]
+            entries.append(entry)
+            entry[3] = compiler(shape, compiled)
+        if entry[3] is None:
+            return lambda param, errors, name: entry[3](param, errors, name)
+        return entry[3]
+
+    def _compile_generic(self, shape, compiled):
+        # Binds the _validate_* method of the shape, unknown types fail in
+        # _validate when a value is validated.
+        validate = self._check_special_validation_cases(shape) or getattr(
+            self, f'_validate_{shape.type_name}', self._validate
+        )
+        return lambda param, errors, name: validate(param, shape, errors, name)
+
+    def _compile_range_check(self, shape, error_type):
+        # Compiled form of range_check, None when the shape has no minimum.
+        if 'min' in shape.metadata:
+            min_allowed = shape.metadata['min']
+        elif shape.serialization.get('hostLabel'):
+            # Members that can be bound to the host have an implicit min of 1
+            min_allowed = 1
+        else:
+            return None
+
+        def check_range(value, errors, name):
+            if value < min_allowed:
+                errors.report(
+                    name, error_type, param=value, min_allowed=min_allowed
+                )
+
+        return check_range
+
+    def _compile_type_check(self, valid_types, check=None):
+        # Compiled form of the type_check decorator.
+        valid_type_names = [str(t) for t in valid_types]
+
+        def validate_type(param, errors, name):
+            if not isinstance(param, valid_types):
+                errors.report(
+                    name,
+                    'invalid type',
+                    param=param,
+                    valid_types=valid_type_names,
+                )
+            elif check is not None:
+                check(param, errors, name)
+
+        return validate_type
+
+    def _compile_structure(self, shape, compiled):
+        members = shape.members
+        is_tagged_union = shape.is_tagged_union
+        required_members = shape.metadata.get('required', [])
+        member_validators = {
+            member_name: (
+                f'.{member_name}',
+                self._compile_shape(member_shape, compiled),
+            )
+            for member_name, member_shape in members.items()
+        }
+        member_names = member_validators.keys()
+
+        def validate_structure(params, errors, name):
+            if is_tagged_union:
+                if len(params) == 0:
+                    errors.report(name, 'empty input', members=members)
+                elif len(params) > 1:
+                    errors.report(
+                        name, 'more than one input', members=members
+                    )
+            for required_member in required_members:
+                if required_member not in params:
+                    errors.report(
+                        name,
+                        'missing required field',
+                        required_name=required_member,
+                        user_params=params,
+                    )
+            if not member_names >= params.keys():
+                for param in params:
+                    if param not in members:
+                        errors.report(
+                            name,
+                            'unknown field',
+                            unknown_param=param,
+                            valid_names=list(members),
+                        )
+            for param, value in params.items():
+                member = member_validators.get(param)
+                if member is not None:
+                    member[1](value, errors, name + member[0])
+
+        return self._compile_type_check((dict,), validate_structure)
+
+    def _compile_string(self, shape, compiled):
+        check_range = self._compile_range_check(shape, 'invalid length')
+        if check_range is None:
+            return self._compile_type_check((str,))
+        return self._compile_type_check(
+            (str,),
+            lambda param, errors, name: check_range(len(param), errors, name),
+        )
+
+    def _compile_list(self, shape, compiled):
+        check_range = self._compile_range_check(shape, 'invalid length')
+        validate_member = self._compile_shape(shape.member, compiled)
+
+        def validate_list(param, errors, name):
+            if check_range is not None:
+                check_range(len(param), errors, name)
+            for i, item in enumerate(param):
+                validate_member(item, errors, f'{name}[{i}]')
+
+        return self._compile_type_check((list, tuple), validate_list)
+
+    def _compile_map(self, shape, compiled):
+        validate_key = self._compile_shape(shape.key, compiled)
+        validate_value = self._compile_shape(shape.value, compiled)
+
+        def validate_map(param, errors, name):
+            for key, value in param.items():
+                validate_key(key, errors, f"{name} (key: {key})")
+                validate_value(value, errors, f'{name}.{key}')
+
+        return self._compile_type_check((dict,), validate_map)
+
+    def _compile_integer(self, shape, compiled):
+        return self._compile_type_check(
+            (int,), self._compile_range_check(shape, 'invalid range')
+        )
+
+    _compile_long = _compile_integer
+
+    def _compile_double(self, shape, compiled):
+        return self._compile_type_check(
+            (float, decimal.Decimal) + (int,),
+            self._compile_range_check(shape, 'invalid range'),
+        )
+
+    _compile_float = _compile_double
+
+    def _compile_boolean(self, shape, compiled):
+        return self._compile_type_check((bool,))
+
     def _check_special_validation_cases(self, shape):
         if is_json_value_header(shape):
             return self._validate_jsonvalue_string
@@ -23,9 +23,14 @@ A few notes on the implementation.
   does not have a large amount of token so this is not an issue.  And
   interestingly enough, creating a token list first is actually faster than
   consuming from the token iterator one token at a time.
+* Parsed expressions are kept in a process wide, thread safe LRU cache
+  shared by every Parser instance.  The ASTs are plain dicts, so a set of
+  known expressions can be parsed ahead of time with ``Parser.snapshot``
+  and loaded back with ``Parser.load_snapshot`` without lexing or parsing.
 
 """
-import random
+import threading
+from collections import OrderedDict, namedtuple
 
 from jmespath import lexer
 from jmespath.compat import with_repr_method
@@ -34,6 +39,60 @@ from jmespath import exceptions
 from jmespath import visitor
 
 
+CacheStats = namedtuple('CacheStats', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ExpressionCache(object):
+    """Thread safe least recently used cache of parsed expressions."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, expression):
+        with self._lock:
+            try:
+                parsed = self._entries[expression]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(expression)
+            self._hits += 1
+            return parsed
+
+    def put(self, expression, parsed):
+        with self._lock:
+            self._entries[expression] = parsed
+            self._entries.move_to_end(expression)
+            self._evict()
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self):
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self.maxsize,
+                              len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class Parser(object):
     BINDING_POWER = {
         'eof': 0,
@@ -70,10 +129,10 @@ class Parser(object):
     # The maximum binding power for a token that can stop
     # a projection.
     _PROJECTION_STOP = 10
-    # The _MAX_SIZE most recent expressions are cached in
-    # _CACHE dict.
-    _CACHE = {}
+    # The _MAX_SIZE most recently used expressions are cached in
+    # _CACHE.  Use set_cache_size() to change the size at runtime.
     _MAX_SIZE = 128
+    _CACHE = ExpressionCache(_MAX_SIZE)
 
     def __init__(self, lookahead=2):
         self.tokenizer = None
@@ -86,9 +145,7 @@ class Parser(object):
         if cached is not None:
             return cached
         parsed_result = self._do_parse(expression)
-        self._CACHE[expression] = parsed_result
-        if len(self._CACHE) > self._MAX_SIZE:
-            self._free_cache_entries()
+        self._CACHE.put(expression, parsed_result)
         return parsed_result
 
     def _do_parse(self, expression):
@@ -488,27 +545,72 @@ class Parser(object):
         raise exceptions.ParseError(
             lex_position, actual_value, actual_type, message)
 
-    def _free_cache_entries(self):
-        for key in random.sample(list(self._CACHE.keys()), int(self._MAX_SIZE / 2)):
-            self._CACHE.pop(key, None)
-
     @classmethod
     def purge(cls):
         """Clear the expression compilation cache."""
         cls._CACHE.clear()
 
+    @classmethod
+    def set_cache_size(cls, maxsize):
+        """Change how many parsed expressions are cached."""
+        cls._CACHE.resize(maxsize)
+
+    @classmethod
+    def cache_stats(cls):
+        """Return the ``CacheStats`` of the expression cache."""
+        return cls._CACHE.stats()
+
+    @classmethod
+    def snapshot(cls, expressions):
+        """Parse expressions into a ``{expression: ast}`` snapshot.
+
+        The ASTs only contain dicts, lists, strings, numbers, booleans and
+        None, so the snapshot can be stored with json, marshal or pickle.
+        The AST format is an implementation detail, so a snapshot should
+        only be loaded by the jmespath version that created it.
+
+        """
+        parser = cls()
+        return dict((expression, parser.parse(expression).parsed)
+                    for expression in expressions)
+
+    @classmethod
+    def load_snapshot(cls, snapshot):
+        """Add the expressions of a snapshot to the expression cache."""
+        for expression, parsed in snapshot.items():
+            cls._CACHE.put(expression, ParsedResult(expression, parsed))
+
 
 @with_repr_method
 class ParsedResult(object):
     def __init__(self, expression, parsed):
         self.expression = expression
         self.parsed = parsed
+        self._compiled = {}
 
     def search(self, value, options=None):
+        if options is not None and options.compiled:
+            return self.compile(options)(value)
         interpreter = visitor.TreeInterpreter(options)
         result = interpreter.visit(self.parsed, value)
         return result
 
+    def compile(self, options=None):
+        """Return the expression compiled to a function of one value.
+
+        Compiled functions are cached per dict_cls and custom_functions.
+
+        """
+        if options is None:
+            key = (None, None)
+        else:
+            key = (options.dict_cls, options.custom_functions)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = visitor.ClosureCompiler(options).compile(self.parsed)
+            self._compiled[key] = compiled
+        return compiled
+
     def _render_dot_file(self):
         """Render the parsed AST as a dot file.
 
@@ -58,7 +58,7 @@ def _is_actual_number(x):
 
 class Options(object):
     """Options to control how a JMESPath function is evaluated."""
-    def __init__(self, dict_cls=None, custom_functions=None):
+    def __init__(self, dict_cls=None, custom_functions=None, compiled=False):
         #: The class to use when creating a dict.  The interpreter
         #  may create dictionaries during the evaluation of a JMESPath
         #  expression.  For example, a multi-select hash will
@@ -69,6 +69,12 @@ class Options(object):
         #  have predictable key ordering.
         self.dict_cls = dict_cls
         self.custom_functions = custom_functions
+        #: Evaluate expressions with closures built by the
+        #  ClosureCompiler instead of walking the AST with the
+        #  TreeInterpreter.  The compiled form is built on first use and
+        #  kept on the ParsedResult, which pays off when the same
+        #  expression is searched many times or over large inputs.
+        self.compiled = compiled
 
 
 class _Expression(object):
@@ -304,6 +310,327 @@ class TreeInterpreter(Visitor):
         return not self._is_false(value)
 
 
+class _CompiledVisitor(object):
+    # Lets an _Expression built by the ClosureCompiler be evaluated
+    # through the ``expref.visit(expref.expression, value)`` calls the
+    # functions module makes, without going back to the tree interpreter.
+    def __init__(self, compiled):
+        self._compiled = compiled
+
+    def visit(self, node, value):
+        return self._compiled(value)
+
+
+def _is_false(value):
+    # Same checks as TreeInterpreter._is_false, cheapest first.
+    return (value is None or value is False or value == '' or
+            value == [] or value == {})
+
+
+class ClosureCompiler(Visitor):
+    """Compile a parsed AST into nested Python closures.
+
+    ``compile(node)`` returns a function of one argument that gives the
+    same result as ``TreeInterpreter(options).visit(node, value)``.  The
+    node type dispatch happens once, when the expression is compiled, and
+    projections and filters run as plain loops over the input list.
+
+    """
+    COMPARATOR_FUNC = TreeInterpreter.COMPARATOR_FUNC
+    _EQUALITY_OPS = TreeInterpreter._EQUALITY_OPS
+    MAP_TYPE = dict
+
+    def __init__(self, options=None):
+        super(ClosureCompiler, self).__init__()
+        if options is None:
+            options = Options()
+        self._dict_cls = options.dict_cls or self.MAP_TYPE
+        if options.custom_functions is not None:
+            self._functions = options.custom_functions
+        else:
+            self._functions = functions.Functions()
+
+    def compile(self, node):
+        return self.visit(node)
+
+    def default_visit(self, node, *args, **kwargs):
+        raise NotImplementedError(node['type'])
+
+    def _chain(self, node):
+        compiled = [self.visit(child) for child in node['children']]
+        if len(compiled) == 1:
+            return compiled[0]
+        if len(compiled) == 2:
+            first, second = compiled
+
+            def chain(value):
+                return second(first(value))
+            return chain
+
+        def chain(value):
+            for child in compiled:
+                value = child(value)
+            return value
+        return chain
+
+    visit_subexpression = _chain
+    visit_index_expression = _chain
+    visit_pipe = _chain
+
+    def visit_field(self, node):
+        name = node['value']
+
+        def field(value):
+            try:
+                return value.get(name)
+            except AttributeError:
+                return None
+        return field
+
+    def visit_comparator(self, node):
+        comparator_func = self.COMPARATOR_FUNC[node['value']]
+        left = self.visit(node['children'][0])
+        right = self.visit(node['children'][1])
+        if node['value'] in self._EQUALITY_OPS:
+            def comparator(value):
+                return comparator_func(left(value), right(value))
+            return comparator
+
+        def ordering(value):
+            # Ordering operators are only valid for numbers and strings.
+            left_value = left(value)
+            right_value = right(value)
+            if not (_is_comparable(left_value) and
+                    _is_comparable(right_value)):
+                return None
+            return comparator_func(left_value, right_value)
+        return ordering
+
+    def visit_current(self, node):
+        return _identity
+
+    visit_identity = visit_current
+
+    def visit_expref(self, node):
+        expression = _Expression(
+            node['children'][0],
+            _CompiledVisitor(self.visit(node['children'][0])))
+
+        def expref(value):
+            return expression
+        return expref
+
+    def visit_function_expression(self, node):
+        call_function = self._functions.call_function
+        name = node['value']
+        args = [self.visit(child) for child in node['children']]
+
+        def function_expression(value):
+            return call_function(name, [arg(value) for arg in args])
+        return function_expression
+
+    def visit_filter_projection(self, node):
+        base = self.visit(node['children'][0])
+        condition = self.visit(node['children'][2])
+        if node['children'][1]['type'] == 'identity':
+            def filter_projection(value):
+                elements = base(value)
+                if not isinstance(elements, list):
+                    return None
+                return [element for element in elements
+                        if not _is_false(condition(element))
+                        and element is not None]
+            return filter_projection
+
+        right = self.visit(node['children'][1])
+
+        def filter_projection(value):
+            elements = base(value)
+            if not isinstance(elements, list):
+                return None
+            collected = []
+            for element in elements:
+                if not _is_false(condition(element)):
+                    current = right(element)
+                    if current is not None:
+                        collected.append(current)
+            return collected
+        return filter_projection
+
+    def visit_flatten(self, node):
+        base = self.visit(node['children'][0])
+
+        def flatten(value):
+            elements = base(value)
+            if not isinstance(elements, list):
+                # Can't flatten the object if it's not a list.
+                return None
+            merged_list = []
+            for element in elements:
+                if isinstance(element, list):
+                    merged_list.extend(element)
+                else:
+                    merged_list.append(element)
+            return merged_list
+        return flatten
+
+    def visit_index(self, node):
+        position = node['value']
+
+        def index(value):
+            # Even though we can index strings, we don't
+            # want to support that.
+            if not isinstance(value, list):
+                return None
+            try:
+                return value[position]
+            except IndexError:
+                return None
+        return index
+
+    def visit_slice(self, node):
+        bounds = slice(*node['children'])
+
+        def slice_(value):
+            if not isinstance(value, list):
+                return None
+            return value[bounds]
+        return slice_
+
+    def visit_key_val_pair(self, node):
+        return self.visit(node['children'][0])
+
+    def visit_literal(self, node):
+        literal_value = node['value']
+
+        def literal(value):
+            return literal_value
+        return literal
+
+    def visit_multi_select_dict(self, node):
+        dict_cls = self._dict_cls
+        pairs = [(child['value'], self.visit(child))
+                 for child in node['children']]
+
+        def multi_select_dict(value):
+            if value is None:
+                return None
+            collected = dict_cls()
+            for key, child in pairs:
+                collected[key] = child(value)
+            return collected
+        return multi_select_dict
+
+    def visit_multi_select_list(self, node):
+        children = [self.visit(child) for child in node['children']]
+
+        def multi_select_list(value):
+            if value is None:
+                return None
+            return [child(value) for child in children]
+        return multi_select_list
+
+    def visit_or_expression(self, node):
+        left = self.visit(node['children'][0])
+        right = self.visit(node['children'][1])
+
+        def or_expression(value):
+            matched = left(value)
+            if _is_false(matched):
+                matched = right(value)
+            return matched
+        return or_expression
+
+    def visit_and_expression(self, node):
+        left = self.visit(node['children'][0])
+        right = self.visit(node['children'][1])
+
+        def and_expression(value):
+            matched = left(value)
+            if _is_false(matched):
+                return matched
+            return right(value)
+        return and_expression
+
+    def visit_not_expression(self, node):
+        child = self.visit(node['children'][0])
+
+        def not_expression(value):
+            original_result = child(value)
+            if _is_actual_number(original_result) and original_result == 0:
+                # Special case for 0, !0 should be false, not true.
+                # 0 is not a special cased integer in jmespath.
+                return False
+            return not original_result
+        return not_expression
+
+    def visit_projection(self, node):
+        base = self.visit(node['children'][0])
+        right_node = node['children'][1]
+        if right_node['type'] == 'identity':
+            def projection(value):
+                elements = base(value)
+                if not isinstance(elements, list):
+                    return None
+                return [element for element in elements
+                        if element is not None]
+            return projection
+
+        if right_node['type'] == 'field':
+            # foo[*].bar, the most common projection.
+            name = right_node['value']
+
+            def field_projection(value):
+                elements = base(value)
+                if not isinstance(elements, list):
+                    return None
+                collected = []
+                for element in elements:
+                    try:
+                        current = element.get(name)
+                    except AttributeError:
+                        continue
+                    if current is not None:
+                        collected.append(current)
+                return collected
+            return field_projection
+
+        right = self.visit(right_node)
+
+        def projection(value):
+            elements = base(value)
+            if not isinstance(elements, list):
+                return None
+            collected = []
+            for element in elements:
+                current = right(element)
+                if current is not None:
+                    collected.append(current)
+            return collected
+        return projection
+
+    def visit_value_projection(self, node):
+        base = self.visit(node['children'][0])
+        right = self.visit(node['children'][1])
+
+        def value_projection(value):
+            try:
+                elements = base(value).values()
+            except AttributeError:
+                return None
+            collected = []
+            for element in elements:
+                current = right(element)
+                if current is not None:
+                    collected.append(current)
+            return collected
+        return value_projection
+
+
+def _identity(value):
+    return value
+
+
 class GraphvizVisitor(Visitor):
     def __init__(self):
         super(GraphvizVisitor, self).__init__()
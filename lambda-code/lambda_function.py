@@ -1,17 +1,206 @@
+import time
+_IMPORT_STARTED = time.perf_counter()
+
 import json
 import boto3
 import urllib.parse
+from collections import OrderedDict
 from datetime import datetime
 import uuid
 import os
 import mimetypes
+import random
+import threading
+import hashlib
+import io
+import resource
+from concurrent.futures import ThreadPoolExecutor
+# boto3, botocore and s3transfer are the trees vendored in this package, not
+# the runtime's copies: DownloadBuffer, the compiled serializer, frozen
+# service models and the pool warm-up and stats only exist there
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
+from s3transfer.utils import DownloadBuffer
+from boto3.dynamodb.table import BatchWriter
+from boto3.dynamodb.conditions import Attr, ConditionExpressionBuilder
+from boto3.dynamodb.types import CompiledTypeSerializer
+
+# Pillow is optional, without it images are only catalogued
+try:
+    from PIL import Image
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+
+# Record fan-out: MAX_WORKERS wins, otherwise scale with the Lambda memory
+# size (which also scales the CPU share) within fixed bounds
+MEMORY_MB_PER_WORKER = 64
+MIN_WORKERS = 2
+MAX_WORKERS_CAP = 32
 
-# Initialize AWS clients
-s3_client = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
+def get_max_workers():
+    """Concurrency limit for per-record processing"""
+    configured = os.environ.get('MAX_WORKERS')
+    if configured:
+        return max(1, int(configured))
+    memory_mb = int(os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', '128'))
+    return max(MIN_WORKERS, min(MAX_WORKERS_CAP, memory_mb // MEMORY_MB_PER_WORKER))
+
+MAX_WORKERS = get_max_workers()
 
 # Environment variables
 TABLE_NAME = os.environ.get('DYNAMODB_TABLE', 'file-processing-log')
+# The watched upload bucket, only used to warm connections to its endpoint
+UPLOAD_BUCKET = os.environ.get('BUCKET_NAME', '')
+# "batch" collects every record of an invocation into one BatchWriter pass,
+# "single" keeps the old put_item per record
+LOGGING_MODE = os.environ.get('LOGGING_MODE', 'batch')
+BATCH_MAX_RETRIES = int(os.environ.get('BATCH_MAX_RETRIES', '5'))
+BATCH_BACKOFF_BASE = float(os.environ.get('BATCH_BACKOFF_BASE', '0.05'))
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'P3FileProcessor')
+METADATA_CACHE_SIZE = int(os.environ.get('METADATA_CACHE_SIZE', '256'))
+# Deliveries of the same object version claim a deterministic processing_id
+# first; repeats are skipped. A claim that is never completed (crash,
+# timeout) can be taken over once its lease runs out.
+IDEMPOTENCY_ENABLED = os.environ.get('IDEMPOTENCY_ENABLED', 'true').lower() == 'true'
+CLAIM_LEASE_SECONDS = int(os.environ.get('CLAIM_LEASE_SECONDS', '900'))
+# Leading bytes fetched with a single ranged GET for content sniffing
+SNIFF_BYTES = int(os.environ.get('SNIFF_BYTES', '4096'))
+# Thumbnails are written to <THUMBNAIL_PREFIX><size>/<key>, in descending size,
+# in THUMBNAIL_BUCKET. Without one they go to the source bucket, where their
+# own notifications are skipped by prefix
+THUMBNAIL_SIZES = sorted((int(size) for size in os.environ.get('THUMBNAIL_SIZES', '512,256,128').split(',')), reverse=True)
+THUMBNAIL_PREFIX = os.environ.get('THUMBNAIL_PREFIX', 'thumbnails/')
+THUMBNAIL_BUCKET = os.environ.get('THUMBNAIL_BUCKET', '')
+MAX_THUMBNAIL_SOURCE_MB = int(os.environ.get('MAX_THUMBNAIL_SOURCE_MB', '25'))
+THUMBNAIL_DOWNLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4
+)
+
+# Pooled connections idle for longer than this are reopened instead of
+# reused; a frozen execution environment can't tell the remote end (or a NAT
+# in between) dropped them. 0 keeps them until the server closes them.
+CONNECTION_MAX_IDLE_SECONDS = float(os.environ.get('CONNECTION_MAX_IDLE_SECONDS', '20')) or None
+# Connections per endpoint to open during init, so the first requests don't
+# pay for TCP and TLS handshakes. Creates the S3 and DynamoDB clients eagerly.
+PREWARM_CONNECTIONS = int(os.environ.get('PREWARM_CONNECTIONS', '0'))
+
+# Per-service client settings, with pools sized so workers don't queue on them
+# or discard connections: every worker claims and releases in DynamoDB, and
+# each worker's thumbnail download (max_concurrency ranged GETs) and uploads
+# (one PUT per size) share the S3 client. The same few request shapes repeat
+# all day, so validated input signatures are remembered.
+S3_POOL_CONNECTIONS = MAX_WORKERS * max(THUMBNAIL_DOWNLOAD_CONFIG.max_concurrency, len(THUMBNAIL_SIZES))
+CLIENT_CONFIGS = {
+    's3': Config(
+        max_pool_connections=S3_POOL_CONNECTIONS,
+        connection_max_idle_time=CONNECTION_MAX_IDLE_SECONDS,
+        parameter_validation_cache=True,
+    ),
+    'dynamodb': Config(
+        max_pool_connections=MAX_WORKERS,
+        connection_max_idle_time=CONNECTION_MAX_IDLE_SECONDS,
+        parameter_validation_cache=True,
+    ),
+}
+
+# Operations each client calls. Their shape graphs are resolved into frozen
+# shapes when the client is created, instead of lazily during the first
+# requests; FREEZE_SERVICE_MODELS=false keeps the lazily resolved models.
+FREEZE_SERVICE_MODELS = os.environ.get('FREEZE_SERVICE_MODELS', 'true').lower() == 'true'
+CLIENT_OPERATIONS = {
+    's3': ['HeadObject', 'GetObject', 'PutObject'],
+    'dynamodb': ['PutItem', 'DeleteItem', 'BatchWriteItem'],
+}
+
+class ClientRegistry:
+    """Build low-level clients on first use and keep them for the container
+    
+    Only the service models a code path actually touches get loaded, so an
+    API Gateway request never pays for S3 or DynamoDB client creation.
+    """
+    
+    def __init__(self, configs=None, frozen_operations=None):
+        self._configs = configs or {}
+        self._frozen_operations = frozen_operations or {}
+        self._clients = {}
+        self._lock = threading.Lock()
+        self.init_times_ms = {}
+    
+    def get(self, service_name):
+        client = self._clients.get(service_name)
+        if client is None:
+            # Workers may race for the first client, and the default
+            # session itself isn't safe to create concurrently
+            with self._lock:
+                client = self._clients.get(service_name)
+                if client is None:
+                    started = time.perf_counter()
+                    client = boto3.client(service_name, config=self._configs.get(service_name))
+                    if service_name in self._frozen_operations:
+                        client.meta.service_model.freeze(self._frozen_operations[service_name])
+                    self.init_times_ms[service_name] = (time.perf_counter() - started) * 1000
+                    self._clients[service_name] = client
+        return client
+    
+    def connection_stats(self):
+        """Connection counters of every client created so far, per host"""
+        stats = {}
+        for client in list(self._clients.values()):
+            stats.update(client._endpoint.http_session.connection_stats())
+        return stats
+
+clients = ClientRegistry(CLIENT_CONFIGS, CLIENT_OPERATIONS if FREEZE_SERVICE_MODELS else None)
+
+def get_s3_client():
+    return clients.get('s3')
+
+def get_dynamodb_client():
+    return clients.get('dynamodb')
+
+# Shared serializer for turning log items into DynamoDB attribute values
+_serializer = CompiledTypeSerializer()
+
+_cold_start = True
+
+class MetadataCache:
+    """Warm-container LRU of file metadata keyed by (bucket, key, ETag)
+    
+    Absorbs HEAD requests for duplicate deliveries and retries of the same
+    object version, and counts cache hits against the HEADs still sent.
+    """
+    
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+    
+    def get(self, cache_key):
+        with self._lock:
+            file_info = self._entries.get(cache_key)
+            if file_info is not None:
+                self._entries.move_to_end(cache_key)
+                self.stats['cache_hit'] += 1
+            return file_info
+    
+    def put(self, cache_key, file_info):
+        with self._lock:
+            self._entries[cache_key] = file_info
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+    
+    def record(self, source):
+        with self._lock:
+            self.stats[source] += 1
+    
+    def reset_stats(self):
+        self.stats = {'cache_hit': 0, 'head': 0}
+
+metadata_cache = MetadataCache(METADATA_CACHE_SIZE)
 
 def lambda_handler(event, context):
     print("Event received:", json.dumps(event))
@@ -28,34 +217,243 @@ def lambda_handler(event, context):
     except Exception as e:
         print(f"Error processing event: {str(e)}")
         return create_error_response(str(e))
+    
+    finally:
+        report_cold_start_metrics()
+        report_connection_metrics()
+
+def report_cold_start_metrics():
+    """Emit import and client init times once per execution environment"""
+    global _cold_start
+    if not _cold_start:
+        return
+    _cold_start = False
+    
+    metrics = {"ImportTimeMs": round(IMPORT_TIME_MS, 2)}
+    for service_name, init_ms in clients.init_times_ms.items():
+        metrics[f"{service_name.capitalize()}ClientInitMs"] = round(init_ms, 2)
+    metrics["InitTimeMs"] = round(IMPORT_TIME_MS + sum(clients.init_times_ms.values()), 2)
+    if WARM_UP_MS is not None:
+        metrics["ConnectionWarmUpMs"] = round(WARM_UP_MS, 2)
+    emit_metrics(metrics)
+
+_connection_totals = {}
+
+def report_connection_metrics():
+    """Emit how many connections this invocation opened, reused and discarded"""
+    totals = {}
+    for counters in clients.connection_stats().values():
+        for name, count in counters.items():
+            totals[name] = totals.get(name, 0) + count
+    if not totals:
+        return
+    emit_metrics({
+        f"Connections{name.capitalize()}": count - _connection_totals.get(name, 0)
+        for name, count in totals.items()
+    }, unit="Count")
+    _connection_totals.update(totals)
+
+def warm_connections(connections):
+    """Open pooled connections to DynamoDB and the S3 buckets during init
+    
+    S3 connections go to the upload bucket, where each record's HEAD and
+    ranged GET are sent, and to the thumbnail bucket when it is a different
+    one. Returns the time taken in milliseconds. Failures only mean the
+    first requests open their own connections.
+    """
+    started = time.perf_counter()
+    dynamodb_client = get_dynamodb_client()
+    dynamodb_client._endpoint.http_session.warm_up(dynamodb_client.meta.endpoint_url, connections)
+    s3_client = get_s3_client()
+    operation_model = s3_client.meta.service_model.operation_model('HeadObject')
+    urls = []
+    for bucket in dict.fromkeys(b for b in (UPLOAD_BUCKET, THUMBNAIL_BUCKET) if b):
+        try:
+            # Requests go to the bucket's (virtual hosted) endpoint, which
+            # only the endpoint ruleset knows
+            endpoint_url = s3_client._resolve_endpoint_ruleset(
+                operation_model, {'Bucket': bucket}, {}
+            )[0]
+        except Exception as e:
+            print(f"Could not resolve the endpoint of bucket {bucket}: {str(e)}")
+            continue
+        if endpoint_url not in urls:
+            urls.append(endpoint_url)
+    for url in urls:
+        s3_client._endpoint.http_session.warm_up(url, connections)
+    return (time.perf_counter() - started) * 1000
+
+def emit_metrics(metrics, unit="Milliseconds"):
+    """Print metrics in CloudWatch Embedded Metric Format"""
+    print(json.dumps({
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": METRICS_NAMESPACE,
+                "Dimensions": [["FunctionName"]],
+                "Metrics": [{"Name": name, "Unit": unit} for name in metrics]
+            }]
+        },
+        "FunctionName": os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'local'),
+        **metrics
+    }))
 
 def handle_s3_event(event):
     """Process S3 file upload events"""
     results = []
+    logged_results = []
+    log_items = []
+    metadata_cache.reset_stats()
     
-    for record in event['Records']:
-        bucket = record['s3']['bucket']['name']
-        key = urllib.parse.unquote_plus(record['s3']['object']['key'])
-        
-        print(f"Processing file: {key} from bucket: {bucket}")
-        
-        # Get file metadata
-        file_info = get_file_metadata(bucket, key)
-        
-        # Process based on file type (without Pillow)
-        processing_result = process_file_basic(bucket, key, file_info)
+    # Records are processed concurrently but come back in event order
+    for bucket, key, file_info, processing_result in process_records(event['Records']):
+        results.append(processing_result)
+        if processing_result['processing_type'] == "skipped":
+            continue
         
         # Log to DynamoDB
-        log_processing_event(bucket, key, file_info, processing_result)
-        
-        results.append(processing_result)
+        if LOGGING_MODE == 'batch':
+            log_items.append(build_log_item(bucket, key, file_info, processing_result))
+            logged_results.append(processing_result)
+        else:
+            logged = log_processing_event(bucket, key, file_info, processing_result)
+            processing_result['log_status'] = "logged" if logged else "failed"
+    
+    if log_items:
+        failures = log_processing_events_batch(log_items)
+        for item, result in zip(log_items, logged_results):
+            error = failures.get(item['processing_id'])
+            result['log_status'] = "failed" if error else "logged"
+            if error:
+                result['log_error'] = error
+    
+    report_metadata_metrics()
+    # Process wide, so reported per invocation rather than per thumbnail
+    emit_metrics({"PeakRssMb": peak_rss_mb()}, unit="Megabytes")
     
     return create_success_response({
         "message": "Files processed successfully",
         "processed_files": len(results),
+        "duplicates_skipped": sum(1 for r in results if r['status'] == "duplicate"),
+        "thumbnails_skipped": sum(1 for r in results if r['status'] == "thumbnail"),
+        "failed_logs": sum(1 for r in results if r.get('log_status') == "failed"),
         "results": results
     })
 
+def process_records(records):
+    """Run process_record over all records with a bounded worker pool"""
+    if len(records) <= 1:
+        return [process_record(record) for record in records]
+    
+    workers = min(MAX_WORKERS, len(records))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() yields in submission order and re-raises worker exceptions
+        return list(executor.map(process_record, records))
+
+def process_record(record):
+    """Fetch metadata and process a single S3 record"""
+    bucket = record['s3']['bucket']['name']
+    key = urllib.parse.unquote_plus(record['s3']['object']['key'])
+    
+    # Thumbnails written back to the watched bucket arrive as new uploads
+    if key.startswith(THUMBNAIL_PREFIX) and THUMBNAIL_BUCKET in ('', bucket):
+        print(f"Skipping generated thumbnail: {key} from bucket: {bucket}")
+        return bucket, key, None, {
+            "file_name": os.path.basename(key),
+            "processing_type": "skipped",
+            "status": "thumbnail"
+        }
+    
+    # Claim the work before touching S3 so repeated deliveries stop here
+    processing_id = idempotency_key(record) if IDEMPOTENCY_ENABLED else None
+    if processing_id and not claim_processing(processing_id, bucket, key):
+        print(f"Skipping duplicate delivery: {key} from bucket: {bucket}")
+        return bucket, key, None, {
+            "file_name": os.path.basename(key),
+            "processing_id": processing_id,
+            "processing_type": "skipped",
+            "status": "duplicate"
+        }
+    
+    print(f"Processing file: {key} from bucket: {bucket}")
+    
+    try:
+        # Get file metadata
+        file_info = get_file_metadata(bucket, key, record)
+        
+        # Process based on file type
+        processing_result = process_file_basic(bucket, key, file_info)
+    except Exception:
+        if processing_id:
+            release_claim(processing_id)
+        raise
+    
+    if processing_id:
+        processing_result['processing_id'] = processing_id
+    return bucket, key, file_info, processing_result
+
+def idempotency_key(record):
+    """Deterministic processing_id for one object version's notification"""
+    s3_record = record['s3']
+    s3_object = s3_record['object']
+    # sequencer orders events per key; versionId/eTag cover events without it
+    version = s3_object.get('versionId') or ''
+    sequencer = s3_object.get('sequencer') or ''
+    if not (version or sequencer):
+        if not s3_object.get('eTag'):
+            return None
+        sequencer = s3_object['eTag']
+    source = "\0".join([s3_record['bucket']['name'], s3_object['key'], version, sequencer])
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def claim_processing(processing_id, bucket, key):
+    """Conditionally write a claim item, False if the work is already taken"""
+    now = int(time.time())
+    # The finished log row replaces the claim and has no lease, so only
+    # abandoned claims ever match the lease_expires branch
+    condition = Attr('processing_id').not_exists() | Attr('lease_expires').lt(now)
+    expression, names, values = ConditionExpressionBuilder().build_expression(condition)
+    claim = {
+        'processing_id': processing_id,
+        'timestamp': datetime.now().isoformat(),
+        'bucket': bucket,
+        'file_key': key,
+        'status': 'in_progress',
+        'lease_expires': now + CLAIM_LEASE_SECONDS,
+        'ttl': now + (30 * 24 * 60 * 60)
+    }
+    try:
+        get_dynamodb_client().put_item(
+            TableName=TABLE_NAME,
+            Item=serialize_item(claim),
+            ConditionExpression=expression,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=serialize_item(values)
+        )
+        return True
+    except get_dynamodb_client().exceptions.ConditionalCheckFailedException:
+        return False
+    except Exception as e:
+        # Fail open, a duplicate is better than a dropped upload
+        print(f"Error claiming {processing_id}: {str(e)}")
+        return True
+
+def release_claim(processing_id):
+    """Drop an in-progress claim so a retry doesn't wait for the lease"""
+    expression, names, values = ConditionExpressionBuilder().build_expression(
+        Attr('status').eq('in_progress')
+    )
+    try:
+        get_dynamodb_client().delete_item(
+            TableName=TABLE_NAME,
+            Key=serialize_item({'processing_id': processing_id}),
+            ConditionExpression=expression,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=serialize_item(values)
+        )
+    except Exception as e:
+        print(f"Error releasing claim {processing_id}: {str(e)}")
+
 def handle_api_gateway_event(event):
     """Handle API Gateway requests"""
     body = {}
@@ -75,40 +473,100 @@ def handle_api_gateway_event(event):
         "timestamp": datetime.now().isoformat()
     })
 
-def get_file_metadata(bucket, key):
-    """Get file metadata"""
+def get_file_metadata(bucket, key, record=None):
+    """Get file metadata, taking size and ETag from the event payload"""
+    event_info = metadata_from_event(record) if record else {}
+    from_event = all(event_info.get(field) is not None for field in ('file_size', 'etag'))
+    
+    # Events carry no LastModified, so that comes from HEAD, unless a
+    # duplicate delivery of the same object version already paid for it
+    version = event_info.get('etag') or (record or {}).get('s3', {}).get('object', {}).get('versionId')
+    cache_key = (bucket, key, version) if version else None
+    if cache_key:
+        cached = metadata_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+    
     try:
-        response = s3_client.head_object(Bucket=bucket, Key=key)
-        file_ext = os.path.splitext(key)[1].lower()
-        mime_type, _ = mimetypes.guess_type(key)
-        
-        return {
-            "file_name": os.path.basename(key),
-            "file_path": key,
-            "file_size": response.get('ContentLength', 0),
-            "file_extension": file_ext,
-            "mime_type": mime_type,
-            "last_modified": response.get('LastModified').isoformat() if response.get('LastModified') else None,
-            "etag": response.get('ETag', '').strip('"')
-        }
+        response = get_s3_client().head_object(Bucket=bucket, Key=key)
+        metadata_cache.record('head')
+        file_info = build_file_info(
+            key,
+            file_size=event_info['file_size'] if from_event else response.get('ContentLength', 0),
+            last_modified=response.get('LastModified').isoformat() if response.get('LastModified') else None,
+            etag=event_info['etag'] if from_event else response.get('ETag', '').strip('"')
+        )
+        if cache_key:
+            metadata_cache.put(cache_key, dict(file_info))
+        return file_info
     except Exception as e:
         print(f"Error getting file metadata: {str(e)}")
         return {"error": str(e)}
 
+def metadata_from_event(record):
+    """Pull size and ETag out of an S3 event record"""
+    # eventTime is when the notification was emitted, not the object's
+    # LastModified, so it is not used
+    s3_object = record.get('s3', {}).get('object', {})
+    return {
+        "file_size": s3_object.get('size'),
+        "etag": s3_object.get('eTag')
+    }
+
+def build_file_info(key, file_size, last_modified, etag):
+    """Assemble the file_info structure shared by every metadata source"""
+    file_ext = os.path.splitext(key)[1].lower()
+    mime_type, _ = mimetypes.guess_type(key)
+    
+    return {
+        "file_name": os.path.basename(key),
+        "file_path": key,
+        "file_size": file_size,
+        "file_extension": file_ext,
+        "mime_type": mime_type,
+        "last_modified": last_modified,
+        "etag": etag
+    }
+
+def report_metadata_metrics():
+    """Emit how many of this invocation's metadata lookups needed a HEAD"""
+    stats = metadata_cache.stats
+    emit_metrics({
+        "MetadataCacheHits": stats['cache_hit'],
+        "MetadataHeadRequests": stats['head']
+    }, unit="Count")
+    lookups = stats['cache_hit'] + stats['head']
+    if lookups:
+        emit_metrics({"MetadataCacheHitRatio": round(100 * stats['cache_hit'] / lookups, 2)}, unit="Percent")
+
 def process_file_basic(bucket, key, file_info):
-    """Basic file processing without image manipulation"""
+    """Classify a file by its content and process it by type, thumbnailing images"""
     file_ext = file_info.get('file_extension', '').lower()
     mime_type = file_info.get('mime_type', '')
     
-    if mime_type and mime_type.startswith('image/') or file_ext in ['.jpg', '.jpeg', '.png', '.gif']:
-        processing_type = "image"
+    # Prefer what the bytes say, the extension is only a fallback
+    extension_type = classify_by_extension(file_ext, mime_type)
+    detected = sniff_file_type(bucket, key, file_info)
+    if detected and detected['format'] in ("TEXT", "XML") and is_text_mime_type(mime_type):
+        # Generic text or XML is all the bytes say, the extension is more specific
+        detected = None
+    if detected:
+        processing_type = detected['processing_type']
+        file_format = detected['format']
+    else:
+        processing_type = extension_type
+        file_format = file_ext.replace('.', '').upper()
+    
+    if processing_type == "image":
         details = {
             "message": "Image file detected - thumbnail creation requires additional setup",
             "file_size_mb": int(file_info.get('file_size', 0) // (1024 * 1024)),
-            "format": file_ext.replace('.', '').upper()
+            "format": file_format
         }
-    elif file_ext in ['.pdf', '.txt', '.doc', '.docx']:
-        processing_type = "document"
+        # Pillow only decodes raster images
+        if PILLOW_AVAILABLE and file_format != "SVG":
+            details.update(create_thumbnails(bucket, key, file_info))
+    elif processing_type == "document":
         details = {
             "message": "Document processed and catalogued",
             "file_size_mb": int(file_info.get('file_size', 0) // (1024 * 1024))
@@ -120,6 +578,14 @@ def process_file_basic(bucket, key, file_info):
             "file_size_mb": int(file_info.get('file_size', 0) // (1024 * 1024))
         }
     
+    if detected:
+        details["detected_by"] = "content"
+        details["detected_format"] = detected['format']
+        details["detected_mime_type"] = detected['mime_type']
+        details["extension_mismatch"] = extension_type != processing_type
+    else:
+        details["detected_by"] = "extension"
+    
     return {
         "file_name": file_info.get('file_name'),
         "processing_type": processing_type,
@@ -127,26 +593,281 @@ def process_file_basic(bucket, key, file_info):
         "details": details
     }
 
-def log_processing_event(bucket, key, file_info, processing_result):
-    """Log processing event to DynamoDB"""
+def classify_by_extension(file_ext, mime_type):
+    """Processing type implied by the file name alone"""
+    if mime_type and mime_type.startswith('image/') or file_ext in ['.jpg', '.jpeg', '.png', '.gif']:
+        return "image"
+    if file_ext in ['.pdf', '.txt', '.doc', '.docx']:
+        return "document"
+    return "general"
+
+def is_text_mime_type(mime_type):
+    """Whether the MIME type is a text based format (CSV, JSON, SVG, ...)"""
+    if not mime_type:
+        return False
+    return mime_type.startswith('text/') or mime_type.endswith(('/json', '+json', '/xml', '+xml', '/javascript'))
+
+# Content detectors run in registration order against the object's leading
+# bytes; each returns (processing_type, format, mime_type) or None
+CONTENT_DETECTORS = []
+
+def content_detector(func):
+    """Register a content detector"""
+    CONTENT_DETECTORS.append(func)
+    return func
+
+@content_detector
+def detect_jpeg(head):
+    if head.startswith(b'\xff\xd8\xff'):
+        return "image", "JPEG", "image/jpeg"
+
+@content_detector
+def detect_png(head):
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return "image", "PNG", "image/png"
+
+@content_detector
+def detect_gif(head):
+    if head.startswith((b'GIF87a', b'GIF89a')):
+        return "image", "GIF", "image/gif"
+
+@content_detector
+def detect_pdf(head):
+    # The header may be preceded by a little garbage, readers allow 1KB
+    if b'%PDF-' in head[:1024]:
+        return "document", "PDF", "application/pdf"
+
+# Part names that identify the Office Open XML flavour inside the zip
+OFFICE_ZIP_MARKERS = [
+    (b'word/', "DOCX", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    (b'xl/', "XLSX", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    (b'ppt/', "PPTX", "application/vnd.openxmlformats-officedocument.presentationml.presentation"),
+]
+
+@content_detector
+def detect_zip(head):
+    if not head.startswith(b'PK\x03\x04'):
+        return None
+    for marker, file_format, mime_type in OFFICE_ZIP_MARKERS:
+        if marker in head:
+            return "document", file_format, mime_type
+    if b'[Content_Types].xml' in head:
+        return "document", "OOXML", "application/octet-stream"
+    return "general", "ZIP", "application/zip"
+
+@content_detector
+def detect_markup(head):
+    # SVG and other XML are text too, tell them apart before detect_text
+    text = head[3:] if head.startswith(b'\xef\xbb\xbf') else head
+    text = text.lstrip().lower()
+    if text.startswith(b'<svg') or (text.startswith((b'<?xml', b'<!doctype svg', b'<!--')) and b'<svg' in text):
+        return "image", "SVG", "image/svg+xml"
+    if text.startswith(b'<?xml'):
+        return "document", "XML", "application/xml"
+
+@content_detector
+def detect_text(head):
+    if not head or b'\x00' in head:
+        return None
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # The range may cut a multi-byte character in half at the end
+        if e.start < len(head) - 3:
+            return None
+    return "document", "TEXT", "text/plain"
+
+def sniff_file_type(bucket, key, file_info):
+    """Detect the file type from one ranged GET of its first bytes"""
+    if file_info.get('error') or not file_info.get('file_size'):
+        return None
+    try:
+        response = get_s3_client().get_object(
+            Bucket=bucket, Key=key, Range=f"bytes=0-{SNIFF_BYTES - 1}"
+        )
+        with response['Body'] as body:
+            head = body.read(SNIFF_BYTES)
+    except Exception as e:
+        print(f"Error reading file header: {str(e)}")
+        return None
+    
+    for detector in CONTENT_DETECTORS:
+        match = detector(head)
+        if match:
+            processing_type, file_format, mime_type = match
+            return {"processing_type": processing_type, "format": file_format, "mime_type": mime_type}
+    return None
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far (ru_maxrss is KB on Linux)
+    
+    A high-water mark over every worker thread and every earlier invocation
+    of the execution environment, not a per-image measurement.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+def create_thumbnails(bucket, key, file_info):
+    """Download an image once, decode it reduced and upload every thumbnail size"""
+    max_bytes = MAX_THUMBNAIL_SOURCE_MB * 1024 * 1024
+    if file_info.get('file_size', 0) > max_bytes:
+        return {"message": f"Image larger than {MAX_THUMBNAIL_SOURCE_MB} MB - thumbnails skipped"}
+    
+    timings = {}
     try:
-        table = dynamodb.Table(TABLE_NAME)
+        # Ranged, concurrent GETs read straight into one preallocated buffer
+        started = time.perf_counter()
+        buffer = DownloadBuffer(max_size=max_bytes)
+        get_s3_client().download_fileobj(bucket, key, buffer, Config=THUMBNAIL_DOWNLOAD_CONFIG)
+        timings["download_ms"] = int((time.perf_counter() - started) * 1000)
         
-        item = {
-            'processing_id': str(uuid.uuid4()),
-            'timestamp': datetime.now().isoformat(),
-            'bucket': bucket,
-            'file_key': key,
-            'file_info': file_info,
-            'processing_result': processing_result,
-            'ttl': int(datetime.now().timestamp()) + (30 * 24 * 60 * 60)
-        }
+        # draft() lets the JPEG decoder scale by 1/2..1/8 while decoding, other
+        # formats are shrunk with reduce() via the reducing_gap of thumbnail()
+        started = time.perf_counter()
+        largest = THUMBNAIL_SIZES[0]
+        image = Image.open(buffer)
+        source_format = image.format
+        source_size = image.size
+        image.draft('RGB', (largest, largest))
+        image.thumbnail((largest, largest), reducing_gap=2.0)
+        decoded_bytes = image.width * image.height * len(image.getbands())
+        timings["decode_ms"] = int((time.perf_counter() - started) * 1000)
+        buffer.close()
+        
+        # Each smaller size is derived from the previous one, not the source
+        started = time.perf_counter()
+        output_format = "JPEG" if source_format == "JPEG" else "PNG"
+        encoded = []
+        for size in THUMBNAIL_SIZES:
+            image.thumbnail((size, size))
+            out = io.BytesIO()
+            image.save(out, format=output_format)
+            encoded.append((size, image.size, out.getvalue()))
+        timings["resize_ms"] = int((time.perf_counter() - started) * 1000)
         
-        table.put_item(Item=item)
+        started = time.perf_counter()
+        target_bucket = THUMBNAIL_BUCKET or bucket
+        content_type = f"image/{output_format.lower()}"
+        with ThreadPoolExecutor(max_workers=len(encoded)) as executor:
+            thumbnails = list(executor.map(
+                lambda thumb: upload_thumbnail(target_bucket, key, content_type, *thumb), encoded
+            ))
+        timings["upload_ms"] = int((time.perf_counter() - started) * 1000)
+        
+    except Exception as e:
+        print(f"Error creating thumbnails for {key}: {str(e)}")
+        return {"message": "Image file detected - thumbnail creation failed", "thumbnail_error": str(e), "timings": timings}
+    
+    return {
+        "message": f"Image file processed - {len(thumbnails)} thumbnails created",
+        "source_dimensions": list(source_size),
+        "thumbnails": thumbnails,
+        "timings": timings,
+        "memory": {
+            "source_kb": int(file_info.get('file_size', 0) // 1024),
+            "decoded_kb": int(decoded_bytes // 1024)
+        }
+    }
+
+def upload_thumbnail(bucket, key, content_type, size, dimensions, body):
+    """Write one encoded thumbnail back to S3"""
+    thumbnail_key = f"{THUMBNAIL_PREFIX}{size}/{key}"
+    get_s3_client().put_object(Bucket=bucket, Key=thumbnail_key, Body=body, ContentType=content_type)
+    return {"size": size, "key": thumbnail_key, "dimensions": list(dimensions), "bytes": len(body)}
+
+def build_log_item(bucket, key, file_info, processing_result):
+    """Build the DynamoDB item for a processing event"""
+    return {
+        'processing_id': processing_result.get('processing_id') or str(uuid.uuid4()),
+        'timestamp': datetime.now().isoformat(),
+        'bucket': bucket,
+        'file_key': key,
+        'file_info': file_info,
+        'processing_result': processing_result,
+        'ttl': int(datetime.now().timestamp()) + (30 * 24 * 60 * 60)
+    }
+
+def serialize_item(item):
+    """Convert a log item to the low-level DynamoDB wire format"""
+    # Log items share a few shapes, so their handlers are cached
+    return _serializer.serialize_item(item)
+
+def log_processing_event(bucket, key, file_info, processing_result):
+    """Log processing event to DynamoDB"""
+    try:
+        item = build_log_item(bucket, key, file_info, processing_result)
+        get_dynamodb_client().put_item(TableName=TABLE_NAME, Item=serialize_item(item))
         print(f"Logged processing event for {key}")
+        return True
         
     except Exception as e:
         print(f"Error logging to DynamoDB: {str(e)}")
+        return False
+
+class RetryingBatchWriter(BatchWriter):
+    """BatchWriter that backs off on unprocessed items and records failures
+    
+    The stock writer re-queues UnprocessedItems straight into the next
+    request and raises on the first client error.  Here every request is
+    tracked by processing_id so the handler can tell which records made it.
+    Items are passed in already serialized, so a plain low-level client
+    works without the resource layer's transformation hooks.
+    """
+    
+    def __init__(self, table_name, client, max_retries=BATCH_MAX_RETRIES,
+                 backoff_base=BATCH_BACKOFF_BASE):
+        # Deterministic ids can repeat within an invocation, and a batch
+        # request must not contain the same key twice
+        super().__init__(table_name, client, overwrite_by_pkeys=['processing_id'])
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._attempts = {}
+        self.failed = {}
+    
+    def _flush(self):
+        items_to_send = self._items_buffer[:self._flush_amount]
+        self._items_buffer = self._items_buffer[self._flush_amount:]
+        try:
+            response = self._client.batch_write_item(
+                RequestItems={self._table_name: items_to_send}
+            )
+        except Exception as e:
+            for request in items_to_send:
+                self.failed[_request_id(request)] = str(e)
+            return
+        
+        unprocessed = (response.get('UnprocessedItems') or {}).get(self._table_name, [])
+        retry = []
+        for request in unprocessed:
+            request_id = _request_id(request)
+            attempts = self._attempts.get(request_id, 0) + 1
+            self._attempts[request_id] = attempts
+            if attempts > self._max_retries:
+                self.failed[request_id] = f"Unprocessed after {self._max_retries} retries"
+            else:
+                retry.append(request)
+        
+        if retry:
+            # Exponential backoff with jitter, driven by the most retried item
+            attempt = max(self._attempts[_request_id(r)] for r in retry)
+            delay = self._backoff_base * (2 ** (attempt - 1))
+            time.sleep(delay + random.uniform(0, delay))
+            self._items_buffer.extend(retry)
+
+def _request_id(request):
+    return request['PutRequest']['Item']['processing_id']['S']
+
+def log_processing_events_batch(items):
+    """Log a batch of processing events, returning {processing_id: error} for failures"""
+    try:
+        with RetryingBatchWriter(TABLE_NAME, get_dynamodb_client()) as writer:
+            for item in items:
+                writer.put_item(Item=serialize_item(item))
+        print(f"Batch logged {len(items) - len(writer.failed)}/{len(items)} processing events")
+        return writer.failed
+    
+    except Exception as e:
+        print(f"Error batch logging to DynamoDB: {str(e)}")
+        return {item['processing_id']: str(e) for item in items}
 
 def create_success_response(data):
     """Create successful API response"""
@@ -172,3 +893,6 @@ def create_error_response(error_message):
             "timestamp": datetime.now().isoformat()
         })
     }
+
+IMPORT_TIME_MS = (time.perf_counter() - _IMPORT_STARTED) * 1000
+WARM_UP_MS = warm_connections(PREWARM_CONNECTIONS) if PREWARM_CONNECTIONS > 0 else None
@@ -0,0 +1,292 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import logging
+import math
+import statistics
+import threading
+import time
+
+from s3transfer.utils import (
+    MAX_PARTS,
+    MAX_SINGLE_UPLOAD_SIZE,
+    MIN_UPLOAD_CHUNKSIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+DEFAULT_AUTOTUNE_MAX_MEMORY = 256 * MB
+
+
+class TransferAutotuner:
+    # A window has to beat the best throughput seen by this much for a
+    # change to be kept.
+    IMPROVEMENT = 0.05
+    # The adjustments tried, in order, whenever the previous one did not
+    # pay off.  Concurrency moves by a quarter (at least one part), part
+    # sizes double or halve.
+    MOVES = (
+        ('concurrency', 1),
+        ('chunksize', 1),
+        ('concurrency', -1),
+        ('chunksize', -1),
+    )
+
+    def __init__(
+        self,
+        chunksize,
+        max_concurrency,
+        max_memory=DEFAULT_AUTOTUNE_MAX_MEMORY,
+        min_chunksize=MIN_UPLOAD_CHUNKSIZE,
+        max_chunksize=MAX_SINGLE_UPLOAD_SIZE,
+        max_parts=MAX_PARTS,
+        time_function=time.monotonic,
+    ):
+        """Tunes the part size and in-flight part count of one transfer
+
+        Parts are handed out with ``reserve_part()``, which blocks while the
+        current number of parts in flight is reached, and reported back
+        with ``part_done()``.  Every window of completed parts the aggregate
+        throughput is compared against the best setting seen so far: an
+        adjustment that improved it is repeated, one that did not is undone
+        and the next kind of adjustment is tried.  Once none of them helps
+        the tuner settles on the best setting.
+
+        Part size times in-flight parts never exceeds ``max_memory``, and
+        part sizes always respect the S3 multipart limits for the bytes
+        left to transfer.
+
+        :type chunksize: int
+        :param chunksize: The part size to start with.
+
+        :type max_concurrency: int
+        :param max_concurrency: The maximum number of parts in flight. This
+            is also the starting point.
+
+        :type max_memory: int
+        :param max_memory: Upper bound, in bytes, of part size times parts
+            in flight.
+
+        :type min_chunksize: int
+        :param min_chunksize: The smallest part size to use.
+
+        :type max_chunksize: int
+        :param max_chunksize: The largest part size to use.
+
+        :type max_parts: int
+        :param max_parts: The maximum number of parts of the transfer.
+
+        :type time_function: function
+        :param time_function: Returns the current time in seconds.
+        """
+        self._time = time_function
+        self._condition = threading.Condition()
+        self._max_concurrency = max_concurrency
+        self._max_memory = max(max_memory, min_chunksize)
+        self._min_chunksize = min_chunksize
+        self._max_chunksize = max_chunksize
+        self._max_parts = max_parts
+
+        self._chunksize = min(max(chunksize, min_chunksize), max_chunksize)
+        self._concurrency = max_concurrency
+        while (
+            self._concurrency > 1
+            and self._chunksize * self._concurrency > self._max_memory
+        ):
+            self._concurrency -= 1
+        self._chunksize = min(
+            self._chunksize, max(self._max_memory // self._concurrency, 1)
+        )
+        self._chunksize = max(self._chunksize, min_chunksize)
+        self._initial = (self._chunksize, self._concurrency)
+
+        self._in_flight = 0
+        self._parts_reserved = 0
+        self._parts_done = 0
+        self._bytes_done = 0
+        self._part_rates = []
+        self._started = None
+        self._finished = None
+
+        self._window_start = None
+        self._window_bytes = 0
+        self._window_parts = 0
+        self._best = None
+        self._move = 0
+        self._failed_moves = 0
+        self._converged = False
+        self._adjustments = []
+
+    def reserve_part(self, remaining_bytes):
+        """Wait for room for another part in flight and return its size
+
+        :type remaining_bytes: int
+        :param remaining_bytes: The bytes of the transfer that have not
+            been handed out as parts yet.
+
+        :rtype: int
+        :returns: The size of the next part.
+        """
+        with self._condition:
+            while self._in_flight >= self._concurrency:
+                self._condition.wait()
+            now = self._time()
+            if self._started is None:
+                self._started = now
+                self._window_start = now
+            parts_left = max(self._max_parts - self._parts_reserved, 1)
+            part_size = max(
+                self._chunksize, int(math.ceil(remaining_bytes / parts_left))
+            )
+            part_size = min(part_size, remaining_bytes)
+            self._in_flight += 1
+            self._parts_reserved += 1
+            return part_size
+
+    def part_done(self, part_size, started):
+        """Record a finished part and release its slot
+
+        :type part_size: int
+        :param part_size: The size of the part.
+
+        :type started: float
+        :param started: The ``time_function`` value when the part was
+            submitted.
+        """
+        with self._condition:
+            now = self._time()
+            self._in_flight -= 1
+            self._parts_done += 1
+            self._bytes_done += part_size
+            self._finished = now
+            self._part_rates.append(part_size / max(now - started, 1e-6))
+            self._window_bytes += part_size
+            self._window_parts += 1
+            if not self._converged and self._window_parts >= max(
+                self._concurrency, 2
+            ):
+                throughput = self._window_bytes / max(
+                    now - self._window_start, 1e-6
+                )
+                self._adjust(throughput)
+                self._window_start = now
+                self._window_bytes = 0
+                self._window_parts = 0
+            self._condition.notify_all()
+
+    def _adjust(self, throughput):
+        self._adjustments.append(
+            {
+                'parts': self._parts_done,
+                'throughput': throughput,
+                'chunksize': self._chunksize,
+                'concurrency': self._concurrency,
+            }
+        )
+        if self._best is None:
+            # The first window only sets the baseline.  It also includes
+            # the latency of creating the multipart upload.
+            self._best = (throughput, self._chunksize, self._concurrency)
+        elif throughput > self._best[0] * (1 + self.IMPROVEMENT):
+            self._best = (throughput, self._chunksize, self._concurrency)
+            self._failed_moves = 0
+        else:
+            self._chunksize, self._concurrency = self._best[1:]
+            self._failed_moves += 1
+            self._move = (self._move + 1) % len(self.MOVES)
+        while self._failed_moves < len(self.MOVES):
+            if self._apply_move(*self.MOVES[self._move]):
+                return
+            self._failed_moves += 1
+            self._move = (self._move + 1) % len(self.MOVES)
+        self._converged = True
+        logger.debug(
+            f'Autotuning settled on chunksize {self._chunksize} and '
+            f'concurrency {self._concurrency}.'
+        )
+
+    def _apply_move(self, knob, direction):
+        chunksize, concurrency = self._chunksize, self._concurrency
+        if knob == 'concurrency':
+            step = max(concurrency // 4, 1)
+            concurrency += step * direction
+        elif direction > 0:
+            chunksize *= 2
+        else:
+            chunksize //= 2
+        if not (
+            1 <= concurrency <= self._max_concurrency
+            and self._min_chunksize <= chunksize <= self._max_chunksize
+            and chunksize * concurrency <= self._max_memory
+        ):
+            return False
+        self._chunksize, self._concurrency = chunksize, concurrency
+        return True
+
+    @property
+    def chunksize(self):
+        return self._chunksize
+
+    @property
+    def concurrency(self):
+        return self._concurrency
+
+    def summary(self):
+        """The chosen parameters and the measurements behind them
+
+        :rtype: dict
+        """
+        with self._condition:
+            elapsed = None
+            if self._started is not None and self._finished is not None:
+                elapsed = self._finished - self._started
+            return {
+                'chunksize': self._chunksize,
+                'concurrency': self._concurrency,
+                'initial_chunksize': self._initial[0],
+                'initial_concurrency': self._initial[1],
+                'max_memory': self._max_memory,
+                'converged': self._converged,
+                'parts': self._parts_done,
+                'bytes': self._bytes_done,
+                'throughput': (
+                    self._bytes_done / elapsed if elapsed else None
+                ),
+                'median_part_throughput': (
+                    statistics.median(self._part_rates)
+                    if self._part_rates
+                    else None
+                ),
+                'adjustments': list(self._adjustments),
+            }
+
+
+def create_autotuner(config, chunksize):
+    """Create a TransferAutotuner for a transfer from a TransferConfig
+
+    :type config: s3transfer.manager.TransferConfig
+    :param config: The transfer config, ``autotune_max_memory`` bounds
+        the tuner's memory use.
+
+    :type chunksize: int
+    :param chunksize: The part size to start with, already adjusted for
+        the size of the transfer.
+    """
+    max_memory = config.autotune_max_memory
+    if max_memory is None:
+        max_memory = DEFAULT_AUTOTUNE_MAX_MEMORY
+    return TransferAutotuner(
+        chunksize=chunksize,
+        max_concurrency=config.max_request_concurrency,
+        max_memory=max_memory,
+    )
@@ -160,6 +160,17 @@ class BandwidthLimitedStream:
         self._consume_through_leaky_bucket()
         return self._fileobj.read(amount)
 
+    def readinto(self, b):
+        """Read into a pre-allocated, writable bytes-like object
+
+        Reads are throttled like ``read()`` of ``len(b)`` bytes.
+        """
+        if self._bandwidth_limiting_enabled:
+            self._bytes_seen += len(b)
+            if self._bytes_seen >= self._bytes_threshold:
+                self._consume_through_leaky_bucket()
+        return self._fileobj.readinto(b)
+
     def _consume_through_leaky_bucket(self):
         # NOTE: If the read amount on the stream are high, it will result
         # in large bursty behavior as there is not an interface for partial
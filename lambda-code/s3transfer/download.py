@@ -13,9 +13,11 @@
 import heapq
 import logging
 import threading
+import time
 
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, IncompleteReadError
 
+from s3transfer.autotune import create_autotuner
 from s3transfer.compat import seekable
 from s3transfer.exceptions import RetriesExceededError, S3DownloadFailedError
 from s3transfer.futures import IN_MEMORY_DOWNLOAD_TAG
@@ -24,6 +26,7 @@ from s3transfer.utils import (
     S3_RETRYABLE_DOWNLOAD_ERRORS,
     CountCallbackInvoker,
     DeferredOpenFile,
+    DownloadBuffer,
     FunctionContainer,
     StreamReaderProgress,
     calculate_num_parts,
@@ -76,6 +79,18 @@ class DownloadOutputManager:
         """
         return None
 
+    def get_download_task_cls(self, default_task_cls):
+        """Get the class of the GetObjectTasks to download with
+
+        :type default_task_cls: class of GetObjectTask
+        :param default_task_cls: The task class the submission would use
+            for this kind of download.
+
+        :rtype: class of GetObjectTask
+        :returns: The task class to download the object with
+        """
+        return default_task_cls
+
     def get_fileobj_for_io_writes(self, transfer_future):
         """Get file-like object to use for io writes in the io executor
 
@@ -281,6 +296,31 @@ class DownloadSpecialFilenameOutputManager(DownloadNonSeekableOutputManager):
         )
 
 
+class DownloadBufferOutputManager(DownloadOutputManager):
+    """Downloads into a DownloadBuffer preallocated to the object size
+
+    GetObjectTasks read the response bodies directly into their slice of
+    the buffer, so nothing goes through the IO executor.
+    """
+
+    @classmethod
+    def is_compatible(cls, download_target, osutil):
+        return isinstance(download_target, DownloadBuffer)
+
+    def get_download_task_cls(self, default_task_cls):
+        return ReadIntoGetObjectTask
+
+    def get_fileobj_for_io_writes(self, transfer_future):
+        return transfer_future.meta.call_args.fileobj.allocate(
+            transfer_future.meta.size
+        )
+
+    def get_final_io_task(self):
+        return CompleteDownloadNOOPTask(
+            transfer_coordinator=self._transfer_coordinator
+        )
+
+
 class DownloadSubmissionTask(SubmissionTask):
     """Task for submitting tasks to execute a download"""
 
@@ -298,6 +338,7 @@ class DownloadSubmissionTask(SubmissionTask):
             input for downloads.
         """
         download_manager_resolver_chain = [
+            DownloadBufferOutputManager,
             DownloadSpecialFilenameOutputManager,
             DownloadFilenameOutputManager,
             DownloadSeekableOutputManager,
@@ -423,10 +464,14 @@ class DownloadSubmissionTask(SubmissionTask):
         # Get the final io task to run once the download is complete.
         final_task = download_output_manager.get_final_io_task()
 
+        get_object_task_cls = download_output_manager.get_download_task_cls(
+            ImmediatelyWriteIOGetObjectTask
+        )
+
         # Submit the task to download the object.
         self._transfer_coordinator.submit(
             request_executor,
-            ImmediatelyWriteIOGetObjectTask(
+            get_object_task_cls(
                 transfer_coordinator=self._transfer_coordinator,
                 main_kwargs={
                     'client': client,
@@ -467,13 +512,25 @@ class DownloadSubmissionTask(SubmissionTask):
             transfer_future
         )
 
-        # Determine the number of parts
-        part_size = config.multipart_chunksize
-        num_parts = calculate_num_parts(transfer_future.meta.size, part_size)
+        autotuner = None
+        if config.autotune:
+            autotuner = create_autotuner(config, config.multipart_chunksize)
+            transfer_future.meta.provide_autotuner(autotuner)
+            part_ranges = self._yield_tuned_part_ranges(
+                transfer_future.meta.size, autotuner
+            )
+        else:
+            part_ranges = self._yield_part_ranges(
+                transfer_future.meta.size, config.multipart_chunksize
+            )
 
         # Get any associated tags for the get object task.
         get_object_tag = download_output_manager.get_download_task_tag()
 
+        get_object_task_cls = download_output_manager.get_download_task_cls(
+            GetObjectTask
+        )
+
         # Callback invoker to submit the final io task once all downloads
         # are complete.
         finalize_download_invoker = CountCallbackInvoker(
@@ -481,12 +538,7 @@ class DownloadSubmissionTask(SubmissionTask):
                 download_output_manager, io_executor
             )
         )
-        for i in range(num_parts):
-            # Calculate the range parameter
-            range_parameter = calculate_range_parameter(
-                part_size, i, num_parts
-            )
-
+        for start_index, part_size, range_parameter in part_ranges:
             # Inject extra parameters to be passed in as extra args
             extra_args = {
                 'Range': range_parameter,
@@ -495,10 +547,17 @@ class DownloadSubmissionTask(SubmissionTask):
                 extra_args['IfMatch'] = transfer_future.meta.etag
             extra_args.update(call_args.extra_args)
             finalize_download_invoker.increment()
+            done_callbacks = [finalize_download_invoker.decrement]
+            if autotuner is not None:
+                done_callbacks.append(
+                    FunctionContainer(
+                        autotuner.part_done, part_size, time.monotonic()
+                    )
+                )
             # Submit the ranged downloads
             self._transfer_coordinator.submit(
                 request_executor,
-                GetObjectTask(
+                get_object_task_cls(
                     transfer_coordinator=self._transfer_coordinator,
                     main_kwargs={
                         'client': client,
@@ -508,17 +567,39 @@ class DownloadSubmissionTask(SubmissionTask):
                         'extra_args': extra_args,
                         'callbacks': progress_callbacks,
                         'max_attempts': config.num_download_attempts,
-                        'start_index': i * part_size,
+                        'start_index': start_index,
                         'download_output_manager': download_output_manager,
                         'io_chunksize': config.io_chunksize,
                         'bandwidth_limiter': bandwidth_limiter,
                     },
-                    done_callbacks=[finalize_download_invoker.decrement],
+                    done_callbacks=done_callbacks,
                 ),
                 tag=get_object_tag,
             )
         finalize_download_invoker.finalize()
 
+    def _yield_part_ranges(self, size, part_size):
+        num_parts = calculate_num_parts(size, part_size)
+        for i in range(num_parts):
+            # Calculate the range parameter
+            range_parameter = calculate_range_parameter(
+                part_size, i, num_parts
+            )
+            yield i * part_size, part_size, range_parameter
+
+    def _yield_tuned_part_ranges(self, size, autotuner):
+        start_index = 0
+        while start_index < size:
+            # Blocks until the autotuner allows another part in flight.
+            part_size = autotuner.reserve_part(size - start_index)
+            end_index = start_index + part_size - 1
+            if end_index >= size - 1:
+                range_parameter = f'bytes={start_index}-'
+            else:
+                range_parameter = f'bytes={start_index}-{end_index}'
+            yield start_index, part_size, range_parameter
+            start_index += part_size
+
     def _get_final_io_task_submission_callback(
         self, download_manager, io_executor
     ):
@@ -649,6 +730,111 @@ class ImmediatelyWriteIOGetObjectTask(GetObjectTask):
         task()
 
 
+class ReadIntoGetObjectTask(GetObjectTask):
+    """GetObjectTask that reads the object into a preallocated buffer
+
+    The ``fileobj`` is a writable memoryview of the whole object. The
+    response body is read with ``readinto()`` straight into the slice that
+    starts at ``start_index``, without intermediate chunks or IO tasks.
+    The slice ends where the requested range does, or at the end of the
+    buffer for a whole object GET; a body that doesn't fill it is retried.
+    """
+
+    def _main(
+        self,
+        client,
+        bucket,
+        key,
+        fileobj,
+        extra_args,
+        callbacks,
+        max_attempts,
+        download_output_manager,
+        io_chunksize,
+        start_index=0,
+        bandwidth_limiter=None,
+    ):
+        last_exception = None
+        for i in range(max_attempts):
+            try:
+                current_index = start_index
+                response = client.get_object(
+                    Bucket=bucket, Key=key, **extra_args
+                )
+                streaming_body = StreamReaderProgress(
+                    response['Body'], callbacks
+                )
+                if bandwidth_limiter:
+                    streaming_body = (
+                        bandwidth_limiter.get_bandwith_limited_stream(
+                            streaming_body, self._transfer_coordinator
+                        )
+                    )
+
+                end_index = self._get_end_index(fileobj, extra_args)
+                while current_index < end_index:
+                    # Stop reading if the transfer failed or was cancelled
+                    # somewhere else.
+                    if self._transfer_coordinator.done():
+                        return
+                    amount_read = streaming_body.readinto(
+                        fileobj[
+                            current_index : min(
+                                current_index + io_chunksize, end_index
+                            )
+                        ]
+                    )
+                    if not amount_read:
+                        # The object got smaller since its size was taken,
+                        # the rest of the buffer would be left zeroed.
+                        raise IncompleteReadError(
+                            actual_bytes=current_index - start_index,
+                            expected_bytes=end_index - start_index,
+                        )
+                    current_index += amount_read
+                # Reading past the end of the body validates its length
+                # and checksum, and catches objects that outgrew the buffer.
+                if streaming_body.read(1):
+                    raise S3DownloadFailedError(
+                        f'Contents of stored object "{key}" in bucket '
+                        f'"{bucket}" are larger than the {end_index} byte '
+                        f'download buffer.'
+                    )
+                return
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code')
+                if error_code == "PreconditionFailed":
+                    raise S3DownloadFailedError(
+                        f'Contents of stored object "{key}" in bucket '
+                        f'"{bucket}" did not match expected ETag.'
+                    )
+                else:
+                    raise
+            except S3_RETRYABLE_DOWNLOAD_ERRORS as e:
+                logger.debug(
+                    "Retrying exception caught (%s), "
+                    "retrying request, (attempt %s / %s)",
+                    e,
+                    i,
+                    max_attempts,
+                    exc_info=True,
+                )
+                last_exception = e
+                invoke_progress_callbacks(
+                    callbacks, start_index - current_index
+                )
+                continue
+        raise RetriesExceededError(last_exception)
+
+    def _get_end_index(self, fileobj, extra_args):
+        end_index = len(fileobj)
+        # Ranged GETs only fill their part, "bytes=<start>-<end>"
+        range_end = extra_args.get('Range', '').partition('-')[2]
+        if range_end.isdigit():
+            end_index = min(int(range_end) + 1, end_index)
+        return end_index
+
+
 class IOWriteTask(Task):
     def _main(self, fileobj, data, offset):
         """Pulls off an io queue to write contents to a file
@@ -135,6 +135,7 @@ class TransferMeta(BaseTransferMeta):
         self._size = None
         self._user_context = {}
         self._etag = None
+        self._autotuner = None
 
     @property
     def call_args(self):
@@ -161,6 +162,18 @@ class TransferMeta(BaseTransferMeta):
         """The etag of the stored object for validating multipart downloads"""
         return self._etag
 
+    @property
+    def tuning(self):
+        """The part size and concurrency chosen by autotuning, if enabled
+
+        A dict with the current ``chunksize`` and ``concurrency``, the
+        initial values, the measured throughput and the adjustments made.
+        It is None if the transfer is not autotuned.
+        """
+        if self._autotuner is None:
+            return None
+        return self._autotuner.summary()
+
     def provide_transfer_size(self, size):
         """A method to provide the size of a transfer request
 
@@ -179,6 +192,10 @@ class TransferMeta(BaseTransferMeta):
         """
         self._etag = etag
 
+    def provide_autotuner(self, autotuner):
+        """A method to provide the TransferAutotuner of a transfer request"""
+        self._autotuner = autotuner
+
 
 class TransferCoordinator:
     """A helper class for managing TransferFuture"""
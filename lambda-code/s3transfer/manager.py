@@ -64,6 +64,8 @@ class TransferConfig:
         max_in_memory_upload_chunks=10,
         max_in_memory_download_chunks=10,
         max_bandwidth=None,
+        autotune=False,
+        autotune_max_memory=None,
     ):
         """Configurations for the transfer manager
 
@@ -135,6 +137,16 @@ class TransferConfig:
         :param max_bandwidth: The maximum bandwidth that will be consumed
             in uploading and downloading file content. The value is in terms of
             bytes per second.
+
+        :param autotune: If True, multipart uploads of files and seekable
+            file-like objects and ranged downloads adjust their part size and
+            number of parts in flight while they run, based on the measured
+            throughput. ``multipart_chunksize`` and ``max_request_concurrency``
+            are the starting point, the latter is also the maximum. The
+            chosen values are available from ``future.meta.tuning``.
+
+        :param autotune_max_memory: The maximum of part size times parts in
+            flight, in bytes, that autotuning may use. Defaults to 256 MiB.
         """
         self.multipart_threshold = multipart_threshold
         self.multipart_chunksize = multipart_chunksize
@@ -148,7 +160,10 @@ class TransferConfig:
         self.max_in_memory_upload_chunks = max_in_memory_upload_chunks
         self.max_in_memory_download_chunks = max_in_memory_download_chunks
         self.max_bandwidth = max_bandwidth
+        self.autotune_max_memory = autotune_max_memory
         self._validate_attrs_are_nonzero()
+        # Set after validation, False is not a count of anything.
+        self.autotune = autotune
 
     def _validate_attrs_are_nonzero(self):
         for attr, attr_val in self.__dict__.items():
@@ -11,8 +11,11 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import math
+import os
+import time
 from io import BytesIO
 
+from s3transfer.autotune import create_autotuner
 from s3transfer.compat import readable, seekable
 from s3transfer.constants import FULL_OBJECT_CHECKSUM_ARGS
 from s3transfer.futures import IN_MEMORY_UPLOAD_TAG
@@ -25,6 +28,7 @@ from s3transfer.tasks import (
 from s3transfer.utils import (
     ChunksizeAdjuster,
     DeferredOpenFile,
+    FunctionContainer,
     get_callbacks,
     get_filtered_dict,
 )
@@ -209,6 +213,36 @@ class UploadInputManager:
         """
         raise NotImplementedError('must implement yield_upload_part_bodies()')
 
+    def supports_autotune(self):
+        """Whether part sizes can be chosen while the upload runs
+
+        :rtype: boolean
+        :returns: True if the manager implements
+            ``yield_tuned_upload_part_bodies()``.
+        """
+        return False
+
+    def yield_tuned_upload_part_bodies(self, transfer_future, autotuner):
+        """Yields the part number and body to use for each UploadPart
+
+        Unlike ``yield_upload_part_bodies()`` the size of every part is
+        requested from the autotuner when the part is created, which may
+        block until the autotuner allows another part in flight.
+
+        :type transfer_future: s3transfer.futures.TransferFuture
+        :param transfer_future: The future associated with upload request
+
+        :type autotuner: s3transfer.autotune.TransferAutotuner
+        :param autotuner: The autotuner of this upload.
+
+        :rtype: int, s3transfer.utils.ReadFileChunk
+        :returns: Yields the part number and the ReadFileChunk for that
+            part, like ``yield_upload_part_bodies()``.
+        """
+        raise NotImplementedError(
+            'must implement yield_tuned_upload_part_bodies()'
+        )
+
     def _wrap_fileobj(self, fileobj):
         fileobj = InterruptReader(fileobj, self._transfer_coordinator)
         if self._bandwidth_limiter:
@@ -273,35 +307,53 @@ class UploadFilenameInputManager(UploadInputManager):
         )
 
     def yield_upload_part_bodies(self, transfer_future, chunksize):
-        full_file_size = transfer_future.meta.size
         num_parts = self._get_num_parts(transfer_future, chunksize)
         for part_number in range(1, num_parts + 1):
-            callbacks = self._get_progress_callbacks(transfer_future)
-            close_callbacks = self._get_close_callbacks(callbacks)
             start_byte = chunksize * (part_number - 1)
-            # Get a file-like object for that part and the size of the full
-            # file size for the associated file-like object for that part.
-            fileobj, full_size = self._get_upload_part_fileobj_with_full_size(
-                transfer_future.meta.call_args.fileobj,
-                start_byte=start_byte,
-                part_size=chunksize,
-                full_file_size=full_file_size,
+            yield part_number, self._get_upload_part_body(
+                transfer_future, start_byte, chunksize
             )
 
-            # Wrap fileobj with interrupt reader that will quickly cancel
-            # uploads if needed instead of having to wait for the socket
-            # to completely read all of the data.
-            fileobj = self._wrap_fileobj(fileobj)
-
-            # Wrap the file-like object into a ReadFileChunk to get progress.
-            read_file_chunk = self._osutil.open_file_chunk_reader_from_fileobj(
-                fileobj=fileobj,
-                chunk_size=chunksize,
-                full_file_size=full_size,
-                callbacks=callbacks,
-                close_callbacks=close_callbacks,
+    def supports_autotune(self):
+        return True
+
+    def yield_tuned_upload_part_bodies(self, transfer_future, autotuner):
+        full_file_size = transfer_future.meta.size
+        start_byte = 0
+        part_number = 1
+        while start_byte < full_file_size:
+            part_size = autotuner.reserve_part(full_file_size - start_byte)
+            yield part_number, self._get_upload_part_body(
+                transfer_future, start_byte, part_size
             )
-            yield part_number, read_file_chunk
+            start_byte += part_size
+            part_number += 1
+
+    def _get_upload_part_body(self, transfer_future, start_byte, part_size):
+        callbacks = self._get_progress_callbacks(transfer_future)
+        close_callbacks = self._get_close_callbacks(callbacks)
+        # Get a file-like object for that part and the size of the full
+        # file size for the associated file-like object for that part.
+        fileobj, full_size = self._get_upload_part_fileobj_with_full_size(
+            transfer_future.meta.call_args.fileobj,
+            start_byte=start_byte,
+            part_size=part_size,
+            full_file_size=transfer_future.meta.size,
+        )
+
+        # Wrap fileobj with interrupt reader that will quickly cancel
+        # uploads if needed instead of having to wait for the socket
+        # to completely read all of the data.
+        fileobj = self._wrap_fileobj(fileobj)
+
+        # Wrap the file-like object into a ReadFileChunk to get progress.
+        return self._osutil.open_file_chunk_reader_from_fileobj(
+            fileobj=fileobj,
+            chunk_size=part_size,
+            full_file_size=full_size,
+            callbacks=callbacks,
+            close_callbacks=close_callbacks,
+        )
 
     def _get_deferred_open_file(self, fileobj, start_byte):
         fileobj = DeferredOpenFile(
@@ -317,6 +369,14 @@ class UploadFilenameInputManager(UploadInputManager):
     def _get_upload_part_fileobj_with_full_size(self, fileobj, **kwargs):
         start_byte = kwargs['start_byte']
         full_size = kwargs['full_file_size']
+        if self._osutil.can_map_file(fileobj):
+            # Hand out memoryview slices of a mapping of just this part
+            # instead of reading it through a file handle into new bytes.
+            part_size = min(kwargs['part_size'], full_size - start_byte)
+            part = self._osutil.open_mapped_file_part(
+                fileobj, start_byte, part_size
+            )
+            return part, part_size
         return self._get_deferred_open_file(fileobj, start_byte), full_size
 
     def _get_num_parts(self, transfer_future, part_size):
@@ -350,6 +410,18 @@ class UploadSeekableInputManager(UploadFilenameInputManager):
         )
 
     def _get_upload_part_fileobj_with_full_size(self, fileobj, **kwargs):
+        if self._osutil.can_map_file(fileobj):
+            # A regular file can be memory mapped instead, which never
+            # shares the file position and keeps the part out of memory.
+            start_byte = fileobj.tell()
+            file_size = os.fstat(fileobj.fileno()).st_size
+            part_size = min(kwargs['part_size'], file_size - start_byte)
+            part_size = max(part_size, 0)
+            fileobj.seek(start_byte + part_size)
+            part = self._osutil.open_mapped_file_part(
+                fileobj, start_byte, part_size
+            )
+            return part, part_size
         # Note: It is unfortunate that in order to do a multithreaded
         # multipart upload we cannot simply copy the filelike object
         # since there is not really a mechanism in python (i.e. os.dup
@@ -707,11 +779,28 @@ class UploadSubmissionTask(SubmissionTask):
         size = transfer_future.meta.size
         adjuster = ChunksizeAdjuster()
         chunksize = adjuster.adjust_chunksize(config.multipart_chunksize, size)
-        part_iterator = upload_input_manager.yield_upload_part_bodies(
-            transfer_future, chunksize
-        )
+        autotuner = None
+        if config.autotune and upload_input_manager.supports_autotune():
+            autotuner = create_autotuner(config, chunksize)
+            transfer_future.meta.provide_autotuner(autotuner)
+            part_iterator = (
+                upload_input_manager.yield_tuned_upload_part_bodies(
+                    transfer_future, autotuner
+                )
+            )
+        else:
+            part_iterator = upload_input_manager.yield_upload_part_bodies(
+                transfer_future, chunksize
+            )
 
         for part_number, fileobj in part_iterator:
+            done_callbacks = None
+            if autotuner is not None:
+                done_callbacks = [
+                    FunctionContainer(
+                        autotuner.part_done, len(fileobj), time.monotonic()
+                    )
+                ]
             part_futures.append(
                 self._transfer_coordinator.submit(
                     request_executor,
@@ -728,6 +817,7 @@ class UploadSubmissionTask(SubmissionTask):
                         pending_main_kwargs={
                             'upload_id': create_multipart_future
                         },
+                        done_callbacks=done_callbacks,
                     ),
                     tag=upload_part_tag,
                 )
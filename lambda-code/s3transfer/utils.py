@@ -11,8 +11,10 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import functools
+import io
 import logging
 import math
+import mmap
 import os
 import random
 import socket
@@ -286,6 +288,30 @@ class OSUtils:
     def open(self, filename, mode):
         return open(filename, mode)
 
+    def can_map_file(self, source):
+        """Checks if a filename or file object can be memory mapped.
+
+        :param source: A filename or a file object.
+
+        :returns: True if ``source`` is a regular file, that is anything
+            ``MappedFilePart`` can map.
+        """
+        try:
+            if isinstance(source, str):
+                mode = os.stat(source).st_mode
+            else:
+                mode = os.fstat(source.fileno()).st_mode
+        except (AttributeError, OSError, ValueError):
+            # No fileno() (io.UnsupportedOperation is an OSError and
+            # ValueError is raised by closed files) or no such file.
+            return False
+        return stat.S_ISREG(mode)
+
+    def open_mapped_file_part(self, source, start_byte, size):
+        return MappedFilePart(
+            source, start_byte, size, open_function=self.open
+        )
+
     def remove_file(self, filename):
         """Remove a file, noop if file does not exist."""
         # Unlike os.remove, if the file does not exist,
@@ -410,6 +436,136 @@ class DeferredOpenFile:
         self.close()
 
 
+class MappedFilePart:
+    def __init__(self, source, start_byte, size, open_function=open):
+        """A read-only file-like view of a byte range of a memory mapped file
+
+        ``read()`` returns ``memoryview`` slices of the mapping instead of
+        copying the data into new ``bytes`` objects, so checksums and the
+        HTTP layer both read straight from the page cache.  Like
+        ``DeferredOpenFile`` the mapping is only created when the part is
+        first read or seeked, in the thread that sends it.  Pages behind the
+        read position are handed back to the kernel as reading progresses,
+        so only the region currently being read stays resident.  Rewinding
+        (i.e. for a retry) simply faults them in again from the file.
+
+        The view starts at position 0 and is ``size`` bytes long, it knows
+        nothing about the rest of the file.
+
+        :param source: The name of the file to map, or an open file object
+            of a regular file.  A file object has to stay open until the
+            part is first read.
+
+        :type start_byte: int
+        :param start_byte: The offset in the file where the part starts.
+
+        :type size: int
+        :param size: The size of the part.
+
+        :type open_function: function
+        :param open_function: The function to use to open a filename
+        """
+        self._source = source
+        self._start_byte = start_byte
+        self._size = size
+        self._open_function = open_function
+        self._mmap = None
+        self._view = None
+        # Offset of the part within the mapping, which has to start at a
+        # multiple of the allocation granularity.
+        self._offset = start_byte % mmap.ALLOCATIONGRANULARITY
+        # Everything in the mapping before this offset has been released.
+        self._released = 0
+        self._position = 0
+        self._closed = False
+
+    def _map_if_needed(self):
+        if self._view is not None:
+            return
+        if self._closed:
+            raise ValueError('I/O operation on closed file.')
+        if self._size == 0:
+            # mmap can't map zero bytes.
+            self._view = memoryview(b'')
+            return
+        length = self._offset + self._size
+        offset = self._start_byte - self._offset
+        if isinstance(self._source, str):
+            with self._open_function(self._source, 'rb') as f:
+                self._mmap = mmap.mmap(
+                    f.fileno(), length, access=mmap.ACCESS_READ, offset=offset
+                )
+        else:
+            self._mmap = mmap.mmap(
+                self._source.fileno(),
+                length,
+                access=mmap.ACCESS_READ,
+                offset=offset,
+            )
+        self._view = memoryview(self._mmap)[self._offset : length]
+
+    def _release_pages_before(self, position):
+        if self._mmap is None or not hasattr(self._mmap, 'madvise'):
+            return
+        boundary = self._offset + position
+        boundary -= boundary % mmap.PAGESIZE
+        if boundary > self._released:
+            self._mmap.madvise(
+                mmap.MADV_DONTNEED, self._released, boundary - self._released
+            )
+            self._released = boundary
+
+    def read(self, amount=None):
+        self._map_if_needed()
+        # Slices handed out by earlier reads may still be in use, the data
+        # is re-read from the file if they are touched after the release.
+        self._release_pages_before(self._position)
+        if amount is None or amount < 0:
+            end = self._size
+        else:
+            end = min(self._position + amount, self._size)
+        data = self._view[self._position : end]
+        self._position += len(data)
+        return data
+
+    def seek(self, where, whence=0):
+        self._map_if_needed()
+        if whence == 1:
+            where += self._position
+        elif whence == 2:
+            where += self._size
+        self._position = max(where, 0)
+        self._released = min(
+            self._released, self._offset + self._position
+        )
+        self._released -= self._released % mmap.PAGESIZE
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        self._closed = True
+        if self._view is None:
+            return
+        self._view.release()
+        self._view = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Slices from read() are still referenced, the mapping
+                # goes away with the last of them.
+                pass
+            self._mmap = None
+
+    def __enter__(self):
+        self._map_if_needed()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+
 class ReadFileChunk:
     def __init__(
         self,
@@ -615,6 +771,106 @@ class StreamReaderProgress:
         invoke_progress_callbacks(self._callbacks, len(value))
         return value
 
+    def readinto(self, b):
+        amount_read = self._stream.readinto(b)
+        invoke_progress_callbacks(self._callbacks, amount_read)
+        return amount_read
+
+
+class DownloadBuffer(io.RawIOBase):
+    def __init__(self, max_size=None):
+        """A download target that holds the object in a bytearray
+
+        The buffer is allocated once the size of the object is known, and
+        ranged downloads read straight into their slice of it, so no temp
+        file or intermediate chunks are needed. Once the download is done
+        the buffer can be read like a seekable file.
+
+        :type max_size: int
+        :param max_size: The largest object to accept, in bytes. Larger
+            objects fail the download before anything is transferred.
+        """
+        super().__init__()
+        self._max_size = max_size
+        self._buffer = bytearray()
+        self._position = 0
+
+    def allocate(self, size):
+        """Allocate the buffer for an object of the given size
+
+        :type size: int
+        :param size: The size of the object.
+
+        :rtype: memoryview
+        :returns: A writable view of the whole buffer.
+        """
+        if self._max_size is not None and size > self._max_size:
+            raise ValueError(
+                f'Object of {size} bytes exceeds the {self._max_size} byte '
+                f'download buffer'
+            )
+        self._buffer = bytearray(size)
+        self._position = 0
+        return memoryview(self._buffer)
+
+    def getbuffer(self):
+        """A memoryview of the downloaded contents, without copying them"""
+        return memoryview(self._buffer)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        end = len(self._buffer)
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        start = min(self._position, end)
+        self._position = max(end, self._position)
+        return bytes(memoryview(self._buffer)[start:end])
+
+    def readinto(self, b):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        end = self._position + len(b)
+        view = memoryview(self._buffer)[self._position : end]
+        amount_read = len(view)
+        memoryview(b).cast('B')[:amount_read] = view
+        self._position += amount_read
+        return amount_read
+
+    def seek(self, where, whence=0):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        if whence == 0:
+            position = where
+        elif whence == 1:
+            position = self._position + where
+        elif whence == 2:
+            position = len(self._buffer) + where
+        else:
+            raise ValueError(f'invalid whence ({whence}, should be 0, 1 or 2)')
+        if position < 0:
+            raise ValueError(f'negative seek position {position}')
+        self._position = position
+        return position
+
+    def tell(self):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        return self._position
+
+    def close(self):
+        super().close()
+        self._buffer = bytearray()
+
+    def __len__(self):
+        return len(self._buffer)
+
 
 class NoResourcesAvailable(Exception):
     pass
@@ -0,0 +1,37 @@
+"""Precompile botocore service models for the Lambda deployment package.
+
+Writes marshalled snapshots of the merged service models into
+lambda-code/botocore/model-cache so new execution environments skip the
+gzip + JSON parsing in botocore.loaders, plus the parsed JMESPath ASTs of
+their paginator and waiter expressions.
+
+Usage:
+    python scripts/build_model_cache.py [--services s3 dynamodb sns]
+"""
+import argparse
+import os
+import sys
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code')
+DEFAULT_SERVICES = ['s3', 'dynamodb', 'sns']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--services', nargs='+', default=DEFAULT_SERVICES,
+                        help='Services to precompile (default: %(default)s)')
+    parser.add_argument('--package-dir', default=PACKAGE_DIR,
+                        help='Directory containing the vendored botocore')
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.package_dir))
+    from botocore.loaders import Loader, build_model_cache
+
+    written = build_model_cache(args.services)
+    for path in written:
+        print(f"Wrote {os.path.relpath(path, args.package_dir)}")
+    print(f"Precompiled {len(written)} models into {Loader.BUILTIN_MODEL_CACHE_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Build a deployment package with a pruned botocore/data model tree.
+
+Copies lambda-code into an output directory, keeping only the service
+model directories on the allow-list plus the shared top-level data files
+(endpoints.json, partitions.json, _retry.json, ...) that botocore.regions,
+the EndpointProvider and the retry handler load for every client. The
+pruned tree is then verified by creating a client for each allowed service
+and resolving an endpoint with it in a fresh interpreter.
+
+Usage:
+    python scripts/prune_botocore_data.py --output build/package \
+        [--services s3 dynamodb sns] [--precompile] [--zip build/lambda_function.zip]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import zipfile
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code')
+DEFAULT_SERVICES = ['s3', 'dynamodb', 'sns']
+DATA_DIR = os.path.join('botocore', 'data')
+# Left out of the package entirely, they are build inputs or local artifacts
+EXCLUDED_NAMES = {'__pycache__', 'lambda_function.zip'}
+
+VERIFY_SCRIPT = """
+import sys
+import botocore.session
+
+services = sys.argv[1:]
+session = botocore.session.get_session()
+available = session.get_available_services()
+missing = [name for name in services if name not in available]
+if missing:
+    sys.exit(f"Missing service models: {missing}")
+for name in services:
+    client = session.create_client(
+        name, region_name='us-east-1',
+        aws_access_key_id='verify', aws_secret_access_key='verify',
+    )
+    # Resolving an endpoint runs the ruleset against the partitions data,
+    # with an operation that needs no parameters
+    service_model = client.meta.service_model
+    for operation in service_model.operation_names:
+        operation_model = service_model.operation_model(operation)
+        input_shape = operation_model.input_shape
+        if input_shape is None or not input_shape.required_members:
+            break
+    endpoint_url = client._resolve_endpoint_ruleset(operation_model, {}, {})[0]
+    print(f"{name}: {endpoint_url} ({operation} ok)")
+print(f"available: {', '.join(available)}")
+"""
+
+
+def ignore_entries(directory, names):
+    return {name for name in names if name in EXCLUDED_NAMES}
+
+
+def prune_data_tree(data_dir, services):
+    """Remove every service directory that isn't allow-listed, returning bytes freed"""
+    freed = 0
+    for name in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, name)
+        # Top-level files (endpoints.json, partitions.json, ...) are shared
+        if not os.path.isdir(path) or name in services:
+            continue
+        for root, _, files in os.walk(path):
+            freed += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+        shutil.rmtree(path)
+    return freed
+
+
+def verify_package(output_dir, services):
+    """Create every allowed client from the pruned tree and resolve an endpoint, in a clean interpreter"""
+    env = dict(os.environ, PYTHONPATH=output_dir)
+    # Make sure only the pruned tree can satisfy model lookups
+    env.pop('AWS_DATA_PATH', None)
+    result = subprocess.run(
+        [sys.executable, '-c', VERIFY_SCRIPT] + list(services),
+        cwd=output_dir, env=env, capture_output=True, text=True,
+    )
+    print(result.stdout, end='')
+    if result.returncode != 0:
+        print(result.stderr, end='', file=sys.stderr)
+        return False
+    return True
+
+
+def write_zip(output_dir, zip_path):
+    os.makedirs(os.path.dirname(os.path.abspath(zip_path)), exist_ok=True)
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for root, dirs, files in os.walk(output_dir):
+            dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_NAMES)
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                archive.write(path, os.path.relpath(path, output_dir))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--services', nargs='+', default=DEFAULT_SERVICES,
+                        help='Service models to keep (default: %(default)s)')
+    parser.add_argument('--package-dir', default=PACKAGE_DIR,
+                        help='Source package directory (default: lambda-code)')
+    parser.add_argument('--output', required=True,
+                        help='Directory to write the pruned package to')
+    parser.add_argument('--precompile', action='store_true',
+                        help='Also build the precompiled model cache in the package')
+    parser.add_argument('--zip', help='Also write the pruned package to this zip file')
+    args = parser.parse_args()
+
+    output_dir = os.path.abspath(args.output)
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    shutil.copytree(args.package_dir, output_dir, ignore=ignore_entries)
+
+    freed = prune_data_tree(os.path.join(output_dir, DATA_DIR), set(args.services))
+    print(f"Pruned {freed / 1024 / 1024:.1f} MB of unused service models")
+
+    if args.precompile:
+        subprocess.run(
+            [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build_model_cache.py'),
+             '--package-dir', output_dir, '--services'] + args.services,
+            check=True,
+        )
+
+    if not verify_package(output_dir, args.services):
+        sys.exit("Pruned package failed verification")
+
+    if args.zip:
+        write_zip(output_dir, args.zip)
+        print(f"Wrote {args.zip} ({os.path.getsize(args.zip) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
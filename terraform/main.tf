@@ -87,6 +87,18 @@ resource "aws_s3_bucket_policy" "file_upload_bucket_policy" {
   depends_on = [aws_s3_bucket_public_access_block.file_upload_bucket_pab]
 }
 
+# S3 Bucket for generated thumbnails, kept apart from the uploads bucket so
+# writing them doesn't trigger the processor again
+resource "aws_s3_bucket" "thumbnail_bucket" {
+  bucket = "p3-lambda-file-processor-thumbnails"
+
+  tags = {
+    Name        = "P3-Lambda-File-Processor-Thumbnails"
+    Environment = var.environment
+    Project     = "P3-AWS-Lambda-File-Processor"
+  }
+}
+
 # DynamoDB table for processing logs
 resource "aws_dynamodb_table" "file_processing_log" {
   name           = "file-processing-log"
@@ -210,6 +222,13 @@ resource "aws_iam_role_policy" "lambda_policy" {
         ]
         Resource = "${aws_s3_bucket.file_upload_bucket.arn}/*"
       },
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:PutObject"
+        ]
+        Resource = "${aws_s3_bucket.thumbnail_bucket.arn}/*"
+      },
       {
         Effect = "Allow"
         Action = [
@@ -221,6 +240,7 @@ resource "aws_iam_role_policy" "lambda_policy" {
         Effect = "Allow"
         Action = [
           "dynamodb:PutItem",
+          "dynamodb:BatchWriteItem",
           "dynamodb:GetItem",
           "dynamodb:UpdateItem",
           "dynamodb:DeleteItem",
@@ -283,6 +303,7 @@ resource "aws_lambda_function" "file_processor" {
       BUCKET_NAME = aws_s3_bucket.file_upload_bucket.bucket
       DYNAMODB_TABLE = aws_dynamodb_table.file_processing_log.name
       SNS_TOPIC_ARN = aws_sns_topic.file_processing_notifications.arn
+      THUMBNAIL_BUCKET = aws_s3_bucket.thumbnail_bucket.bucket
     }
   }
 
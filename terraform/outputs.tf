@@ -8,6 +8,11 @@ output "s3_bucket_arn" {
   value       = aws_s3_bucket.file_upload_bucket.arn
 }
 
+output "thumbnail_bucket_name" {
+  description = "Name of the S3 bucket for generated thumbnails"
+  value       = aws_s3_bucket.thumbnail_bucket.bucket
+}
+
 output "s3_bucket_url" {
   description = "URL of the S3 bucket"
   value       = "https://${aws_s3_bucket.file_upload_bucket.bucket}.s3.${var.aws_region}.amazonaws.com"
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The deployment package is flat, its modules are imported from lambda-code
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda-code')
+)
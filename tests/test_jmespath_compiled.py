@@ -0,0 +1,88 @@
+"""Compiled JMESPath expressions against the tree interpreter.
+
+The corpus in data/jmespath uses the format of the JMESPath compliance
+tests: each file is a list of suites with a ``given`` document and
+``cases`` that have an ``expression`` and either a ``result`` or an
+``error``.
+"""
+import collections
+import glob
+import json
+import os
+
+import jmespath
+import pytest
+from jmespath import exceptions, functions
+from jmespath.visitor import Options
+
+ERRORS = {
+    'syntax': exceptions.ParseError,
+    'invalid-arity': exceptions.ArityError,
+    'invalid-type': exceptions.JMESPathTypeError,
+    'unknown-function': exceptions.UnknownFunctionError,
+    'invalid-value': ValueError,
+    'mixed-ordering': TypeError,
+}
+
+
+def load_cases():
+    cases = []
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), 'data', 'jmespath', '*.json'))):
+        with open(path) as f:
+            suites = json.load(f)
+        for suite in suites:
+            for case in suite['cases']:
+                cases.append(pytest.param(suite['given'], case, id=f"{os.path.basename(path)}-{case['expression']}"))
+    return cases
+
+
+def outcome(search):
+    try:
+        return search()
+    except Exception as e:
+        return e
+
+
+def same(interpreted, compiled):
+    if isinstance(interpreted, Exception):
+        return type(interpreted) is type(compiled) and str(interpreted) == str(compiled)
+    # repr tells dict from OrderedDict, and 1 from 1.0 and True
+    return repr(interpreted) == repr(compiled)
+
+
+@pytest.mark.parametrize('given, case', load_cases())
+def test_matches_interpreter(given, case):
+    if case.get('error') == 'syntax':
+        with pytest.raises(exceptions.ParseError):
+            jmespath.compile(case['expression'])
+        return
+    parsed = jmespath.compile(case['expression'])
+    # The compiled functions are cached per dict_cls on the parsed
+    # expression, the default comes around again after OrderedDict.
+    for dict_cls in (None, collections.OrderedDict, None):
+        interpreted = outcome(lambda: parsed.search(given, Options(dict_cls=dict_cls)))
+        compiled = outcome(lambda: parsed.search(given, Options(dict_cls=dict_cls, compiled=True)))
+        assert same(interpreted, compiled), (dict_cls, interpreted, compiled)
+        if 'error' in case:
+            assert isinstance(compiled, ERRORS[case['error']]), compiled
+        else:
+            assert compiled == case['result']
+
+
+class CustomFunctions(functions.Functions):
+    @functions.signature({'types': ['number']})
+    def _func_double(self, value):
+        return value * 2
+
+
+def test_custom_functions():
+    parsed = jmespath.compile('numbers[?double(@) > `4`].double(@)')
+    given = {'numbers': [1, 2, 3, 4.5]}
+    custom = CustomFunctions()
+    interpreted = parsed.search(given, Options(custom_functions=custom))
+    compiled = parsed.search(given, Options(custom_functions=custom, compiled=True))
+    assert same(interpreted, compiled)
+    assert compiled == [6, 9.0]
+    # Compiled per set of functions, the default ones have no double()
+    with pytest.raises(exceptions.UnknownFunctionError):
+        parsed.search(given, Options(compiled=True))
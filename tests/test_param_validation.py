@@ -0,0 +1,95 @@
+"""Compiled parameter validation against the generic walk over the model."""
+import datetime
+import decimal
+import io
+import json
+import os
+
+import botocore.session
+import pytest
+from botocore.validate import ParamValidator, ValidationErrors
+
+# Values JSON can't hold are written as {"$<type>": value}
+DECODERS = {
+    '$bytes': lambda value: value.encode('utf-8'),
+    '$bytearray': lambda value: bytearray(value.encode('utf-8')),
+    '$file': lambda value: io.BytesIO(value.encode('utf-8')),
+    '$decimal': decimal.Decimal,
+    '$datetime': datetime.datetime.fromisoformat,
+    '$tuple': tuple,
+    '$object': lambda value: object(),
+}
+
+
+def decode(value):
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if isinstance(value, dict):
+        if len(value) == 1 and next(iter(value)) in DECODERS:
+            tag, tagged = next(iter(value.items()))
+            return DECODERS[tag](decode(tagged))
+        return {key: decode(item) for key, item in value.items()}
+    return value
+
+
+with open(os.path.join(os.path.dirname(__file__), 'data', 'param_validation.json')) as f:
+    CASES = json.load(f)
+
+
+class GenericParamValidator(ParamValidator):
+    def validate(self, params, shape):
+        errors = ValidationErrors()
+        self._validate(params, shape, errors, name='')
+        return errors
+
+
+@pytest.fixture(scope='module')
+def input_shape():
+    # One model per service, signatures are remembered per shape object
+    session = botocore.session.get_session()
+    service_models = {}
+
+    def get_input_shape(case):
+        if case['service'] not in service_models:
+            service_models[case['service']] = session.get_service_model(case['service'])
+        return service_models[case['service']].operation_model(case['operation']).input_shape
+
+    return get_input_shape
+
+
+@pytest.fixture(scope='module')
+def shared_validators():
+    # Shared across the corpus, which is in order: the signature validator
+    # sees the invalid variants of an input after the input itself passed.
+    return [ParamValidator(), ParamValidator(cache_signatures=True)]
+
+
+@pytest.mark.parametrize(
+    'case', CASES, ids=[f"{case['operation']}-{i}" for i, case in enumerate(CASES)]
+)
+def test_matches_generic_validator(case, input_shape, shared_validators):
+    shape = input_shape(case)
+    expected = GenericParamValidator().validate(decode(case['params']), shape).generate_report()
+    validators = [ParamValidator(), ParamValidator(cache_signatures=True)] + shared_validators
+    for validator in validators:
+        # Twice: the second run of a signature validator starts from the
+        # signature the first one cached if it passed.
+        for _ in range(2):
+            report = validator.validate(decode(case['params']), shape).generate_report()
+            assert report == expected, (validator, case['note'])
+
+
+def test_corpus_reuses_signatures(input_shape):
+    # The corpus has to reach the signature path with both valid and
+    # invalid values, or the comparison above proves little.
+    validator = ParamValidator(cache_signatures=True)
+    reports = []
+    for case in CASES:
+        params = decode(case['params'])
+        shape = input_shape(case)
+        known = type(params) is dict and tuple(params) in validator._signatures.get(shape, {})
+        report = validator.validate(params, shape).generate_report()
+        if known:
+            reports.append(report)
+    assert '' in reports
+    assert sum(bool(report) for report in reports) >= 5
@@ -0,0 +1,52 @@
+"""parse_timestamp against the dateutil parsing it short-circuits."""
+import json
+import os
+import time
+
+import pytest
+from botocore.utils import _parse_timestamp_with_tzinfo, get_tzinfo_options, parse_timestamp
+
+with open(os.path.join(os.path.dirname(__file__), 'data', 'timestamps.json')) as f:
+    CORPUS = json.load(f)
+VALUES = [
+    value for group, values in CORPUS.items() if group != 'comment' for value in values
+]
+
+
+def dateutil_timestamp(value):
+    # What parse_timestamp did for every string before the fast path
+    return _parse_timestamp_with_tzinfo(value, get_tzinfo_options()[0])
+
+
+def outcome(parse, value):
+    try:
+        parsed = parse(value)
+    except Exception as e:
+        return type(e), str(e)
+    # datetimes with different tzinfo objects can still compare equal
+    return parsed, type(parsed.tzinfo), parsed.utcoffset(), parsed.tzname()
+
+
+@pytest.fixture(params=['UTC', 'America/New_York', 'Asia/Kolkata'])
+def local_zone(request, monkeypatch):
+    # "Z" depends on the local zone's name, dateutil maps it to tzlocal()
+    # when that zone is called UTC
+    monkeypatch.setenv('TZ', request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize('value', VALUES)
+def test_matches_dateutil(value, local_zone):
+    assert outcome(parse_timestamp, value) == outcome(dateutil_timestamp, value)
+
+
+@pytest.mark.parametrize('value', CORPUS['aws_formats'])
+def test_aws_formats_skip_dateutil(value, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError(f'{value!r} went through dateutil')
+
+    monkeypatch.setattr('botocore.utils.dateutil.parser.parse', fail)
+    assert parse_timestamp(value).tzinfo is not None
@@ -0,0 +1,68 @@
+"""Downloads into a DownloadBuffer, with the S3 client stubbed."""
+import io
+
+import boto3
+import pytest
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import IncompleteReadError
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+from s3transfer.exceptions import RetriesExceededError
+from s3transfer.utils import DownloadBuffer
+
+DATA = bytes(range(100))
+
+
+@pytest.fixture
+def client():
+    return boto3.client(
+        's3', region_name='us-east-1',
+        aws_access_key_id='test', aws_secret_access_key='test',
+    )
+
+
+def get_object_response(body):
+    return {'Body': StreamingBody(io.BytesIO(body), len(body)), 'ContentLength': len(body), 'ETag': '"e"'}
+
+
+def download(client, bodies, config):
+    stubber = Stubber(client)
+    stubber.add_response('head_object', {'ContentLength': len(DATA), 'ETag': '"e"'})
+    for body in bodies:
+        stubber.add_response('get_object', get_object_response(body))
+    buffer = DownloadBuffer()
+    with stubber:
+        client.download_fileobj('bucket', 'key', buffer, Config=config)
+    stubber.assert_no_pending_responses()
+    return bytes(buffer.getbuffer())
+
+
+def test_whole_object(client):
+    assert download(client, [DATA], TransferConfig(use_threads=False)) == DATA
+
+
+def test_ranged_parts(client):
+    parts = [DATA[start:start + 32] for start in range(0, len(DATA), 32)]
+    config = TransferConfig(multipart_threshold=32, multipart_chunksize=32, use_threads=False)
+    assert download(client, parts, config) == DATA
+
+
+def test_short_body_is_retried(client):
+    # The object was overwritten with a smaller one after the HEAD
+    bodies = [DATA[:60], DATA]
+    assert download(client, bodies, TransferConfig(use_threads=False)) == DATA
+
+
+def test_short_body_fails_instead_of_zero_padding(client):
+    config = TransferConfig(use_threads=False, num_download_attempts=1)
+    with pytest.raises(RetriesExceededError) as error:
+        download(client, [DATA[:60]], config)
+    assert isinstance(error.value.last_exception, IncompleteReadError)
+
+
+def test_short_ranged_part_fails(client):
+    config = TransferConfig(
+        multipart_threshold=32, multipart_chunksize=32, use_threads=False, num_download_attempts=1,
+    )
+    with pytest.raises(RetriesExceededError):
+        download(client, [DATA[:32], DATA[32:50]], config)